@@ -0,0 +1,41 @@
+import sys
+import json
+import argparse
+from .runner import run_benchmarks, compare, format_report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Measures latency and WebDriver commands of croco-selenium against a fake WebDriver server'
+    )
+    parser.add_argument('--latency', type=float, default=0.002, help='seconds every command is delayed by')
+    parser.add_argument('--iterations', type=int, default=20, help='number of measured runs of a case')
+    parser.add_argument('--filter', default='', help='run only cases containing the string')
+    parser.add_argument('--output', help='save the report to a JSON file')
+    parser.add_argument('--baseline', help='compare with a report saved by --output')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative growth of median latency')
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.latency, args.iterations, args.filter)
+    baseline = None
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    print(format_report(report, baseline))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if baseline and (regressions := compare(baseline, report, args.tolerance)):
+        print('\nRegressions:', *regressions, sep='\n')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
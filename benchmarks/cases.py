@@ -0,0 +1,158 @@
+"""
+Benchmark cases. Every action is measured on three targets: module-level actions, ActionPerformer and ActionPerformer
+with the element cache
+"""
+import os
+import tempfile
+from functools import partial
+from dataclasses import dataclass
+from typing import Callable, Optional, Any
+from croco_selenium import actions, handle_pop_up, handle_in_new_tab, handle_new_tab
+from .fake_webdriver import FakeElement, FakeDriver
+
+TIMEOUT = 5
+WINDOW_DELAY = 0.02
+WAIT_DELAY = 0.02
+
+COOKIE = {'name': 'session', 'value': 'value', 'domain': 'example.com', 'path': '/'}
+COOKIES_PATH = os.path.join(tempfile.gettempdir(), 'croco_selenium_benchmark_cookies.json')
+
+ELEMENTS = [
+    FakeElement('//input[@id="email"]', attributes={'value': '', 'name': 'email'}),
+    *[FakeElement(f'//input[@id="field-{i}"]', attributes={'value': ''}) for i in range(5)],
+    FakeElement('//button[@id="submit"]', text='Submit'),
+    FakeElement('//iframe[@id="frame"]'),
+    FakeElement('//a[@id="pop-up"]', opens_window_after=WINDOW_DELAY),
+    FakeElement('//div[@id="spinner"]', disappear_after=WAIT_DELAY),
+    FakeElement('//div[@id="late"]', text='Late', appear_after=WAIT_DELAY),
+    *[FakeElement('//li', text=f'Item {i}', attributes={'href': f'/items/{i}'}) for i in range(10)]
+]
+
+
+@dataclass
+class Case:
+    """
+    A benchmark case. Setup is performed before every iteration and isn't measured
+    """
+    name: str
+    run: Callable[[Any], Any]
+    setup: Optional[Callable[[FakeDriver], Any]] = None
+
+
+class ModuleTarget:
+    """The target calling module-level actions with the driver as first argument"""
+    def __init__(self, driver: FakeDriver):
+        self.__driver = driver
+
+    def __getattr__(self, name: str) -> Callable:
+        return partial(getattr(actions, name), self.__driver)
+
+
+def _reload(driver: FakeDriver) -> None:
+    driver.get('https://example.com/')
+
+
+def _open_tabs(driver: FakeDriver) -> None:
+    handle = driver.current_window_handle
+    driver.switch_to.new_window('tab')
+    driver.switch_to.window(handle)
+
+
+def _open_pop_up(driver: FakeDriver) -> None:
+    driver.find_element('xpath', '//a[@id="pop-up"]').click()
+
+
+def _enter_frame(driver: FakeDriver) -> None:
+    driver.switch_to.frame(driver.find_element('xpath', '//iframe[@id="frame"]'))
+
+
+def _export_cookies(driver: FakeDriver) -> None:
+    actions.add_cookies(driver, COOKIE, bulk=True)
+    actions.export_cookies(driver, COOKIES_PATH)
+
+
+ACTION_CASES = [
+    Case('add_cookies', lambda target: target.add_cookies([COOKIE] * 5)),
+    Case('add_cookies[bulk]', lambda target: target.add_cookies([COOKIE] * 5, bulk=True)),
+    Case('export_cookies', lambda target: target.export_cookies(COOKIES_PATH)),
+    Case('import_cookies', lambda target: target.import_cookies(COOKIES_PATH), _export_cookies),
+    Case('snapshot_state', lambda target: target.snapshot_state()),
+    Case('restore_state', lambda target: target.restore_state({'cookies': [COOKIE], 'origins': {}})),
+    Case(
+        'load_page',
+        lambda target: target.load_page(
+            TIMEOUT,
+            'https://example.com/',
+            {'dom_content_loaded': True, 'xpath': '//button[@id="submit"]'}
+        )
+    ),
+    Case('switch_to_another_window', lambda target: target.switch_to_another_window(TIMEOUT), _open_tabs),
+    Case('switch_to_frame', lambda target: target.switch_to_frame(TIMEOUT, '//iframe[@id="frame"]')),
+    Case('switch_to_parent_frame', lambda target: target.switch_to_parent_frame(), _enter_frame),
+    Case('send_keys', lambda target: target.send_keys(TIMEOUT, '//input[@id="email"]', 'hello@world.com')),
+    Case(
+        'silent_send_keys',
+        lambda target: target.silent_send_keys(TIMEOUT, '//input[@id="email"]', 'hello', min_delay=0, max_delay=0)
+    ),
+    Case(
+        'silent_send_keys[batched]',
+        lambda target: target.silent_send_keys(
+            TIMEOUT,
+            '//input[@id="email"]',
+            'hello',
+            min_delay=0,
+            max_delay=0,
+            batched=True
+        )
+    ),
+    Case(
+        'fill_form',
+        lambda target: target.fill_form(TIMEOUT, {f'//input[@id="field-{i}"]': f'value {i}' for i in range(5)})
+    ),
+    Case('click', lambda target: target.click(TIMEOUT, '//button[@id="submit"]')),
+    Case('get_element', lambda target: target.get_element(TIMEOUT, '//button[@id="submit"]')),
+    Case('get_element[wait]', lambda target: target.get_element(TIMEOUT, '//div[@id="late"]'), _reload),
+    Case('get_element_text', lambda target: target.get_element_text(TIMEOUT, '//button[@id="submit"]')),
+    Case(
+        'get_element_attribute',
+        lambda target: target.get_element_attribute(TIMEOUT, '//input[@id="email"]', 'name')
+    ),
+    Case('get_elements', lambda target: target.get_elements(TIMEOUT, '//li')),
+    Case('get_elements_text', lambda target: target.get_elements_text(TIMEOUT, '//li')),
+    Case('get_elements_attributes', lambda target: target.get_elements_attributes(TIMEOUT, '//li', ['href'])),
+    Case(
+        'wait_for_invisibility',
+        lambda target: target.wait_for_invisibility(TIMEOUT, '//div[@id="spinner"]'),
+        _reload
+    ),
+    Case('wait_for_windows', lambda target: target.wait_for_windows(TIMEOUT, 2), _open_pop_up),
+    Case('close_tabs', lambda target: target.close_tabs(), _open_tabs),
+]
+
+
+@handle_pop_up(method_type='function')
+def _close_pop_up(driver: FakeDriver, handles: list[str]) -> None:
+    driver.close()
+
+
+@handle_in_new_tab(method_type='function')
+def _read_in_new_tab(driver: FakeDriver) -> None:
+    driver.get_element_text(TIMEOUT, '//button[@id="submit"]')
+
+
+@handle_new_tab(method_type='function')
+def _open_new_tab(driver: FakeDriver) -> None:
+    driver.switch_to.new_window('tab')
+
+
+def _handle_pop_up(driver: FakeDriver) -> None:
+    handles = driver.window_handles
+    _open_pop_up(driver)
+    _close_pop_up(driver, handles=handles)
+
+
+DECORATOR_CASES = [
+    Case('handle_pop_up', _handle_pop_up),
+    Case('handle_in_new_tab', _read_in_new_tab),
+    Case('handle_new_tab', _open_new_tab),
+]
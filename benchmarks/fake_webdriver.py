@@ -0,0 +1,427 @@
+"""
+In-process stand-in for a W3C WebDriver server. It answers commands sent by Selenium with configurable latency, keeping
+a flat model of a page instead of a browser, so that round trips and wait overhead of croco-selenium can be measured
+without a real browser
+"""
+import re
+import socket
+import json
+import time
+import uuid
+import threading
+from dataclasses import dataclass, field
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Iterable, Callable, Any
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from croco_selenium import ActionPerformer
+from croco_selenium._scripts import (
+    EXTRACT_ELEMENTS,
+    OBSERVE_XPATH,
+    SETTLE_DOCUMENT,
+    SNAPSHOT_STORAGE,
+    AWAIT_READINESS,
+    MARK_UNLOADING,
+    IS_NAVIGATED,
+    FILL_FORM,
+    EXTRACT_FIELDS
+)
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+OBSERVE_STEP = 0.005
+
+
+@dataclass
+class FakeElement:
+    """
+    An element of the fake page. Elements are matched by XPATH literally, there is no XPATH engine
+    """
+    xpath: str
+    text: str = ''
+    attributes: dict[str, str] = field(default_factory=dict)
+    visible: bool = True
+    enabled: bool = True
+    appear_after: float = 0.0
+    disappear_after: Optional[float] = None
+    opens_window_after: Optional[float] = None
+
+
+class _Error(Exception):
+    def __init__(self, status: int, error: str, message: str = ''):
+        super().__init__(message)
+        self.status = status
+        self.error = error
+
+
+class FakeWebDriverServer:
+    """
+    The HTTP server speaking W3C WebDriver protocol. Every command is delayed by latency and logged, so the number of
+    round trips made by an action is known
+    """
+    def __init__(self, elements: Iterable[FakeElement] = (), latency: float = 0.0):
+        """
+        :param elements: Elements of the page. They appear and disappear relative to the last navigation
+        :param latency: Number of seconds every command is delayed by
+        """
+        self.latency = latency
+        self.elements = list(elements)
+        # Number of following observing scripts failing as if the document was unloaded by navigation
+        self.unloads = 0
+        self.commands: list[tuple[str, str]] = []
+        self.__lock = threading.RLock()
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), self.__handler())
+        self.__server.daemon_threads = True
+        self.__thread: Optional[threading.Thread] = None
+        self.__routes = self.__build_routes()
+        self.reset()
+
+    @property
+    def url(self) -> str:
+        """An URL of the server"""
+        host, port = self.__server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def reset(self) -> None:
+        """
+        Restores the initial state of the browser: a single window, no cookies, the page just loaded
+        :return: None
+        """
+        with self.__lock:
+            self.__loaded_at = time.monotonic()
+            self.__windows = ['window-0']
+            self.__pending_windows: list[tuple[float, str]] = []
+            self.__current_window = 'window-0'
+            self.__frame_depth = 0
+            self.__cookies: list[dict[str, Any]] = []
+            self.__unloading = False
+
+    def start(self) -> 'FakeWebDriverServer':
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def __enter__(self) -> 'FakeWebDriverServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def __handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                # Headers and body are written separately, so Nagle's algorithm would delay every response
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                self.__respond()
+
+            def do_POST(self):
+                self.__respond()
+
+            def do_DELETE(self):
+                self.__respond()
+
+            def __respond(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'{}') if length else {}
+                status, value = server._dispatch(self.command, self.path, body)
+
+                payload = json.dumps({'value': value}).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __build_routes(self) -> list[tuple[str, str, re.Pattern, Callable]]:
+        routes = [
+            ('POST', '/session', self.__new_session),
+            ('DELETE', '/session/{sid}', lambda body: None),
+            ('POST', '/session/{sid}/timeouts', lambda body: None),
+            ('POST', '/session/{sid}/url', self.__navigate),
+            ('GET', '/session/{sid}/url', lambda body: 'https://example.com/'),
+            ('GET', '/session/{sid}/title', lambda body: 'Example'),
+            ('GET', '/session/{sid}/window', lambda body: self.__current_window),
+            ('POST', '/session/{sid}/window', self.__switch_to_window),
+            ('DELETE', '/session/{sid}/window', self.__close_window),
+            ('GET', '/session/{sid}/window/handles', lambda body: self.__get_windows()),
+            ('POST', '/session/{sid}/window/new', self.__new_window),
+            ('POST', '/session/{sid}/frame', self.__switch_to_frame),
+            ('POST', '/session/{sid}/frame/parent', self.__switch_to_parent_frame),
+            ('POST', '/session/{sid}/element', lambda body: self.__find(body['value'])[0]),
+            ('POST', '/session/{sid}/elements', lambda body: self.__find(body['value'], multiple=True)),
+            ('POST', '/session/{sid}/element/{id}/click', self.__click),
+            ('POST', '/session/{sid}/element/{id}/clear', lambda body, id: self.__element(id) and None),
+            ('POST', '/session/{sid}/element/{id}/value', lambda body, id: self.__element(id) and None),
+            ('GET', '/session/{sid}/element/{id}/text', lambda body, id: self.__element(id).text),
+            ('GET', '/session/{sid}/element/{id}/enabled', lambda body, id: self.__element(id).enabled),
+            ('GET', '/session/{sid}/element/{id}/displayed', lambda body, id: self.__element(id).visible),
+            ('GET', '/session/{sid}/element/{id}/attribute/{name}', self.__get_attribute),
+            ('GET', '/session/{sid}/element/{id}/property/{name}', self.__get_attribute),
+            ('POST', '/session/{sid}/execute/sync', self.__execute_script),
+            ('POST', '/session/{sid}/execute/async', self.__execute_async_script),
+            ('GET', '/session/{sid}/cookie', lambda body: self.__cookies),
+            ('POST', '/session/{sid}/cookie', lambda body: self.__cookies.append(body['cookie'])),
+            ('DELETE', '/session/{sid}/cookie', lambda body: self.__cookies.clear()),
+            ('POST', '/session/{sid}/actions', lambda body: None),
+            ('DELETE', '/session/{sid}/actions', lambda body: None),
+            ('POST', '/session/{sid}/goog/cdp/execute', self.__execute_cdp_command),
+        ]
+
+        return [
+            (method, path, re.compile('^' + re.sub(r'{(\w+)}', r'(?P<\1>[^/]+)', path) + '$'), handler)
+            for method, path, handler in routes
+        ]
+
+    def _dispatch(self, method: str, path: str, body: dict) -> tuple[int, Any]:
+        time.sleep(self.latency)
+
+        for route_method, route_path, pattern, handler in self.__routes:
+            if route_method == method and (match := pattern.match(path)):
+                self.commands.append((method, route_path))
+                arguments = {key: value for key, value in match.groupdict().items() if key != 'sid'}
+
+                try:
+                    with self.__lock:
+                        return 200, handler(body, **arguments)
+                except _Error as exc:
+                    return exc.status, {'error': exc.error, 'message': str(exc), 'stacktrace': ''}
+
+        self.commands.append((method, path))
+        return 404, {'error': 'unknown command', 'message': f'{method} {path}', 'stacktrace': ''}
+
+    def __new_session(self, body: dict) -> dict:
+        requested = body.get('capabilities', {}).get('alwaysMatch', {})
+        capabilities = {'browserName': 'chrome', 'pageLoadStrategy': requested.get('pageLoadStrategy', 'normal')}
+        return {'sessionId': uuid.uuid4().hex, 'capabilities': capabilities}
+
+    def __navigate(self, body: dict) -> None:
+        self.__loaded_at = time.monotonic()
+        self.__frame_depth = 0
+        self.__unloading = False
+
+    def __get_windows(self) -> list[str]:
+        now = time.monotonic()
+        for opened_at, handle in list(self.__pending_windows):
+            if opened_at <= now:
+                self.__pending_windows.remove((opened_at, handle))
+                self.__windows.append(handle)
+        return list(self.__windows)
+
+    def __open_window(self, delay: float = 0.0) -> str:
+        handle = f'window-{uuid.uuid4().hex[:8]}'
+        self.__pending_windows.append((time.monotonic() + delay, handle))
+        return handle
+
+    def __switch_to_window(self, body: dict) -> None:
+        if body['handle'] not in self.__get_windows():
+            raise _Error(404, 'no such window', body['handle'])
+        self.__current_window = body['handle']
+        self.__frame_depth = 0
+
+    def __close_window(self, body: dict) -> list[str]:
+        self.__windows.remove(self.__current_window)
+        return self.__get_windows()
+
+    def __new_window(self, body: dict) -> dict:
+        handle = self.__open_window()
+        self.__get_windows()
+        return {'handle': handle, 'type': body.get('type', 'tab')}
+
+    def __switch_to_frame(self, body: dict) -> None:
+        if isinstance(body.get('id'), dict):
+            self.__element(body['id'][ELEMENT_KEY])
+        self.__frame_depth += 1
+
+    def __switch_to_parent_frame(self, body: dict) -> None:
+        self.__frame_depth = max(self.__frame_depth - 1, 0)
+
+    def __is_present(self, element: FakeElement) -> bool:
+        elapsed = time.monotonic() - self.__loaded_at
+        if elapsed < element.appear_after:
+            return False
+        return element.disappear_after is None or elapsed < element.disappear_after
+
+    def __find(self, xpath: str, multiple: bool = False) -> list[dict[str, str]]:
+        found = [
+            {ELEMENT_KEY: str(index)}
+            for index, element in enumerate(self.elements)
+            if element.xpath == xpath and self.__is_present(element)
+        ]
+        if not found and not multiple:
+            raise _Error(404, 'no such element', f'Unable to locate element: {xpath}')
+        return found
+
+    def __element(self, id: str) -> FakeElement:
+        element = self.elements[int(id)]
+        if not self.__is_present(element):
+            raise _Error(404, 'stale element reference', f'Element {id} is stale')
+        return element
+
+    def __click(self, body: dict, id: str) -> None:
+        element = self.__element(id)
+        if element.opens_window_after is not None:
+            self.__open_window(element.opens_window_after)
+
+    def __get_attribute(self, body: dict, id: str, name: str) -> Optional[str]:
+        return self.__element(id).attributes.get(name)
+
+    def __state(self, xpath: str, state: str) -> Any:
+        found = self.__find(xpath, multiple=True)
+        elements = [self.elements[int(reference[ELEMENT_KEY])] for reference in found]
+
+        if state == 'invisible':
+            return True if not any(element.visible for element in elements) else None
+        if state.startswith('all'):
+            if state == 'all_visible' and not all(element.visible for element in elements):
+                return None
+            return found or None
+        if not found:
+            return None
+        if state in ('visible', 'clickable') and not elements[0].visible:
+            return None
+        if state == 'clickable' and not elements[0].enabled:
+            return None
+        return found[0]
+
+    def __execute_script(self, body: dict) -> Any:
+        script, args = body['script'], body['args']
+
+        if script == EXTRACT_ELEMENTS:
+            xpath, attributes, visible = args
+            elements = [self.elements[int(reference[ELEMENT_KEY])] for reference in self.__find(xpath, True)]
+            if visible and not all(element.visible for element in elements):
+                return []
+            if attributes is None:
+                return [element.text for element in elements]
+            return [{name: element.attributes.get(name) for name in attributes} for element in elements]
+        if script == SNAPSHOT_STORAGE:
+            return ['https://example.com', {}, {}]
+        if script == MARK_UNLOADING:
+            self.__unloading = True
+            return None
+        if script == IS_NAVIGATED:
+            return not self.__unloading
+        if script == FILL_FORM:
+            return self.__fill_form(*args)
+        if script == EXTRACT_FIELDS:
+            return self.__extract_fields(*args)
+        if script.startswith('/* isDisplayed */'):
+            return self.__element(args[0][ELEMENT_KEY]).visible
+        if script.startswith('/* getAttribute */'):
+            return self.__element(args[0][ELEMENT_KEY]).attributes.get(args[1])
+        return None
+
+    def __fill_form(self, fields: list[list[str]], cleared: bool, keystrokes: list[int]) -> Optional[dict]:
+        references = []
+        for xpath, _ in fields:
+            if (reference := self.__state(xpath, 'present')) is None:
+                return None
+            # Hidden and file inputs only have to be present
+            element = self.elements[int(reference[ELEMENT_KEY])]
+            if element.attributes.get('type') not in ('hidden', 'file') and self.__state(xpath, 'clickable') is None:
+                return None
+            references.append(reference)
+
+        typed = []
+        for index, ((_, value), reference) in enumerate(zip(fields, references)):
+            element = self.elements[int(reference[ELEMENT_KEY])]
+            if element.attributes.get('type') == 'file':
+                typed.append([index, reference, False])
+            elif index in keystrokes or element.attributes.get('type') in ('checkbox', 'radio'):
+                typed.append([index, reference, cleared])
+            else:
+                element.attributes['value'] = value if cleared else element.attributes.get('value', '') + value
+        return {'typed': typed}
+
+    def __extract_fields(self, fields: list[list[Any]]) -> Optional[list[Any]]:
+        values = []
+        for xpath, attribute, multiple in fields:
+            elements = [self.elements[int(reference[ELEMENT_KEY])] for reference in self.__find(xpath, True)]
+            if not elements:
+                return None
+
+            row = [element.text if attribute is None else element.attributes.get(attribute) for element in elements]
+            values.append(row if multiple else row[0])
+        return values
+
+    def __execute_async_script(self, body: dict) -> Any:
+        script, args = body['script'], body['args']
+
+        if script in (SETTLE_DOCUMENT, AWAIT_READINESS):
+            return True
+        if script != OBSERVE_XPATH:
+            return None
+
+        xpath, state, timeout = args
+        if self.unloads:
+            self.unloads -= 1
+            raise _Error(500, 'javascript error', 'javascript error: document unloaded while waiting for result')
+        # There is no XPATH engine, so only unbalanced brackets make XPATH invalid
+        if xpath.count('[') != xpath.count(']') or xpath.count('(') != xpath.count(')'):
+            return {'invalidSelector': f"Failed to execute 'evaluate' on 'Document': '{xpath}' is not valid"}
+
+        # The lock is released while observing, so that other clients are not blocked
+        end_time = time.monotonic() + timeout / 1000
+        self.__lock.release()
+        try:
+            while True:
+                with self.__lock:
+                    if (value := self.__state(xpath, state)) is not None:
+                        return value
+                if time.monotonic() >= end_time:
+                    return None
+                time.sleep(OBSERVE_STEP)
+        finally:
+            self.__lock.acquire()
+
+    def __execute_cdp_command(self, body: dict) -> dict:
+        command, params = body['cmd'], body.get('params', {})
+
+        if command == 'Network.getAllCookies':
+            return {'cookies': list(self.__cookies)}
+        if command == 'Network.setCookies':
+            self.__cookies.extend(params['cookies'])
+        elif command == 'Network.clearBrowserCookies':
+            self.__cookies.clear()
+        return {}
+
+
+class FakeDriver(RemoteWebDriver, ActionPerformer):
+    """The driver connected to FakeWebDriverServer. It performs actions like ChromeDriver"""
+    def __init__(self, server: FakeWebDriverServer, element_cache_size: int = 0, page_load_strategy: str = 'normal'):
+        """
+        :param server: A server to be connected
+        :param element_cache_size: Maximum number of found elements to be reused by further actions
+        :param page_load_strategy: A page load strategy of the session
+        """
+        options = ChromeOptions()
+        options.page_load_strategy = page_load_strategy
+
+        executor = ChromiumRemoteConnection(server.url, 'goog', 'chrome', ignore_proxy=True)
+        RemoteWebDriver.__init__(self, command_executor=executor, options=options)
+        ActionPerformer.__init__(self, self, element_cache_size)
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> dict:
+        response = super().execute(driver_command, params)
+        # A failed command doesn't change the window or the frame
+        self._observe_command(driver_command, params)
+        return response
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        return self.execute('executeCdpCommand', {'cmd': cmd, 'params': cmd_args})['value']
@@ -0,0 +1,41 @@
+import os
+import sys
+import statistics
+import subprocess
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_time(module: str) -> float:
+    # Interpreter startup is excluded, -X importtime reports cumulative microseconds of every imported module
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PACKAGE_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    for line in reversed(completed.stderr.splitlines()):
+        _, cumulative, name = line.split('|')
+        if name.strip() == module:
+            return int(cumulative) / 1_000_000
+
+    raise RuntimeError(f'Import of {module} is not reported')
+
+
+def measure_import_time(module: str = 'croco_selenium', runs: int = 10) -> dict:
+    """
+    Measures time of importing a module in fresh interpreters
+    :param module: A name of the module
+    :param runs: Number of interpreters started
+    :return: dict
+    """
+    durations = [_import_time(module) for _ in range(runs)]
+
+    return {
+        'median': statistics.median(durations),
+        'p95': statistics.quantiles(durations, n=20)[-1] if len(durations) > 1 else durations[0],
+        'min': min(durations),
+        'commands': 0
+    }
@@ -0,0 +1,139 @@
+import time
+import platform
+import statistics
+from typing import Any
+import selenium
+from croco_selenium import ActionPerformer
+from .fake_webdriver import FakeWebDriverServer, FakeDriver
+from .cases import Case, ModuleTarget, ACTION_CASES, DECORATOR_CASES, ELEMENTS
+from .import_time import measure_import_time
+
+Report = dict[str, Any]
+
+# Differences of latency below this number of seconds are considered as noise
+MIN_LATENCY_DELTA = 0.001
+
+
+def _measure(server: FakeWebDriverServer, driver: FakeDriver, case: Case, target: Any, iterations: int) -> dict:
+    durations = []
+    commands = []
+
+    # The first run is a warm-up, so that connections are open and caches are filled
+    for iteration in range(iterations + 1):
+        server.reset()
+        if case.setup:
+            case.setup(driver)
+
+        sent = len(server.commands)
+        start = time.perf_counter()
+        case.run(target)
+        duration = time.perf_counter() - start
+
+        if iteration:
+            durations.append(duration)
+            commands.append(len(server.commands) - sent)
+
+    return {
+        'median': statistics.median(durations),
+        'p95': statistics.quantiles(durations, n=20)[-1] if len(durations) > 1 else durations[0],
+        'min': min(durations),
+        'commands': statistics.median_low(commands)
+    }
+
+
+def run_benchmarks(latency: float = 0.002, iterations: int = 20, pattern: str = '') -> Report:
+    """
+    Measures import of the package and runs benchmark cases against the fake WebDriver server
+    :param latency: Number of seconds every command is delayed by
+    :param iterations: Number of measured runs of a case
+    :param pattern: Only cases containing the pattern in their names are run
+    :return: Report
+    """
+    results = {}
+
+    if pattern in 'import.croco_selenium':
+        results['import.croco_selenium'] = measure_import_time(runs=iterations)
+
+    with FakeWebDriverServer(ELEMENTS, latency) as server:
+        driver = FakeDriver(server)
+
+        try:
+            targets = {
+                'actions': ModuleTarget(driver),
+                'ActionPerformer': driver,
+                'ActionPerformer[cache]': ActionPerformer(driver, element_cache_size=128)
+            }
+            cases = [
+                (f'{target_name}.{case.name}', case, target)
+                for target_name, target in targets.items()
+                for case in ACTION_CASES
+            ]
+            cases += [(f'decorators.{case.name}', case, driver) for case in DECORATOR_CASES]
+
+            for name, case, target in cases:
+                if pattern in name:
+                    results[name] = _measure(server, driver, case, target, iterations)
+        finally:
+            driver.quit()
+
+    return {
+        'latency': latency,
+        'iterations': iterations,
+        'python': platform.python_version(),
+        'selenium': selenium.__version__,
+        'results': results
+    }
+
+
+def compare(baseline: Report, report: Report, tolerance: float = 0.2) -> list[str]:
+    """
+    Finds regressions of a report against a baseline. A case regresses, if it sends more commands or its median latency
+    grows by more than tolerance
+    :param baseline: A report to be compared with
+    :param report: A new report
+    :param tolerance: Allowed relative growth of median latency
+    :return: list[str]
+    """
+    regressions = []
+
+    for name, result in report['results'].items():
+        if (base := baseline['results'].get(name)) is None:
+            continue
+
+        if result['commands'] > base['commands']:
+            regressions.append(f'{name}: {base["commands"]} -> {result["commands"]} commands')
+
+        delta = result['median'] - base['median']
+        if delta > MIN_LATENCY_DELTA and delta > base['median'] * tolerance:
+            regressions.append(f'{name}: {base["median"] * 1000:.1f} -> {result["median"] * 1000:.1f} ms')
+
+    return regressions
+
+
+def format_report(report: Report, baseline: Report = None) -> str:
+    """
+    Formats a report as a table. If a baseline is given, changes are shown
+    :param report: A report to be formatted
+    :param baseline: A report to be compared with
+    :return: str
+    """
+    width = max([len(name) for name in report['results']] + [4])
+    lines = [
+        f'latency {report["latency"] * 1000:.1f} ms, {report["iterations"]} iterations, '
+        f'Python {report["python"]}, Selenium {report["selenium"]}',
+        f'{"case":<{width}}  {"median ms":>10}  {"p95 ms":>10}  {"commands":>8}'
+    ]
+
+    for name, result in report['results'].items():
+        line = (
+            f'{name:<{width}}  {result["median"] * 1000:>10.2f}  {result["p95"] * 1000:>10.2f}  '
+            f'{result["commands"]:>8}'
+        )
+
+        if baseline and (base := baseline['results'].get(name)):
+            change = (result['median'] / base['median'] - 1) * 100 if base['median'] else 0
+            line += f'  {change:+6.1f}%  {result["commands"] - base["commands"]:+d} commands'
+
+        lines.append(line)
+
+    return '\n'.join(lines)
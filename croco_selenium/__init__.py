@@ -27,12 +27,100 @@ Usage example of ChromeDriver:
    >>> driver = ChromeDriver(proxy=proxy, extensions_paths=extensions_paths)
    >>> driver.get('https://github.com/blnkoff/croco-webdriver')
 
+Usage example of DriverPool:
+   >>> from croco_selenium import DriverPool
+   >>> with DriverPool(4) as pool:
+   ...     with pool.lease() as driver:
+   ...         driver.get('https://github.com/blnkoff/croco-webdriver')
+
 :copyright: (c) 2023 by Alexey
 :license: MIT, see LICENSE for more details.
 """
 
-from .actions import *
-from .action_performer import ActionPerformer
-from .decorators import *
-from .chrome_driver import ChromeDriver
-from .types import Proxy
+import importlib
+from typing import Any, TYPE_CHECKING
+from .types import Proxy, SettlePolicy, ActionEvent, BlockingProfile, FlowStep
+
+# Submodules pull in Selenium's remote stack, so they are imported on first access to their names
+_LAZY_MODULES = {
+    'actions': [
+        'add_cookies',
+        'export_cookies',
+        'import_cookies',
+        'snapshot_state',
+        'restore_state',
+        'load_page',
+        'switch_to_another_window',
+        'switch_to_parent_frame',
+        'switch_to_frame',
+        'send_keys',
+        'silent_send_keys',
+        'fill_form',
+        'click',
+        'get_elements',
+        'get_elements_text',
+        'get_elements_attributes',
+        'get_element',
+        'get_element_text',
+        'get_element_attribute',
+        'wait_for_invisibility',
+        'wait_for_windows',
+        'close_tabs'
+    ],
+    'action_performer': ['ActionPerformer'],
+    'decorators': ['handle_pop_up', 'handle_new_tab', 'handle_in_new_tab'],
+    'chrome_driver': ['ChromeDriver'],
+    'driver_pool': ['DriverPool'],
+    'element_cache': ['ElementCache'],
+    'profile_template': ['ProfileTemplate'],
+    'shared_service': ['SharedService', 'ServicePool'],
+    'connection_pool': ['ConnectionPool'],
+    'instrumentation': ['add_hook', 'remove_hook', 'MetricsAggregator'],
+    'window_tracker': ['WindowTracker', 'track_windows', 'get_window_tracker'],
+    'tab_pool': ['TabDriver', 'TabPool'],
+    'resource_blocker': ['ResourceBlocker', 'block_resources', 'BLOCK_MEDIA', 'BLOCK_TRACKERS'],
+    'deadline': ['Deadline', 'current_deadline'],
+    'policy': ['ActionPolicy', 'ActionResult', 'RetryPolicy', 'CircuitBreaker', 'TRANSIENT_EXCEPTIONS'],
+    'flow': ['FlowPlan', 'FlowExecutor', 'FlowReport']
+}
+_LAZY_NAMES = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+__all__ = ['Proxy', 'SettlePolicy', 'ActionEvent', 'BlockingProfile', 'FlowStep', *_LAZY_NAMES]
+
+if TYPE_CHECKING:
+    from .actions import *
+    from .action_performer import ActionPerformer
+    from .decorators import *
+    from .chrome_driver import ChromeDriver
+    from .driver_pool import DriverPool
+    from .element_cache import ElementCache
+    from .profile_template import ProfileTemplate
+    from .shared_service import SharedService, ServicePool
+    from .connection_pool import ConnectionPool
+    from .instrumentation import *
+    from .window_tracker import *
+    from .tab_pool import TabDriver, TabPool
+    from .resource_blocker import *
+    from .deadline import *
+    from .policy import *
+    from .flow import *
+
+
+# Submodules were attributes of the package, while it imported them eagerly
+_SUBMODULES = {*_LAZY_MODULES, 'exceptions', 'utils', 'waits'}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # Importing a submodule sets it as an attribute of the package
+        return importlib.import_module(f'.{name}', __name__)
+    if (module := _LAZY_NAMES.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,19 @@
-from typing import Optional, Iterable
+from copy import deepcopy
+import shutil
+from typing import Optional, Iterable, TYPE_CHECKING
 from selenium.webdriver.chromium.options import ChromiumOptions
 from selenium.webdriver.chromium.service import ChromiumService
 from selenium.webdriver.chromium.webdriver import ChromiumDriver
-from .types import Proxy
+from .types import Proxy, SettlePolicy, BlockingProfile, PageLoadStrategy
 from .action_performer import ActionPerformer
+from ._proxy_extension import get_proxy_extension
+from .instrumentation import count_command
+from ._window_trackers import get_window_tracker
+
+if TYPE_CHECKING:
+    from .profile_template import ProfileTemplate
+    from .connection_pool import ConnectionPool
+    from .resource_blocker import ResourceBlocker
 
 
 class CrocoDriver(ChromiumDriver, ActionPerformer):
@@ -14,8 +24,20 @@ class CrocoDriver(ChromiumDriver, ActionPerformer):
             options: ChromiumOptions = ChromiumOptions(),
             proxy: Optional[Proxy] = None,
             extension_paths: Optional[Iterable[str]] = None,
-            executable_path: Optional[str] = None
+            executable_path: Optional[str] = None,
+            element_cache_size: int = 0,
+            settle: Optional[SettlePolicy] = None,
+            profile_template: Optional['ProfileTemplate'] = None,
+            service: Optional[ChromiumService] = None,
+            keep_alive: bool = True,
+            connection_pool: Optional['ConnectionPool'] = None,
+            window_tracking: bool = False,
+            blocking_profile: Optional[BlockingProfile] = None,
+            page_load_strategy: Optional[PageLoadStrategy] = None
     ):
+        # Options are copied, so that arguments and extensions don't pile up in options shared between drivers
+        options = deepcopy(options)
+
         if extension_paths:
             for path in extension_paths:
                 options.add_extension(path)
@@ -23,11 +45,63 @@ class CrocoDriver(ChromiumDriver, ActionPerformer):
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_argument("--start-maximized")
 
+        if page_load_strategy:
+            options.page_load_strategy = page_load_strategy
+
         if proxy:
             options.add_argument(f'--proxy-server={proxy["host"]}:{proxy["port"]}')
-            options.add_argument(f'--proxy-auth={proxy["username"]}:{proxy["password"]}')
 
-        service = ChromiumService(executable_path=executable_path) if executable_path else ChromiumService()
+            if proxy.get('username'):
+                options.add_encoded_extension(get_proxy_extension(proxy))
+
+        self.__profile_path = profile_template.clone() if profile_template else None
+        self.__resource_blocker: Optional['ResourceBlocker'] = None
+        if self.__profile_path:
+            options.add_argument(f'--user-data-dir={self.__profile_path}')
+
+        if service is None:
+            service = ChromiumService(executable_path=executable_path) if executable_path else ChromiumService()
+
+        try:
+            ChromiumDriver.__init__(self, browser_name, vendor_prefix, options, service, keep_alive)
+        except Exception:
+            if self.__profile_path:
+                shutil.rmtree(self.__profile_path, ignore_errors=True)
+            raise
+
+        if connection_pool:
+            connection_pool.attach(self.command_executor)
+
+        ActionPerformer.__init__(self, self, element_cache_size, settle)
+
+        # Clients of DevTools protocol depend on trio, which is imported only when they're used
+        try:
+            if window_tracking:
+                from .window_tracker import track_windows
+                track_windows(self)
+
+            if blocking_profile:
+                from .resource_blocker import block_resources
+                self.__resource_blocker = block_resources(self, blocking_profile)
+        except Exception:
+            self.quit()
+            raise
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> dict:
+        count_command()
+        response = super().execute(driver_command, params)
+        # A failed command doesn't change the window or the frame
+        self._observe_command(driver_command, params)
+        return response
+
+    def quit(self) -> None:
+        if tracker := get_window_tracker(self):
+            tracker.close()
+        if self.__resource_blocker:
+            self.__resource_blocker.close()
 
-        ChromiumDriver.__init__(self, browser_name, vendor_prefix, options, service)
-        ActionPerformer.__init__(self, self)
+        try:
+            super().quit()
+        finally:
+            if self.__profile_path:
+                shutil.rmtree(self.__profile_path, ignore_errors=True)
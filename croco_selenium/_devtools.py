@@ -0,0 +1,169 @@
+import json
+import itertools
+import threading
+import urllib.request
+from typing import Optional, Callable, Awaitable, Any
+import trio
+import trio_websocket
+from selenium.common import WebDriverException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from .exceptions import DevToolsUnavailable
+from .utils import get_debugger_address
+
+_MAX_MESSAGE_SIZE = 2 ** 24
+_CLOSE_TIMEOUT = 5
+
+
+def get_websocket_url(
+        driver: WebDriver,
+        timeout: float,
+        error: type[Exception] = DevToolsUnavailable
+) -> str:
+    if not (address := get_debugger_address(driver)):
+        raise error('Browser has no debugger address')
+
+    try:
+        with urllib.request.urlopen(f'http://{address}/json/version', timeout=timeout) as response:
+            return json.load(response)['webSocketDebuggerUrl']
+    except (OSError, ValueError, KeyError) as exc:
+        raise error(exc) from exc
+
+
+class DevToolsClient:
+    """
+    The client of DevTools protocol of browser. It's connected to the browser target and runs an event loop of trio in
+    a daemon thread. Subclasses send initial commands in _start and handle events in _on_event
+    """
+    # Raised, if the client can't connect
+    _unavailable_error: type[Exception] = DevToolsUnavailable
+
+    def __init__(self, websocket_url: str, timeout: float = 10):
+        """
+        :param websocket_url: An URL of DevTools protocol of browser
+        :param timeout: Number of seconds before timing out of connecting
+        """
+        self.__ids = itertools.count()
+        self.__responses: dict[int, tuple[trio.Event, list[dict[str, Any]]]] = {}
+        self.__ready = threading.Event()
+        self.__closed = False
+        self.__error: Optional[BaseException] = None
+        self.__token: Optional[trio.lowlevel.TrioToken] = None
+        self.__cancel_scope: Optional[trio.CancelScope] = None
+        self.__connection: Optional[trio_websocket.WebSocketConnection] = None
+        self.__nursery: Optional[trio.Nursery] = None
+
+        self.__thread = threading.Thread(target=trio.run, args=(self.__run, websocket_url), daemon=True)
+        self.__thread.start()
+
+        if not self.__ready.wait(timeout) or self.__closed:
+            self.close()
+            raise self._unavailable_error(self.__error or f'No response within {timeout} seconds')
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client is disconnected from browser"""
+        return self.__closed
+
+    @property
+    def _error(self) -> Optional[BaseException]:
+        return self.__error
+
+    def call(self, method: str, params: Optional[dict] = None, session_id: Optional[str] = None) -> dict:
+        """
+        Sends a command from another thread and waits for its result
+        :param method: A method of DevTools protocol
+        :param params: Parameters of the method
+        :param session_id: A session of a target. If None, the command is sent to browser
+        :return: dict
+        """
+        return trio.from_thread.run(self._call, method, params, session_id, trio_token=self.__token)
+
+    def close(self) -> None:
+        """
+        Disconnects the client from browser
+        :return: None
+        """
+        if self.__token and not self.__closed:
+            try:
+                trio.from_thread.run_sync(self.__cancel_scope.cancel, trio_token=self.__token)
+            except trio.RunFinishedError:
+                pass
+        self.__thread.join(_CLOSE_TIMEOUT)
+
+    async def _start(self) -> None:
+        pass
+
+    def _on_event(self, method: str, params: dict[str, Any], session_id: Optional[str]) -> None:
+        pass
+
+    def _on_close(self) -> None:
+        pass
+
+    async def _call(self, method: str, params: Optional[dict] = None, session_id: Optional[str] = None) -> dict:
+        message_id = next(self.__ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+
+        event, response = self.__responses[message_id] = (trio.Event(), [])
+        try:
+            await self.__connection.send_message(json.dumps(message))
+            await event.wait()
+        finally:
+            del self.__responses[message_id]
+
+        if error := response[0].get('error'):
+            raise WebDriverException(f'{method} failed: {error.get("message")}')
+        return response[0].get('result', {})
+
+    def _spawn(self, func: Callable[..., Awaitable[Any]], *args) -> None:
+        # Events are handled synchronously, so commands caused by them are sent in background tasks
+        self.__nursery.start_soon(self.__run_task, func, *args)
+
+    async def __run_task(self, func: Callable[..., Awaitable[Any]], *args) -> None:
+        # A target may be destroyed before its commands are answered
+        try:
+            await func(*args)
+        except (WebDriverException, trio_websocket.ConnectionClosed):
+            pass
+
+    async def __run(self, websocket_url: str) -> None:
+        self.__token = trio.lowlevel.current_trio_token()
+
+        try:
+            with trio.CancelScope() as self.__cancel_scope:
+                async with trio_websocket.open_websocket_url(
+                        websocket_url,
+                        max_message_size=_MAX_MESSAGE_SIZE
+                ) as self.__connection:
+                    async with trio.open_nursery() as self.__nursery:
+                        self.__nursery.start_soon(self.__receive)
+
+                        try:
+                            await self._start()
+                        except (WebDriverException, trio_websocket.ConnectionClosed) as exc:
+                            self.__error = exc
+                            self.__cancel_scope.cancel()
+                        else:
+                            self.__ready.set()
+        except (OSError, trio_websocket.HandshakeError, trio_websocket.ConnectionClosed) as exc:
+            self.__error = exc
+        finally:
+            self.__closed = True
+            self._on_close()
+            self.__ready.set()
+
+    async def __receive(self) -> None:
+        try:
+            while True:
+                message = json.loads(await self.__connection.get_message())
+
+                if (message_id := message.get('id')) is not None:
+                    if pending := self.__responses.get(message_id):
+                        pending[1].append(message)
+                        pending[0].set()
+                else:
+                    self._on_event(message['method'], message.get('params', {}), message.get('sessionId'))
+        except trio_websocket.ConnectionClosed as exc:
+            self.__error = exc
+            self.__cancel_scope.cancel()
@@ -0,0 +1,102 @@
+import os
+import io
+import json
+import stat
+import base64
+import hashlib
+import zipfile
+import tempfile
+from functools import lru_cache
+from .types import Proxy
+from .exceptions import UnsafeCacheDirectory
+
+_MANIFEST = {
+    'manifest_version': 3,
+    'name': 'Croco Proxy Auth',
+    'version': '1.0.0',
+    'permissions': ['webRequest', 'webRequestAuthProvider'],
+    'host_permissions': ['<all_urls>'],
+    'background': {'service_worker': 'background.js'},
+    'minimum_chrome_version': '108'
+}
+
+# Manifest V3 accepts asyncBlocking listeners of onAuthRequired only since Chrome 120, so the listener is blocking
+_BACKGROUND = '''
+const credentials = %s;
+
+chrome.webRequest.onAuthRequired.addListener(
+    (details) => details.isProxy ? {authCredentials: credentials} : {},
+    {urls: ['<all_urls>']},
+    ['blocking']
+);
+'''
+
+
+def _cache_dir() -> str:
+    if cache_home := os.environ.get('XDG_CACHE_HOME'):
+        return os.path.join(cache_home, 'croco_selenium')
+    if hasattr(os, 'getuid'):
+        # Temporary directory is shared between users, so each user has own directory there
+        return os.path.join(tempfile.gettempdir(), f'croco_selenium-{os.getuid()}')
+    return os.path.join(tempfile.gettempdir(), 'croco_selenium')
+
+
+def _ensure_private_dir(path: str) -> None:
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if not hasattr(os, 'getuid'):
+        return
+
+    # Directory could be created in advance by another user, who would be able to replace extensions in it
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise UnsafeCacheDirectory(path)
+
+
+def _build_extension(proxy: Proxy) -> bytes:
+    credentials = {'username': proxy['username'], 'password': proxy['password']}
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('manifest.json', json.dumps(_MANIFEST))
+        archive.writestr('background.js', _BACKGROUND % json.dumps(credentials))
+
+    return buffer.getvalue()
+
+
+def get_proxy_extension_path(proxy: Proxy) -> str:
+    """
+    Returns a path of the extension answering proxy authentication. The extension is built once for a proxy and kept
+    in the cache directory of the user
+    :param proxy: A proxy with credentials
+    :return: str
+    """
+    cache_dir = _cache_dir()
+    _ensure_private_dir(cache_dir)
+
+    digest = hashlib.sha256(json.dumps(proxy, sort_keys=True).encode()).hexdigest()
+    path = os.path.join(cache_dir, f'proxy-{digest}.zip')
+
+    if not os.path.exists(path):
+        # Extension is written to a temporary file and moved, so that concurrent launches never read a partial file
+        descriptor, temporary_path = tempfile.mkstemp(dir=cache_dir, suffix='.zip')
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(_build_extension(proxy))
+        os.replace(temporary_path, path)
+
+    return path
+
+
+@lru_cache(maxsize=None)
+def _encode_extension(path: str) -> str:
+    with open(path, 'rb') as file:
+        return base64.b64encode(file.read()).decode('utf-8')
+
+
+def get_proxy_extension(proxy: Proxy) -> str:
+    """
+    Returns the Base64-encoded extension answering proxy authentication. The encoded extension is kept in memory, so
+    repeated launches with the same proxy don't encode it again
+    :param proxy: A proxy with credentials
+    :return: str
+    """
+    return _encode_extension(get_proxy_extension_path(proxy))
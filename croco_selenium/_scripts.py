@@ -0,0 +1,357 @@
+EXTRACT_ELEMENTS = '''
+const [xpath, attributes, visible] = arguments;
+
+function isVisible(element) {
+    const style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+}
+
+function getAttribute(element, name) {
+    const value = element[name];
+    if (typeof value === 'boolean') {
+        return value ? 'true' : null;
+    }
+    if (typeof value === 'string' || typeof value === 'number') {
+        return String(value);
+    }
+    return element.getAttribute(name);
+}
+
+const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const result = [];
+
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const element = snapshot.snapshotItem(i);
+
+    if (visible && !isVisible(element)) {
+        return [];
+    }
+
+    if (attributes === null) {
+        result.push(element.innerText === undefined ? element.textContent : element.innerText);
+    } else {
+        const row = {};
+        for (const name of attributes) {
+            row[name] = getAttribute(element, name);
+        }
+        result.push(row);
+    }
+}
+
+return result;
+'''
+
+OBSERVE_XPATH = '''
+const [xpath, state, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+
+function isVisible(element) {
+    const style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+}
+
+function check() {
+    if (state === 'all_present' || state === 'all_visible') {
+        const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        if (snapshot.snapshotLength === 0) {
+            return null;
+        }
+
+        const elements = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            const element = snapshot.snapshotItem(i);
+            if (state === 'all_visible' && !isVisible(element)) {
+                return null;
+            }
+            elements.push(element);
+        }
+        return elements;
+    }
+
+    const element = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    switch (state) {
+        case 'present':
+            return element;
+        case 'visible':
+            return element && isVisible(element) ? element : null;
+        case 'clickable':
+            return element && isVisible(element) && !element.disabled ? element : null;
+        case 'invisible':
+            return !element || !isVisible(element) ? true : null;
+    }
+    return null;
+}
+
+let result;
+try {
+    result = check();
+} catch (e) {
+    // XPATH is invalid, so waiting for it is pointless
+    done({invalidSelector: e.message});
+    return;
+}
+if (result !== null || timeout <= 0) {
+    done(result);
+    return;
+}
+
+let finished = false;
+
+function finish(value) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(value);
+}
+
+function recheck() {
+    const value = check();
+    if (value !== null) {
+        finish(value);
+    }
+}
+
+const observer = new MutationObserver(recheck);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+
+// Styles may change without mutations of the document, e.g. by loaded stylesheets or animations
+const interval = setInterval(recheck, 100);
+const timer = setTimeout(() => finish(null), timeout);
+'''
+
+SETTLE_DOCUMENT = '''
+const [quiet, readyState, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+
+let finished = false;
+let quietTimer = null;
+
+function finish(value) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    document.removeEventListener('readystatechange', restart);
+    clearTimeout(quietTimer);
+    clearTimeout(timer);
+    done(value);
+}
+
+function restart() {
+    clearTimeout(quietTimer);
+    if (readyState && document.readyState !== 'complete') {
+        return;
+    }
+    quietTimer = setTimeout(() => finish(true), quiet);
+}
+
+const observer = new MutationObserver(restart);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+document.addEventListener('readystatechange', restart);
+
+const timer = setTimeout(() => finish(false), timeout);
+restart();
+'''
+
+AWAIT_READINESS = '''
+const [domContentLoaded, resourceQuiet, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+
+let finished = false;
+let quietTimer = null;
+
+function finish(value) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    document.removeEventListener('readystatechange', check);
+    clearTimeout(quietTimer);
+    clearTimeout(timer);
+    done(value);
+}
+
+function check() {
+    if (domContentLoaded && document.readyState === 'loading') {
+        return;
+    }
+    if (resourceQuiet === null) {
+        finish(true);
+        return;
+    }
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), resourceQuiet);
+}
+
+// Resources are reported when they finish loading, so the condition is met when none has finished for a while.
+// Requests in flight, e.g. long polling or a large script, are not reported until they finish
+const observer = resourceQuiet === null ? null : new PerformanceObserver(check);
+if (observer) {
+    observer.observe({type: 'resource'});
+}
+document.addEventListener('readystatechange', check);
+
+const timer = setTimeout(() => finish(false), timeout);
+check();
+'''
+
+MARK_UNLOADING = 'window.__crocoUnloading = true;'
+
+IS_NAVIGATED = 'return !window.__crocoUnloading;'
+
+SNAPSHOT_STORAGE = '''
+function getItems(storage) {
+    const items = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+
+try {
+    return [window.location.origin, getItems(window.localStorage), getItems(window.sessionStorage)];
+} catch (e) {
+    // Storage of opaque origins, e.g. about:blank, is not accessible
+    return null;
+}
+'''
+
+RESTORE_STORAGE = '''
+(function (origins) {
+    const state = origins[window.location.origin];
+    if (!state) {
+        return;
+    }
+
+    function setItems(storage, items) {
+        // Storage is restored once, so that changes made by the page are not overwritten on next load
+        if (storage.length) {
+            return;
+        }
+        for (const [key, value] of Object.entries(items)) {
+            storage.setItem(key, value);
+        }
+    }
+
+    try {
+        setItems(window.localStorage, state.local);
+        setItems(window.sessionStorage, state.session);
+    } catch (e) {
+    }
+})(%s);
+'''
+
+FILL_FORM = '''
+const [fields, cleared, keystrokes] = arguments;
+const SETTABLE_INPUTS = ['text', 'email', 'password', 'search', 'tel', 'url', 'number', 'date', 'datetime-local',
+                         'month', 'week', 'time', 'color', 'range', 'hidden'];
+
+function isClickable(element) {
+    const style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0'
+        && !element.disabled;
+}
+
+// Hidden inputs are never displayed and file inputs are often hidden behind a styled label, yet the script and the
+// driver fill them anyway, so they only have to be present
+function isPresenceEnough(element) {
+    return element instanceof HTMLInputElement && ['hidden', 'file'].includes(element.type);
+}
+
+function isSettable(element) {
+    if (element instanceof HTMLInputElement) {
+        return SETTABLE_INPUTS.includes(element.type);
+    }
+    return element instanceof HTMLTextAreaElement || element instanceof HTMLSelectElement;
+}
+
+const elements = [];
+for (const [xpath] of fields) {
+    const element = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!element || !(isPresenceEnough(element) || isClickable(element))) {
+        return null;
+    }
+    elements.push(element);
+}
+
+const typed = [];
+elements.forEach((element, index) => {
+    const value = fields[index][1];
+    if (element instanceof HTMLInputElement && element.type === 'file') {
+        // The driver can't clear a hidden file input, so its files are dropped here
+        if (cleared) {
+            element.value = '';
+        }
+        typed.push([index, element, false]);
+        return;
+    }
+    if (keystrokes.includes(index) || !isSettable(element)) {
+        typed.push([index, element, cleared]);
+        return;
+    }
+
+    // Setter of the prototype is called, so frameworks tracking value of the element notice the change
+    const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set;
+    setter.call(element, cleared || element instanceof HTMLSelectElement ? value : element.value + value);
+    if (element instanceof HTMLSelectElement && element.value !== value) {
+        typed.push([index, element, cleared]);
+        return;
+    }
+
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+});
+
+return {typed};
+'''
+
+EXTRACT_FIELDS = '''
+const [fields] = arguments;
+
+function getAttribute(element, name) {
+    const value = element[name];
+    if (typeof value === 'boolean') {
+        return value ? 'true' : null;
+    }
+    if (typeof value === 'string' || typeof value === 'number') {
+        return String(value);
+    }
+    return element.getAttribute(name);
+}
+
+function read(element, attribute) {
+    if (attribute === null) {
+        return element.innerText === undefined ? element.textContent : element.innerText;
+    }
+    return getAttribute(element, attribute);
+}
+
+const values = [];
+for (const [xpath, attribute, multiple] of fields) {
+    const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    if (snapshot.snapshotLength === 0) {
+        return null;
+    }
+
+    if (multiple) {
+        const row = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            row.push(read(snapshot.snapshotItem(i), attribute));
+        }
+        values.push(row);
+    } else {
+        values.push(read(snapshot.snapshotItem(0), attribute));
+    }
+}
+
+return values;
+'''
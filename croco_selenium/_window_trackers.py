@@ -0,0 +1,27 @@
+from weakref import WeakKeyDictionary
+from typing import Optional, TYPE_CHECKING
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+
+if TYPE_CHECKING:
+    from .window_tracker import WindowTracker
+
+# Trackers are kept apart from WindowTracker, so that actions don't import trio until windows are tracked
+_trackers: WeakKeyDictionary[WebDriver, 'WindowTracker'] = WeakKeyDictionary()
+
+
+def register_window_tracker(driver: WebDriver, tracker: 'WindowTracker') -> None:
+    _trackers[driver] = tracker
+
+
+def get_window_tracker(driver: WebDriver) -> Optional['WindowTracker']:
+    """
+    Returns a connected window tracker of the driver
+    :param driver: A driver to be interacted
+    :return: Optional[WindowTracker]
+    """
+    try:
+        tracker = _trackers.get(driver)
+    except TypeError:
+        return None
+
+    return tracker if tracker and not tracker.closed else None
@@ -1,26 +1,149 @@
-from typing import Optional
+from contextlib import contextmanager
+from typing import Optional, Iterable, Iterator
 from selenium.webdriver.remote.webelement import WebElement
-from .types import XPATH, IgnoredExceptions, Cookies
+from selenium.webdriver.remote.command import Command
+from .types import XPATH, IgnoredExceptions, Cookies, SettlePolicy, SessionState, ActionHook, Readiness
 from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
 from .actions import *
+from .actions import _type, _silent_type, _wait_for_windows
+from .element_cache import ElementCache, perform_cached
+from .instrumentation import add_hook, remove_hook
+from .deadline import Deadline
 
 
 class ActionPerformer:
-    """The class performing actions in specified driver, such as clicking, sending keys etc"""
-    def __init__(self, driver: WebDriver):
+    """
+    The class performing actions in specified driver, such as clicking, sending keys etc. A driver, which is a performer
+    itself, e.g. ChromeDriver, reports its commands, so the current window and frame are known without asking it. A
+    performer of another driver doesn't see commands sent by the driver directly: it asks the current window before
+    reusing kept elements, and the frame entered by frame() has to be left by the performer, not by driver.switch_to
+    """
+    def __init__(self, driver: WebDriver, element_cache_size: int = 0, settle: Optional[SettlePolicy] = None):
         """
         :param driver: A driver to be interacted
+        :param element_cache_size: Maximum number of found elements to be reused by further actions. If 0, elements are
+                                   found on every action
+        :param settle: A policy of settling the document after wait_for_invisibility and wait_for_windows. If None,
+                       they return as soon as the condition is met
         """
         self.__targeted_driver = driver
+        self.__settle = settle
+        self.__element_cache = ElementCache(element_cache_size) if element_cache_size else None
+        self.__frame_path: tuple[XPATH, ...] = ()
+        self.__frame_contexts: list[tuple[XPATH, ...]] = []
+        # Whether the driver was switched to a frame out of the frame path, e.g. by driver.switch_to.frame
+        self.__frame_unknown = False
+        # Whether frames are switched by the performer, which tracks the frame path itself
+        self.__switching_frames = False
+        # Handle of the current window, None if it's unknown
+        self.__window_handle: Optional[str] = None
+        # Only a driver, which is the performer itself, reports its commands to _observe_command
+        self.__observed = driver is self
 
-    def add_cookies(self, cookies: Cookies) -> None:
+    @property
+    def element_cache(self) -> Optional[ElementCache]:
+        """A cache of found elements, if enabled"""
+        return self.__element_cache
+
+    def add_hook(self, hook: ActionHook) -> None:
+        """
+        Adds a hook called with an event after every action performed in the driver
+        :param hook: A callable taking ActionEvent
+        :return: None
+        """
+        add_hook(hook, self.__targeted_driver)
+
+    def remove_hook(self, hook: ActionHook) -> None:
+        """
+        Removes a hook added by add_hook
+        :param hook: A callable taking ActionEvent
+        :return: None
+        """
+        remove_hook(hook, self.__targeted_driver)
+
+    def deadline(self, seconds: float) -> Deadline:
+        """
+        Creates a time budget of a flow. Inside its context every action and decorator waits at most the time left and
+        fails with DeadlineExceeded once the budget is spent
+        :param seconds: Number of seconds the flow may take
+        :return: Deadline
+        """
+        return Deadline(seconds)
+
+    def add_cookies(self, cookies: Cookies, bulk: bool = False) -> None:
         """
         Adds cookies to browser
         :param cookies: List of dictionaries or dictionary containing cookies
+        :param bulk: If true, all cookies are set in a single DevTools command. They may belong to any domain, so the
+                     page doesn't have to be opened
+        :return: None
+        """
+        driver = self.__targeted_driver
+        add_cookies(driver, cookies, bulk)
+
+    def export_cookies(self, path: str) -> None:
+        """
+        Saves cookies of all domains to a file
+        :param path: A path of the file
+        :return: None
+        """
+        driver = self.__targeted_driver
+        export_cookies(driver, path)
+
+    def import_cookies(self, path: str) -> None:
+        """
+        Adds cookies saved by export_cookies in a single DevTools command
+        :param path: A path of the file
+        :return: None
+        """
+        driver = self.__targeted_driver
+        import_cookies(driver, path)
+
+    def snapshot_state(self, state: Optional[SessionState] = None) -> SessionState:
+        """
+        Captures cookies of all domains, localStorage and sessionStorage of a current page. The state is serializable
+        by json, so it can be saved and restored by restore_state in another driver
+        :param state: A state captured on another page to be extended by storage of the current page
+        :return: SessionState
+        """
+        driver = self.__targeted_driver
+        return snapshot_state(driver, state)
+
+    def restore_state(self, state: SessionState) -> None:
+        """
+        Restores a state captured by snapshot_state. Cookies are set at once, and storage of an origin is restored
+        when a page of the origin is opened in the current tab
+        :param state: A state to be restored
         :return: None
         """
         driver = self.__targeted_driver
-        add_cookies(driver, cookies)
+        restore_state(driver, state)
+
+    def load_page(
+            self,
+            timeout: float,
+            url: str,
+            ready: Optional[Readiness] = None,
+            *,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> None:
+        """
+        Opens a page and waits until it's ready. With eager or none page load strategy of the driver, the page is
+        considered ready as soon as the conditions are met, not when all its resources are loaded
+        :param timeout: Number of seconds before timing out
+        :param url: An URL of the page
+        :param ready: Conditions of readiness. It has three keys:
+                      xpath - XPATH of an element, which has to be present
+                      dom_content_loaded - whether DOMContentLoaded has to be fired
+                      resource_quiet - number of seconds no resource of the page has to finish loading for. Requests
+                                       still in flight aren't seen, so it's not a network idle
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        load_page(driver, timeout, url, ready, ignored_exceptions=ignored_exceptions)
+        self.__frame_path = ()
 
     def switch_to_another_window(self, timeout: float) -> None:
         """
@@ -31,6 +154,8 @@ class ActionPerformer:
         """
         driver = self.__targeted_driver
         switch_to_another_window(driver, timeout)
+        self.__frame_path = ()
+        self.__window_handle = None
 
     def switch_to_frame(
             self,
@@ -48,7 +173,9 @@ class ActionPerformer:
         :return: None
         """
         driver = self.__targeted_driver
-        switch_to_frame(driver, timeout, xpath, ignored_exceptions=ignored_exceptions)
+        with self.__switching():
+            if switch_to_frame(driver, timeout, xpath, ignored_exceptions=ignored_exceptions):
+                self.__frame_path += (xpath,)
 
     def switch_to_parent_frame(
             self
@@ -58,7 +185,36 @@ class ActionPerformer:
         :return: None
         """
         driver = self.__targeted_driver
-        switch_to_parent_frame(driver)
+        with self.__switching():
+            switch_to_parent_frame(driver)
+        self.__frame_path = self.__frame_path[:-1]
+
+    @contextmanager
+    def frame(self, timeout: float, *xpaths: XPATH) -> Iterator[None]:
+        """
+        Switches to a frame and restores the previous frame on exit. Frames are switched only if they differ from the
+        current ones, so entering the current frame costs no commands
+        :param timeout: Number of seconds before timing out
+        :param xpaths: XPATHs of nested frames relative to the frame of the enclosing context or to the document
+
+        :return: Iterator[None]
+        """
+        previous_path = self.__frame_path
+        path = (self.__frame_contexts[-1] if self.__frame_contexts else ()) + xpaths
+
+        try:
+            self.__move_to_frame(timeout, path)
+        except BaseException:
+            # Frames entered before the failure are left, so callers catching the error stay in their frame
+            self.__move_to_frame(timeout, previous_path)
+            raise
+        self.__frame_contexts.append(path)
+
+        try:
+            yield
+        finally:
+            self.__frame_contexts.pop()
+            self.__move_to_frame(timeout, previous_path)
 
     def send_keys(
             self,
@@ -79,7 +235,18 @@ class ActionPerformer:
         :return: None
         """
         driver = self.__targeted_driver
-        send_keys(driver, timeout, xpath, text, cleared, ignored_exceptions=ignored_exceptions)
+
+        if self.__element_cache is not None:
+            self.__perform_cached(
+                'send_keys',
+                timeout,
+                xpath,
+                'clickable',
+                lambda element: _type(element, text, cleared),
+                ignored_exceptions
+            )
+        else:
+            send_keys(driver, timeout, xpath, text, cleared, ignored_exceptions=ignored_exceptions)
 
     def silent_send_keys(
             self,
@@ -89,7 +256,8 @@ class ActionPerformer:
             ignored_exceptions: Optional[IgnoredExceptions] = None,
             cleared: bool = True,
             min_delay: float = 0.07,
-            max_delay: float = 0.14
+            max_delay: float = 0.14,
+            batched: bool = False
     ) -> None:
         """
         Sends keys with delay between characters in browser
@@ -100,10 +268,24 @@ class ActionPerformer:
         :param cleared: If true, field clears before be interacted
         :param min_delay: Minimum delay between sending a character
         :param max_delay: Maximum delay between sending a character
+        :param batched: If true, all keystrokes and delays are sent in a single request of actions instead of a request
+                        per character
 
         :return: None
         """
         driver = self.__targeted_driver
+
+        if self.__element_cache is not None:
+            self.__perform_cached(
+                'silent_send_keys',
+                timeout,
+                xpath,
+                'clickable',
+                lambda element: _silent_type(element, text, cleared, min_delay, max_delay, batched),
+                ignored_exceptions
+            )
+            return
+
         silent_send_keys(
             driver,
             timeout,
@@ -112,9 +294,33 @@ class ActionPerformer:
             cleared,
             min_delay,
             max_delay,
+            batched,
             ignored_exceptions=ignored_exceptions
         )
 
+    def fill_form(
+            self,
+            timeout: float,
+            fields: dict[XPATH, str],
+            ignored_exceptions: Optional[IgnoredExceptions] = None,
+            cleared: bool = True,
+            keystrokes: Iterable[XPATH] = ()
+    ) -> None:
+        """
+        Fills fields of a form in browser. Fields are awaited together, then values are set and input and change events
+        are fired in a single script call. Fields, which value can't be set by script, get real keystrokes. Hidden and
+        file inputs only have to be present, other fields have to be clickable
+        :param timeout: Number of seconds before timing out
+        :param fields: Dictionary of XPATHs of fields and texts to be filled in
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+        :param cleared: If true, fields clear before be interacted
+        :param keystrokes: XPATHs of fields, which get real keystrokes anyway, e.g. fields listening to key events
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        fill_form(driver, timeout, fields, cleared, keystrokes, ignored_exceptions=ignored_exceptions)
+
     def click(
             self,
             timeout: float,
@@ -130,7 +336,18 @@ class ActionPerformer:
         :return: None
         """
         driver = self.__targeted_driver
-        click(driver, timeout, xpath, ignored_exceptions=ignored_exceptions)
+
+        if self.__element_cache is not None:
+            self.__perform_cached(
+                'click',
+                timeout,
+                xpath,
+                'clickable',
+                lambda element: element.click(),
+                ignored_exceptions
+            )
+        else:
+            click(driver, timeout, xpath, ignored_exceptions=ignored_exceptions)
 
     def get_element_text(
             self,
@@ -147,6 +364,17 @@ class ActionPerformer:
         :return: str
         """
         driver = self.__targeted_driver
+
+        if self.__element_cache is not None:
+            return self.__perform_cached(
+                'get_element_text',
+                timeout,
+                xpath,
+                'present',
+                lambda element: element.text,
+                ignored_exceptions
+            )
+
         return get_element_text(driver, timeout, xpath, ignored_exceptions=ignored_exceptions)
 
     def get_element_attribute(
@@ -166,6 +394,17 @@ class ActionPerformer:
         :return: str
         """
         driver = self.__targeted_driver
+
+        if self.__element_cache is not None:
+            return self.__perform_cached(
+                'get_element_attribute',
+                timeout,
+                xpath,
+                'present',
+                lambda element: element.get_attribute(attribute),
+                ignored_exceptions
+            )
+
         return get_element_attribute(
             driver,
             timeout,
@@ -212,6 +451,53 @@ class ActionPerformer:
         driver = self.__targeted_driver
         return get_elements(driver, timeout, xpath, visible,ignored_exceptions=ignored_exceptions)
 
+    def get_elements_text(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            visible: bool = True,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> list[str]:
+        """
+        Gets texts of elements in browser in a single script call
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param visible: Whether elements should be visible
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: list[str]
+        """
+        driver = self.__targeted_driver
+        return get_elements_text(driver, timeout, xpath, visible, ignored_exceptions=ignored_exceptions)
+
+    def get_elements_attributes(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            attributes: Iterable[str],
+            visible: bool = True,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> list[dict[str, Optional[str]]]:
+        """
+        Gets attributes of elements in browser in a single script call
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param attributes: Names of attributes of the elements
+        :param visible: Whether elements should be visible
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: list[dict[str, Optional[str]]]
+        """
+        driver = self.__targeted_driver
+        return get_elements_attributes(
+            driver,
+            timeout,
+            xpath,
+            attributes,
+            visible,
+            ignored_exceptions=ignored_exceptions
+        )
+
     def wait_for_invisibility(
             self,
             timeout: float,
@@ -227,7 +513,7 @@ class ActionPerformer:
         :return: None
         """
         driver = self.__targeted_driver
-        wait_for_invisibility(driver, timeout, xpath, ignored_exceptions=ignored_exceptions)
+        wait_for_invisibility(driver, timeout, xpath, ignored_exceptions=ignored_exceptions, settle=self.__settle)
 
     def wait_for_windows(
             self,
@@ -246,7 +532,8 @@ class ActionPerformer:
         """
         driver = self.__targeted_driver
 
-        wait_for_windows(driver, timeout, number, ignored_exceptions=ignored_exceptions)
+        if _wait_for_windows(driver, timeout, number, ignored_exceptions=ignored_exceptions, settle=self.__settle):
+            self.__frame_path = ()
 
     def close_tabs(self) -> None:
         """
@@ -256,3 +543,105 @@ class ActionPerformer:
         """
         driver = self.__targeted_driver
         close_tabs(driver)
+        self.__frame_path = ()
+        self.__window_handle = None
+
+    def _observe_command(self, driver_command: str, params: Optional[dict]) -> None:
+        """
+        Keeps the current window and frame known without asking the driver. Drivers, which are performers themselves,
+        call it after every successful command, so windows and frames switched by driver.switch_to or left by navigation
+        are noticed
+        :param driver_command: A name of the command
+        :param params: Parameters of the command
+        :return: None
+        """
+        if driver_command == Command.SWITCH_TO_WINDOW:
+            self.__window_handle = params['handle']
+            self.__leave_frames()
+        elif driver_command in (Command.CLOSE, Command.QUIT):
+            self.__window_handle = None
+            self.__leave_frames()
+        elif driver_command in (Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD):
+            # Navigation switches to the top-level document
+            self.__leave_frames()
+        elif driver_command == Command.SWITCH_TO_PARENT_FRAME:
+            # Frames switched by the performer are tracked by itself
+            if not self.__switching_frames:
+                self.__frame_path = self.__frame_path[:-1]
+        elif driver_command == Command.SWITCH_TO_FRAME and not self.__switching_frames:
+            if params['id'] is None:
+                self.__leave_frames()
+            else:
+                # XPATH of the entered frame isn't known, so it's left for the document before entering next frames
+                self.__frame_path = ()
+                self.__set_frame_unknown(True)
+
+    def __perform_cached(self, name, timeout, xpath, state, action, ignored_exceptions):
+        return perform_cached(
+            self.__targeted_driver,
+            self.__element_cache,
+            self.__frame_path,
+            timeout,
+            xpath,
+            state,
+            action,
+            ignored_exceptions=ignored_exceptions,
+            name=name,
+            window_handle=self.__current_window_handle()
+        )
+
+    def __current_window_handle(self) -> str:
+        # Windows switched by another driver directly aren't seen, so its handle isn't trusted
+        if not self.__observed:
+            return self.__targeted_driver.current_window_handle
+        if self.__window_handle is None:
+            self.__window_handle = self.__targeted_driver.current_window_handle
+        return self.__window_handle
+
+    def __leave_frames(self) -> None:
+        self.__frame_path = ()
+        self.__set_frame_unknown(False)
+
+    def __set_frame_unknown(self, unknown: bool) -> None:
+        if unknown != self.__frame_unknown and self.__element_cache is not None:
+            # Elements of an unknown frame are kept under the path of the document, so they aren't reused across it
+            self.__element_cache.clear()
+        self.__frame_unknown = unknown
+
+    @contextmanager
+    def __switching(self) -> Iterator[None]:
+        switching = self.__switching_frames
+        self.__switching_frames = True
+        try:
+            yield
+        finally:
+            self.__switching_frames = switching
+
+    def __move_to_frame(self, timeout: float, path: tuple[XPATH, ...]) -> None:
+        with self.__switching():
+            self.__switch_frames(timeout, path)
+
+    def __switch_frames(self, timeout: float, path: tuple[XPATH, ...]) -> None:
+        driver = self.__targeted_driver
+
+        if self.__frame_unknown:
+            # Frames of the path are found from the document, wherever the driver was switched to
+            driver.switch_to.default_content()
+            self.__set_frame_unknown(False)
+
+        common = 0
+        while common < min(len(path), len(self.__frame_path)) and path[common] == self.__frame_path[common]:
+            common += 1
+
+        if common < len(self.__frame_path):
+            # Leaving frames is a single command, if the document is their common ancestor
+            if common:
+                for _ in range(len(self.__frame_path) - common):
+                    switch_to_parent_frame(driver)
+            else:
+                driver.switch_to.default_content()
+            self.__frame_path = self.__frame_path[:common]
+
+        for xpath in path[common:]:
+            switch_to_frame(driver, timeout, xpath)
+            self.__frame_path += (xpath,)
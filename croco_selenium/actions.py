@@ -1,24 +1,38 @@
 import json
 import time
 import random
-from typing import Optional
+from typing import Optional, Iterable, Any
+from selenium.common import NoSuchWindowException, JavascriptException
 from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-from .types import XPATH, IgnoredExceptions, Cookies
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.keys import Keys
+from .types import XPATH, IgnoredExceptions, Cookies, SettlePolicy, SessionState, Readiness
 from .utils import ignore_exceptions
+from .instrumentation import instrumented, recording
+from .waits import wait_until, wait_for_xpath, wait_for_settle, wait_for_ready
+from ._scripts import EXTRACT_ELEMENTS, SNAPSHOT_STORAGE, RESTORE_STORAGE, MARK_UNLOADING, IS_NAVIGATED, FILL_FORM
+from ._window_trackers import get_window_tracker
 
 __all__ = [
     'add_cookies',
+    'export_cookies',
+    'import_cookies',
+    'snapshot_state',
+    'restore_state',
+    'load_page',
     'switch_to_another_window',
     'switch_to_parent_frame',
     'switch_to_frame',
     'send_keys',
     'silent_send_keys',
+    'fill_form',
     'click',
     'get_elements',
+    'get_elements_text',
+    'get_elements_attributes',
     'get_element',
     'get_element_text',
     'get_element_attribute',
@@ -27,25 +41,174 @@ __all__ = [
     'close_tabs'
 ]
 
+# Number of seconds closing of tabs by a window tracker is waited
+CLOSE_TIMEOUT = 10
 
-def add_cookies(driver: WebDriver, cookies: Cookies) -> None:
+_SPECIAL_KEYS = {
+    '\n': Keys.ENTER,
+    '\r': Keys.RETURN,
+    '\t': Keys.TAB
+}
+
+_SAME_SITE = {
+    'strict': 'Strict',
+    'lax': 'Lax',
+    'none': 'None',
+    'no_restriction': 'None'
+}
+
+
+def _to_cdp_cookie(cookie: dict[str, Any]) -> dict[str, Any]:
+    cdp_cookie = {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'domain': cookie['domain'],
+        'path': cookie.get('path', '/')
+    }
+
+    for key in ('secure', 'httpOnly'):
+        if cookie.get(key):
+            cdp_cookie[key] = True
+
+    expires = cookie.get('expiry', cookie.get('expirationDate', cookie.get('expires')))
+    if expires is not None and expires >= 0:
+        cdp_cookie['expires'] = expires
+
+    if same_site := _SAME_SITE.get(str(cookie.get('sameSite') or '').lower()):
+        cdp_cookie['sameSite'] = same_site
+
+    return cdp_cookie
+
+
+@instrumented
+def add_cookies(driver: WebDriver, cookies: Cookies, bulk: bool = False) -> None:
     """
     Adds cookies to a current page
     :param driver: A driver to be interacted
     :param cookies: List of dictionaries or dictionary containing cookies
+    :param bulk: If true, all cookies are set in a single DevTools command. They may belong to any domain, so the page
+                 doesn't have to be opened
     :return: None
     """
     cookies = json.loads(cookies) if isinstance(cookies, str) else cookies
+    cookies = cookies if isinstance(cookies, list) else [cookies]
+    cookies = [cookie for cookie in cookies if 'domain' in cookie]
 
-    if isinstance(cookies, list):
+    if bulk:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': [_to_cdp_cookie(cookie) for cookie in cookies]})
+    else:
         for cookie in cookies:
-            if 'domain' in cookie:
-                driver.add_cookie(cookie)
-    elif isinstance(cookies, dict):
-        if 'domain' in cookies:
-            driver.add_cookie(cookies)
+            driver.add_cookie(cookie)
+
+
+@instrumented
+def export_cookies(driver: WebDriver, path: str) -> None:
+    """
+    Saves cookies of all domains to a file
+    :param driver: A driver to be interacted
+    :param path: A path of the file
+    :return: None
+    """
+    cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+    cookies = [_to_cdp_cookie(cookie) for cookie in cookies]
+
+    with open(path, 'w') as file:
+        json.dump(cookies, file, separators=(',', ':'))
+
+
+@instrumented
+def import_cookies(driver: WebDriver, path: str) -> None:
+    """
+    Adds cookies saved by export_cookies in a single DevTools command
+    :param driver: A driver to be interacted
+    :param path: A path of the file
+    :return: None
+    """
+    with open(path) as file:
+        cookies = json.load(file)
+
+    driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+
+
+@instrumented
+def snapshot_state(driver: WebDriver, state: Optional[SessionState] = None) -> SessionState:
+    """
+    Captures cookies of all domains, localStorage and sessionStorage of a current page. The state is serializable by
+    json, so it can be saved and restored by restore_state in another driver
+    :param driver: A driver to be interacted
+    :param state: A state captured on another page to be extended by storage of the current page
+    :return: SessionState
+    """
+    cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+    origins = dict(state['origins']) if state else {}
+
+    if storage := driver.execute_script(SNAPSHOT_STORAGE):
+        origin, local, session = storage
+        origins[origin] = {'local': local, 'session': session}
+
+    return {'cookies': [_to_cdp_cookie(cookie) for cookie in cookies], 'origins': origins}
+
+
+@instrumented
+def restore_state(driver: WebDriver, state: SessionState) -> None:
+    """
+    Restores a state captured by snapshot_state. Cookies are set at once, and storage of an origin is restored when
+    a page of the origin is opened in the current tab, before scripts of the page are run
+    :param driver: A driver to be interacted
+    :param state: A state to be restored
+    :return: None
+    """
+    driver.execute_cdp_cmd('Network.setCookies', {'cookies': state['cookies']})
+
+    if state['origins']:
+        script = RESTORE_STORAGE % json.dumps(state['origins'])
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+        driver.execute_script(script)
 
 
+@ignore_exceptions
+@instrumented
+def load_page(
+        driver: WebDriver,
+        timeout: float,
+        url: str,
+        ready: Optional[Readiness] = None,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> None:
+    """
+    Opens a page and waits until it's ready. With eager or none page load strategy of the driver, the page is
+    considered ready as soon as the conditions are met, not when all its resources are loaded
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param url: An URL of the page
+    :param ready: Conditions of readiness. It has three keys:
+                  xpath - XPATH of an element, which has to be present
+                  dom_content_loaded - whether DOMContentLoaded has to be fired
+                  resource_quiet - number of seconds no resource of the page has to finish loading for. Requests
+                                   still in flight aren't seen, so it's not a network idle
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+    :return: None
+    """
+    end_time = time.monotonic() + timeout
+    # With page load strategy none navigation isn't awaited, so the previous document is marked to be told apart
+    navigating = ready and driver.caps.get('pageLoadStrategy') == 'none'
+
+    if navigating:
+        driver.execute_script(MARK_UNLOADING)
+    driver.get(url)
+
+    if not ready:
+        return
+    if navigating:
+        # Script fails while the previous document is being unloaded
+        remaining = max(end_time - time.monotonic(), 0)
+        wait_until(driver, remaining, lambda d: d.execute_script(IS_NAVIGATED), JavascriptException)
+    wait_for_ready(driver, max(end_time - time.monotonic(), 0), ready)
+
+
+@instrumented
 def switch_to_another_window(driver: WebDriver, timeout: float) -> None:
     """
     Switches to a different window from current window in browser
@@ -55,8 +218,17 @@ def switch_to_another_window(driver: WebDriver, timeout: float) -> None:
     :return: str
     """
     original_window_handle = driver.current_window_handle
+
+    if tracker := get_window_tracker(driver):
+        window_handle = tracker.wait(
+            lambda handles: next((handle for handle in handles if handle != original_window_handle), None),
+            timeout
+        )
+        _switch_to_window(driver, window_handle, timeout)
+        return
+
     if len(driver.window_handles) < 2:
-        WebDriverWait(driver, timeout).until(EC.number_of_windows_to_be(2))
+        wait_until(driver, timeout, EC.number_of_windows_to_be(2))
 
     for window_handle in driver.window_handles:
         if window_handle != original_window_handle:
@@ -64,14 +236,20 @@ def switch_to_another_window(driver: WebDriver, timeout: float) -> None:
             break
 
 
+def _switch_to_window(driver: WebDriver, window_handle: str, timeout: float) -> None:
+    # Window tracker may learn about a new window a bit earlier than chromedriver
+    wait_until(driver, timeout, lambda d: d.switch_to.window(window_handle) or True, NoSuchWindowException)
+
+
 @ignore_exceptions
+@instrumented
 def switch_to_frame(
         driver: WebDriver,
         timeout: float,
         xpath: XPATH,
         *,
         ignored_exceptions: Optional[IgnoredExceptions] = None
-) -> None:
+) -> Optional[bool]:
     """
     Switches to the frame
     :param driver: A driver to be interacted
@@ -79,13 +257,13 @@ def switch_to_frame(
     :param xpath: XPATH of an element
     :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
 
-    :return: None
+    :return: True if switched, None if an ignored exception occurred
     """
-    WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.frame_to_be_available_and_switch_to_it(
-            (By.XPATH, xpath)))
+    condition = EC.frame_to_be_available_and_switch_to_it((By.XPATH, xpath))
+    return wait_until(driver, timeout, condition, ignored_exceptions)
 
 
+@instrumented
 def switch_to_parent_frame(
         driver: WebDriver
 ) -> None:
@@ -97,7 +275,49 @@ def switch_to_parent_frame(
     driver.switch_to.parent_frame()
 
 
+def _type(element: WebElement, text: str, cleared: bool) -> None:
+    if cleared:
+        element.clear()
+
+    element.send_keys(text)
+
+
+def _silent_type(
+        element: WebElement,
+        text: str,
+        cleared: bool,
+        min_delay: float,
+        max_delay: float,
+        batched: bool = False
+) -> None:
+    if cleared:
+        element.clear()
+
+    if batched:
+        _batched_silent_type(element, text, min_delay, max_delay)
+        return
+
+    for char in text:
+        element.send_keys(char)
+        delay = random.uniform(min_delay, max_delay)
+        time.sleep(delay)
+
+
+def _batched_silent_type(element: WebElement, text: str, min_delay: float, max_delay: float) -> None:
+    driver = element.parent
+    driver.execute_script('arguments[0].focus();', element)
+
+    builder = ActionBuilder(driver)
+    for char in text:
+        key = _SPECIAL_KEYS.get(char, char)
+        delay = random.uniform(min_delay, max_delay)
+        builder.key_action.key_down(key).key_up(key).pause(delay)
+
+    builder.perform()
+
+
 @ignore_exceptions
+@instrumented
 def send_keys(
         driver: WebDriver,
         timeout: float,
@@ -118,17 +338,13 @@ def send_keys(
 
     :return: None
     """
-    element = WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.element_to_be_clickable(
-            (By.XPATH, xpath)))
-
-    if cleared:
-        element.clear()
+    element = wait_for_xpath(driver, timeout, xpath, 'clickable', ignored_exceptions)
 
-    element.send_keys(text)
+    _type(element, text, cleared)
 
 
 @ignore_exceptions
+@instrumented
 def silent_send_keys(
         driver: WebDriver,
         timeout: float,
@@ -137,6 +353,7 @@ def silent_send_keys(
         cleared: bool = True,
         min_delay: float = 0.07,
         max_delay: float = 0.14,
+        batched: bool = False,
         *,
         ignored_exceptions: Optional[IgnoredExceptions] = None
 ) -> None:
@@ -150,23 +367,66 @@ def silent_send_keys(
     :param cleared: If true, field clears before be interacted
     :param min_delay: Minimum delay between sending a character
     :param max_delay: Maximum delay between sending a character
+    :param batched: If true, all keystrokes and delays are sent in a single request of actions instead of a request
+                    per character
 
     :return: None
     """
-    element = WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.element_to_be_clickable(
-            (By.XPATH, xpath)))
+    element = wait_for_xpath(driver, timeout, xpath, 'clickable', ignored_exceptions)
 
-    if cleared:
-        element.clear()
+    _silent_type(element, text, cleared, min_delay, max_delay, batched)
 
-    for char in text:
-        element.send_keys(char)
-        delay = random.uniform(min_delay, max_delay)
-        time.sleep(delay)
+
+def _fill_form(fields: list[tuple[XPATH, str]], cleared: bool, keystrokes: list[int]):
+    def _predicate(driver: WebDriver):
+        return driver.execute_script(FILL_FORM, fields, cleared, keystrokes)
+
+    return _predicate
+
+
+def _prepare_form(
+        fields: dict[XPATH, str],
+        keystrokes: Iterable[XPATH]
+) -> tuple[list[tuple[XPATH, str]], list[int]]:
+    fields = list(fields.items())
+    keystrokes = set(keystrokes)
+    return fields, [index for index, (xpath, _) in enumerate(fields) if xpath in keystrokes]
+
+
+@ignore_exceptions
+@instrumented
+def fill_form(
+        driver: WebDriver,
+        timeout: float,
+        fields: dict[XPATH, str],
+        cleared: bool = True,
+        keystrokes: Iterable[XPATH] = (),
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> None:
+    """
+    Fills fields of a form in browser. Fields are awaited together, then values are set and input and change events are
+    fired in a single script call. Fields, which value can't be set by script, e.g. file inputs or contenteditable
+    elements, get real keystrokes. Hidden and file inputs only have to be present, other fields have to be clickable
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param fields: Dictionary of XPATHs of fields and texts to be filled in
+    :param cleared: If true, fields clear before be interacted
+    :param keystrokes: XPATHs of fields, which get real keystrokes anyway, e.g. fields listening to key events
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: None
+    """
+    fields, keystrokes = _prepare_form(fields, keystrokes)
+    filled = wait_until(driver, timeout, _fill_form(fields, cleared, keystrokes), ignored_exceptions)
+
+    # File inputs are cleared by the script, so the driver doesn't touch them while they are hidden
+    for index, element, clears in filled['typed']:
+        _type(element, fields[index][1], clears)
 
 
 @ignore_exceptions
+@instrumented
 def click(
         driver: WebDriver,
         timeout: float,
@@ -183,12 +443,11 @@ def click(
 
     :return: None
     """
-    WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.element_to_be_clickable(
-            (By.XPATH, xpath))).click()
+    wait_for_xpath(driver, timeout, xpath, 'clickable', ignored_exceptions).click()
 
 
 @ignore_exceptions
+@instrumented
 def get_element_text(
         driver: WebDriver,
         timeout: float,
@@ -205,12 +464,11 @@ def get_element_text(
 
     :return: str
     """
-    return WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.presence_of_element_located(
-            (By.XPATH, xpath))).text
+    return wait_for_xpath(driver, timeout, xpath, 'present', ignored_exceptions).text
 
 
 @ignore_exceptions
+@instrumented
 def get_element_attribute(
         driver: WebDriver,
         timeout: float,
@@ -229,12 +487,11 @@ def get_element_attribute(
 
     :return: str
     """
-    return WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.presence_of_element_located(
-            (By.XPATH, xpath))).get_attribute(attribute)
+    return wait_for_xpath(driver, timeout, xpath, 'present', ignored_exceptions).get_attribute(attribute)
 
 
 @ignore_exceptions
+@instrumented
 def get_element(
         driver: WebDriver,
         timeout: float,
@@ -253,15 +510,12 @@ def get_element(
 
     :return: WebElement
     """
-    if visible:
-        condition = EC.visibility_of_element_located((By.XPATH, xpath))
-    else:
-        condition = EC.presence_of_element_located((By.XPATH, xpath))
-
-    return WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(condition)
+    state = 'visible' if visible else 'present'
+    return wait_for_xpath(driver, timeout, xpath, state, ignored_exceptions)
 
 
 @ignore_exceptions
+@instrumented
 def get_elements(
         driver: WebDriver,
         timeout: float,
@@ -280,21 +534,74 @@ def get_elements(
 
     :return: list[WebElement]
     """
-    if visible:
-        condition = EC.visibility_of_all_elements_located((By.XPATH, xpath))
-    else:
-        condition = EC.presence_of_all_elements_located((By.XPATH, xpath))
+    state = 'all_visible' if visible else 'all_present'
+    return wait_for_xpath(driver, timeout, xpath, state, ignored_exceptions)
+
+
+def _extract_elements(xpath: XPATH, attributes: Optional[list[str]], visible: bool):
+    def _predicate(driver: WebDriver):
+        return driver.execute_script(EXTRACT_ELEMENTS, xpath, attributes, visible)
 
-    return WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(condition)
+    return _predicate
 
 
 @ignore_exceptions
-def wait_for_invisibility(
+@instrumented
+def get_elements_text(
         driver: WebDriver,
         timeout: float,
         xpath: XPATH,
+        visible: bool = True,
         *,
         ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> list[str]:
+    """
+    Returns texts of elements in browser. Elements are found and read in a single script call
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param visible: Whether elements should be visible
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: list[str]
+    """
+    return wait_until(driver, timeout, _extract_elements(xpath, None, visible), ignored_exceptions)
+
+
+@ignore_exceptions
+@instrumented
+def get_elements_attributes(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        attributes: Iterable[str],
+        visible: bool = True,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> list[dict[str, Optional[str]]]:
+    """
+    Returns attributes of elements in browser. Elements are found and read in a single script call
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param attributes: Names of attributes of the elements
+    :param visible: Whether elements should be visible
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: list[dict[str, Optional[str]]]
+    """
+    return wait_until(driver, timeout, _extract_elements(xpath, list(attributes), visible), ignored_exceptions)
+
+
+@ignore_exceptions
+@instrumented
+def wait_for_invisibility(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None,
+        settle: Optional[SettlePolicy] = None
 ) -> None:
     """
     Wait for element's invisibility in browser
@@ -302,22 +609,23 @@ def wait_for_invisibility(
     :param timeout: Number of seconds before timing out
     :param xpath: XPATH of an element
     :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+    :param settle: A policy of settling the document after the element became invisible. If None, doesn't wait
 
     :return: None
     """
-    WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.invisibility_of_element_located(
-            (By.XPATH, xpath)))
-    time.sleep(1)
+    wait_for_xpath(driver, timeout, xpath, 'invisible', ignored_exceptions)
+
+    if settle:
+        wait_for_settle(driver, timeout, settle)
 
 
-@ignore_exceptions
 def wait_for_windows(
         driver: WebDriver,
         timeout: float,
         number: int,
         *,
-        ignored_exceptions: Optional[IgnoredExceptions] = None
+        ignored_exceptions: Optional[IgnoredExceptions] = None,
+        settle: Optional[SettlePolicy] = None
 ) -> None:
     """
     Wait for occurring of number of windows
@@ -325,14 +633,57 @@ def wait_for_windows(
     :param timeout: Number of seconds before timing out
     :param number: Number of windows to be waited
     :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+    :param settle: A policy of settling the document of the last opened window. If None, doesn't wait
 
     :return: None
     """
-    WebDriverWait(driver, timeout, ignored_exceptions=ignored_exceptions).until(
-        EC.number_of_windows_to_be(number))
-    time.sleep(1)
+    _wait_for_windows(driver, timeout, number, ignored_exceptions=ignored_exceptions, settle=settle)
+
+
+@ignore_exceptions
+def _wait_for_windows(
+        driver: WebDriver,
+        timeout: float,
+        number: int,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None,
+        settle: Optional[SettlePolicy] = None
+) -> Optional[bool]:
+    # Returns whether the last window was settled by switching to it, which leaves the current frame, so that
+    # performers tracking the frame know it
+    with recording('wait_for_windows', driver):
+        if tracker := get_window_tracker(driver):
+            tracker.wait(lambda handles: len(handles) == number, timeout)
+        else:
+            wait_until(driver, timeout, EC.number_of_windows_to_be(number), ignored_exceptions)
+
+        return _settle_last_window(driver, timeout, settle) if settle else False
 
 
+def _last_window_handle(driver: WebDriver) -> str:
+    tracker = get_window_tracker(driver)
+    return (tracker.handles if tracker else driver.window_handles)[-1]
+
+
+def _settle_last_window(driver: WebDriver, timeout: float, settle: SettlePolicy) -> bool:
+    # Returns whether the window was switched, so the frame of the original window was left
+    original_window_handle = driver.current_window_handle
+    last_window_handle = _last_window_handle(driver)
+
+    if last_window_handle == original_window_handle:
+        wait_for_settle(driver, timeout, settle)
+        return False
+
+    driver.switch_to.window(last_window_handle)
+    try:
+        wait_for_settle(driver, timeout, settle)
+    finally:
+        driver.switch_to.window(original_window_handle)
+
+    return True
+
+
+@instrumented
 def close_tabs(driver: WebDriver) -> None:
     """
     Closes all tabs in browser
@@ -341,6 +692,15 @@ def close_tabs(driver: WebDriver) -> None:
     :return: None
     """
     original_window_handle = driver.current_window_handle
+
+    # Tracker closes windows without switching to them, so the current window of chromedriver stays the same
+    if tracker := get_window_tracker(driver):
+        closed_windows = [window for window in tracker.handles if window != original_window_handle]
+        for window in closed_windows:
+            tracker.close_window(window)
+        tracker.wait(lambda handles: not set(closed_windows) & set(handles), CLOSE_TIMEOUT)
+        return
+
     windows = driver.window_handles
     for window in windows:
         if original_window_handle != window:
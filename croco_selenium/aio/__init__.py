@@ -0,0 +1,16 @@
+"""
+Awaitable counterparts of croco-selenium actions, ActionPerformer and decorators. WebDriver commands are run in the
+default executor and waits are awaitable sleeps, so one event loop can drive many browsers.
+
+Usage example:
+   >>> import asyncio
+   >>> from croco_selenium import ChromeDriver
+   >>> from croco_selenium.aio import AsyncActionPerformer
+   >>> driver = ChromeDriver()
+   >>> action_performer = AsyncActionPerformer(driver)
+   >>> asyncio.run(action_performer.click(10, '//input[@type="submit"]'))
+"""
+
+from .actions import *
+from .action_performer import AsyncActionPerformer
+from .decorators import *
@@ -0,0 +1,494 @@
+from contextlib import asynccontextmanager
+from typing import Optional, Iterable, AsyncIterator
+from selenium.webdriver.remote.webelement import WebElement
+from ..types import XPATH, IgnoredExceptions, Cookies, SettlePolicy, SessionState, ActionHook, Readiness
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from .actions import *
+from .actions import _wait_for_windows
+from ..instrumentation import add_hook, remove_hook
+from ..deadline import Deadline
+from .utils import run
+
+
+class AsyncActionPerformer:
+    """The class performing awaitable actions in specified driver, such as clicking, sending keys etc"""
+    def __init__(self, driver: WebDriver, settle: Optional[SettlePolicy] = None):
+        """
+        :param driver: A driver to be interacted
+        :param settle: A policy of settling the document after wait_for_invisibility and wait_for_windows. If None,
+                       they return as soon as the condition is met
+        """
+        self.__targeted_driver = driver
+        self.__settle = settle
+        self.__frame_path: tuple[XPATH, ...] = ()
+        self.__frame_contexts: list[tuple[XPATH, ...]] = []
+
+    def add_hook(self, hook: ActionHook) -> None:
+        """
+        Adds a hook called with an event after every action performed in the driver
+        :param hook: A callable taking ActionEvent
+        :return: None
+        """
+        add_hook(hook, self.__targeted_driver)
+
+    def remove_hook(self, hook: ActionHook) -> None:
+        """
+        Removes a hook added by add_hook
+        :param hook: A callable taking ActionEvent
+        :return: None
+        """
+        remove_hook(hook, self.__targeted_driver)
+
+    def deadline(self, seconds: float) -> Deadline:
+        """
+        Creates a time budget of a flow. Inside its context every action and decorator waits at most the time left and
+        fails with DeadlineExceeded once the budget is spent
+        :param seconds: Number of seconds the flow may take
+        :return: Deadline
+        """
+        return Deadline(seconds)
+
+    async def add_cookies(self, cookies: Cookies, bulk: bool = False) -> None:
+        """
+        Adds cookies to browser
+        :param cookies: List of dictionaries or dictionary containing cookies
+        :param bulk: If true, all cookies are set in a single DevTools command. They may belong to any domain, so the
+                     page doesn't have to be opened
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await add_cookies(driver, cookies, bulk)
+
+    async def export_cookies(self, path: str) -> None:
+        """
+        Saves cookies of all domains to a file
+        :param path: A path of the file
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await export_cookies(driver, path)
+
+    async def import_cookies(self, path: str) -> None:
+        """
+        Adds cookies saved by export_cookies in a single DevTools command
+        :param path: A path of the file
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await import_cookies(driver, path)
+
+    async def snapshot_state(self, state: Optional[SessionState] = None) -> SessionState:
+        """
+        Captures cookies of all domains, localStorage and sessionStorage of a current page. The state is serializable
+        by json, so it can be saved and restored by restore_state in another driver
+        :param state: A state captured on another page to be extended by storage of the current page
+        :return: SessionState
+        """
+        driver = self.__targeted_driver
+        return await snapshot_state(driver, state)
+
+    async def restore_state(self, state: SessionState) -> None:
+        """
+        Restores a state captured by snapshot_state. Cookies are set at once, and storage of an origin is restored
+        when a page of the origin is opened in the current tab
+        :param state: A state to be restored
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await restore_state(driver, state)
+
+    async def load_page(
+            self,
+            timeout: float,
+            url: str,
+            ready: Optional[Readiness] = None,
+            *,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> None:
+        """
+        Opens a page and waits until it's ready. With eager or none page load strategy of the driver, the page is
+        considered ready as soon as the conditions are met, not when all its resources are loaded
+        :param timeout: Number of seconds before timing out
+        :param url: An URL of the page
+        :param ready: Conditions of readiness. It has three keys:
+                      xpath - XPATH of an element, which has to be present
+                      dom_content_loaded - whether DOMContentLoaded has to be fired
+                      resource_quiet - number of seconds no resource of the page has to finish loading for. Requests
+                                       still in flight aren't seen, so it's not a network idle
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await load_page(driver, timeout, url, ready, ignored_exceptions=ignored_exceptions)
+        self.__frame_path = ()
+
+    async def switch_to_another_window(self, timeout: float) -> None:
+        """
+        Switches to a different window from current window in browser
+        :param timeout: Number of seconds before timing out
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await switch_to_another_window(driver, timeout)
+        self.__frame_path = ()
+
+    async def switch_to_frame(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            *,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> None:
+        """
+        Switches to the frame
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        if await switch_to_frame(driver, timeout, xpath, ignored_exceptions=ignored_exceptions):
+            self.__frame_path += (xpath,)
+
+    async def switch_to_parent_frame(
+            self
+    ) -> None:
+        """
+        Switches to the parent frame
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await switch_to_parent_frame(driver)
+        self.__frame_path = self.__frame_path[:-1]
+
+    @asynccontextmanager
+    async def frame(self, timeout: float, *xpaths: XPATH) -> AsyncIterator[None]:
+        """
+        Switches to a frame and restores the previous frame on exit. Frames are switched only if they differ from the
+        current ones, so entering the current frame costs no commands
+        :param timeout: Number of seconds before timing out
+        :param xpaths: XPATHs of nested frames relative to the frame of the enclosing context or to the document
+
+        :return: AsyncIterator[None]
+        """
+        previous_path = self.__frame_path
+        path = (self.__frame_contexts[-1] if self.__frame_contexts else ()) + xpaths
+
+        try:
+            await self.__move_to_frame(timeout, path)
+        except BaseException:
+            # Frames entered before the failure are left, so callers catching the error stay in their frame
+            await self.__move_to_frame(timeout, previous_path)
+            raise
+        self.__frame_contexts.append(path)
+
+        try:
+            yield
+        finally:
+            self.__frame_contexts.pop()
+            await self.__move_to_frame(timeout, previous_path)
+
+    async def send_keys(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            text: str,
+            ignored_exceptions: Optional[IgnoredExceptions] = None,
+            cleared: bool = True
+    ) -> None:
+        """
+        Sends keys in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param text: Text to send
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+        :param cleared: If true, field clears before be interacted
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await send_keys(driver, timeout, xpath, text, cleared, ignored_exceptions=ignored_exceptions)
+
+    async def silent_send_keys(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            text: str,
+            ignored_exceptions: Optional[IgnoredExceptions] = None,
+            cleared: bool = True,
+            min_delay: float = 0.07,
+            max_delay: float = 0.14,
+            batched: bool = False
+    ) -> None:
+        """
+        Sends keys with delay between characters in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param text: Text to send
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+        :param cleared: If true, field clears before be interacted
+        :param min_delay: Minimum delay between sending a character
+        :param max_delay: Maximum delay between sending a character
+        :param batched: If true, all keystrokes and delays are sent in a single request of actions instead of a request
+                        per character
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await silent_send_keys(
+            driver,
+            timeout,
+            xpath,
+            text,
+            cleared,
+            min_delay,
+            max_delay,
+            batched,
+            ignored_exceptions=ignored_exceptions
+        )
+
+    async def fill_form(
+            self,
+            timeout: float,
+            fields: dict[XPATH, str],
+            ignored_exceptions: Optional[IgnoredExceptions] = None,
+            cleared: bool = True,
+            keystrokes: Iterable[XPATH] = ()
+    ) -> None:
+        """
+        Fills fields of a form in browser. Fields are awaited together, then values are set and input and change events
+        are fired in a single script call. Fields, which value can't be set by script, get real keystrokes. Hidden and
+        file inputs only have to be present, other fields have to be clickable
+        :param timeout: Number of seconds before timing out
+        :param fields: Dictionary of XPATHs of fields and texts to be filled in
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+        :param cleared: If true, fields clear before be interacted
+        :param keystrokes: XPATHs of fields, which get real keystrokes anyway, e.g. fields listening to key events
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await fill_form(driver, timeout, fields, cleared, keystrokes, ignored_exceptions=ignored_exceptions)
+
+    async def click(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> None:
+        """
+        Clicks on element in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await click(driver, timeout, xpath, ignored_exceptions=ignored_exceptions)
+
+    async def get_element_text(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> str:
+        """
+        Gets element's text in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: str
+        """
+        driver = self.__targeted_driver
+        return await get_element_text(driver, timeout, xpath, ignored_exceptions=ignored_exceptions)
+
+    async def get_element_attribute(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            attribute: str,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> str:
+        """
+        Gets element's attribute in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param attribute: Name of an attribute of the element
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: str
+        """
+        driver = self.__targeted_driver
+        return await get_element_attribute(
+            driver,
+            timeout,
+            xpath,
+            attribute,
+            ignored_exceptions=ignored_exceptions
+        )
+
+    async def get_element(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            visible: bool = True,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> WebElement:
+        """
+        Gets element in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param visible: Whether element should be visible
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: WebElement
+        """
+        driver = self.__targeted_driver
+        return await get_element(driver, timeout, xpath, visible, ignored_exceptions=ignored_exceptions)
+
+    async def get_elements(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            visible: bool = True,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> list[WebElement]:
+        """
+        Gets elements in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param visible: Whether element should be visible
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: list[WebElement]
+        """
+        driver = self.__targeted_driver
+        return await get_elements(driver, timeout, xpath, visible, ignored_exceptions=ignored_exceptions)
+
+    async def get_elements_text(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            visible: bool = True,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> list[str]:
+        """
+        Gets texts of elements in browser in a single script call
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param visible: Whether elements should be visible
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: list[str]
+        """
+        driver = self.__targeted_driver
+        return await get_elements_text(driver, timeout, xpath, visible, ignored_exceptions=ignored_exceptions)
+
+    async def get_elements_attributes(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            attributes: Iterable[str],
+            visible: bool = True,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> list[dict[str, Optional[str]]]:
+        """
+        Gets attributes of elements in browser in a single script call
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param attributes: Names of attributes of the elements
+        :param visible: Whether elements should be visible
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: list[dict[str, Optional[str]]]
+        """
+        driver = self.__targeted_driver
+        return await get_elements_attributes(
+            driver,
+            timeout,
+            xpath,
+            attributes,
+            visible,
+            ignored_exceptions=ignored_exceptions
+        )
+
+    async def wait_for_invisibility(
+            self,
+            timeout: float,
+            xpath: XPATH,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> None:
+        """
+        Wait for element's invisibility in browser
+        :param timeout: Number of seconds before timing out
+        :param xpath: XPATH of an element
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await wait_for_invisibility(
+            driver,
+            timeout,
+            xpath,
+            ignored_exceptions=ignored_exceptions,
+            settle=self.__settle
+        )
+
+    async def wait_for_windows(
+            self,
+            timeout: float,
+            number: int,
+            *,
+            ignored_exceptions: Optional[IgnoredExceptions] = None
+    ) -> None:
+        """
+        Wait for occurring of number of windows
+        :param timeout: Number of seconds before timing out
+        :param number: Number of windows to be waited
+        :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+
+        switched = await _wait_for_windows(
+            driver, timeout, number, ignored_exceptions=ignored_exceptions, settle=self.__settle
+        )
+        if switched:
+            self.__frame_path = ()
+
+    async def close_tabs(self) -> None:
+        """
+        Closes all tabs in browser
+
+        :return: None
+        """
+        driver = self.__targeted_driver
+        await close_tabs(driver)
+        self.__frame_path = ()
+
+    async def __move_to_frame(self, timeout: float, path: tuple[XPATH, ...]) -> None:
+        driver = self.__targeted_driver
+
+        common = 0
+        while common < min(len(path), len(self.__frame_path)) and path[common] == self.__frame_path[common]:
+            common += 1
+
+        if common < len(self.__frame_path):
+            # Leaving frames is a single command, if the document is their common ancestor
+            if common:
+                for _ in range(len(self.__frame_path) - common):
+                    await switch_to_parent_frame(driver)
+            else:
+                await run(driver.switch_to.default_content)
+            self.__frame_path = self.__frame_path[:common]
+
+        for xpath in path[common:]:
+            await switch_to_frame(driver, timeout, xpath)
+            self.__frame_path += (xpath,)
@@ -0,0 +1,614 @@
+import json
+import time
+import random
+import asyncio
+from typing import Optional, Iterable
+from selenium.common import NoSuchWindowException, JavascriptException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from ..types import XPATH, IgnoredExceptions, Cookies, SettlePolicy, SessionState, Readiness
+from .. import actions
+from ..actions import _extract_elements, _last_window_handle, _batched_silent_type, _to_cdp_cookie
+from ..actions import _fill_form, _prepare_form
+from .._scripts import MARK_UNLOADING, IS_NAVIGATED
+from .._window_trackers import get_window_tracker
+from ..instrumentation import instrumented, recording
+from .utils import ignore_exceptions, wait_until, wait_for_settle, wait_for_ready, run
+
+__all__ = [
+    'add_cookies',
+    'export_cookies',
+    'import_cookies',
+    'snapshot_state',
+    'restore_state',
+    'load_page',
+    'switch_to_another_window',
+    'switch_to_parent_frame',
+    'switch_to_frame',
+    'send_keys',
+    'silent_send_keys',
+    'fill_form',
+    'click',
+    'get_elements',
+    'get_elements_text',
+    'get_elements_attributes',
+    'get_element',
+    'get_element_text',
+    'get_element_attribute',
+    'wait_for_invisibility',
+    'wait_for_windows',
+    'close_tabs'
+]
+
+
+@instrumented
+async def add_cookies(driver: WebDriver, cookies: Cookies, bulk: bool = False) -> None:
+    """
+    Adds cookies to a current page
+    :param driver: A driver to be interacted
+    :param cookies: List of dictionaries or dictionary containing cookies
+    :param bulk: If true, all cookies are set in a single DevTools command. They may belong to any domain, so the page
+                 doesn't have to be opened
+    :return: None
+    """
+    cookies = json.loads(cookies) if isinstance(cookies, str) else cookies
+    cookies = cookies if isinstance(cookies, list) else [cookies]
+    cookies = [cookie for cookie in cookies if 'domain' in cookie]
+
+    if bulk:
+        cdp_cookies = [_to_cdp_cookie(cookie) for cookie in cookies]
+        await run(driver.execute_cdp_cmd, 'Network.setCookies', {'cookies': cdp_cookies})
+    else:
+        for cookie in cookies:
+            await run(driver.add_cookie, cookie)
+
+
+@instrumented
+async def export_cookies(driver: WebDriver, path: str) -> None:
+    """
+    Saves cookies of all domains to a file
+    :param driver: A driver to be interacted
+    :param path: A path of the file
+    :return: None
+    """
+    await run(actions.export_cookies, driver, path)
+
+
+@instrumented
+async def import_cookies(driver: WebDriver, path: str) -> None:
+    """
+    Adds cookies saved by export_cookies in a single DevTools command
+    :param driver: A driver to be interacted
+    :param path: A path of the file
+    :return: None
+    """
+    await run(actions.import_cookies, driver, path)
+
+
+@instrumented
+async def snapshot_state(driver: WebDriver, state: Optional[SessionState] = None) -> SessionState:
+    """
+    Captures cookies of all domains, localStorage and sessionStorage of a current page. The state is serializable by
+    json, so it can be saved and restored by restore_state in another driver
+    :param driver: A driver to be interacted
+    :param state: A state captured on another page to be extended by storage of the current page
+    :return: SessionState
+    """
+    return await run(actions.snapshot_state, driver, state)
+
+
+@instrumented
+async def restore_state(driver: WebDriver, state: SessionState) -> None:
+    """
+    Restores a state captured by snapshot_state. Cookies are set at once, and storage of an origin is restored when
+    a page of the origin is opened in the current tab, before scripts of the page are run
+    :param driver: A driver to be interacted
+    :param state: A state to be restored
+    :return: None
+    """
+    await run(actions.restore_state, driver, state)
+
+
+@ignore_exceptions
+@instrumented
+async def load_page(
+        driver: WebDriver,
+        timeout: float,
+        url: str,
+        ready: Optional[Readiness] = None,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> None:
+    """
+    Opens a page and waits until it's ready. With eager or none page load strategy of the driver, the page is
+    considered ready as soon as the conditions are met, not when all its resources are loaded
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param url: An URL of the page
+    :param ready: Conditions of readiness. It has three keys:
+                  xpath - XPATH of an element, which has to be present
+                  dom_content_loaded - whether DOMContentLoaded has to be fired
+                  resource_quiet - number of seconds no resource of the page has to finish loading for. Requests
+                                   still in flight aren't seen, so it's not a network idle
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignored exception
+
+    :return: None
+    """
+    end_time = time.monotonic() + timeout
+    # With page load strategy none navigation isn't awaited, so the previous document is marked to be told apart
+    navigating = ready and driver.caps.get('pageLoadStrategy') == 'none'
+
+    if navigating:
+        await run(driver.execute_script, MARK_UNLOADING)
+    await run(driver.get, url)
+
+    if not ready:
+        return
+    if navigating:
+        # Script fails while the previous document is being unloaded
+        remaining = max(end_time - time.monotonic(), 0)
+        await wait_until(driver, remaining, lambda d: d.execute_script(IS_NAVIGATED), JavascriptException)
+    await wait_for_ready(driver, max(end_time - time.monotonic(), 0), ready)
+
+
+@instrumented
+async def switch_to_another_window(driver: WebDriver, timeout: float) -> None:
+    """
+    Switches to a different window from current window in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+
+    :return: None
+    """
+    original_window_handle = await run(getattr, driver, 'current_window_handle')
+
+    if tracker := get_window_tracker(driver):
+        window_handle = await tracker.wait_async(
+            lambda handles: next((handle for handle in handles if handle != original_window_handle), None),
+            timeout
+        )
+        await _switch_to_window(driver, window_handle, timeout)
+        return
+
+    if len(await run(getattr, driver, 'window_handles')) < 2:
+        await wait_until(driver, timeout, EC.number_of_windows_to_be(2))
+
+    for window_handle in await run(getattr, driver, 'window_handles'):
+        if window_handle != original_window_handle:
+            await run(driver.switch_to.window, window_handle)
+            break
+
+
+async def _switch_to_window(driver: WebDriver, window_handle: str, timeout: float) -> None:
+    # Window tracker may learn about a new window a bit earlier than chromedriver
+    await wait_until(driver, timeout, lambda d: d.switch_to.window(window_handle) or True, NoSuchWindowException)
+
+
+@ignore_exceptions
+@instrumented
+async def switch_to_frame(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> Optional[bool]:
+    """
+    Switches to the frame
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: True if switched, None if an ignored exception occurred
+    """
+    return await wait_until(
+        driver,
+        timeout,
+        EC.frame_to_be_available_and_switch_to_it((By.XPATH, xpath)),
+        ignored_exceptions
+    )
+
+
+@instrumented
+async def switch_to_parent_frame(
+        driver: WebDriver
+) -> None:
+    """
+    Switches to the parent frame
+    :param driver: A driver to be interacted
+    :return: None
+    """
+    await run(driver.switch_to.parent_frame)
+
+
+@ignore_exceptions
+@instrumented
+async def send_keys(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        text: str,
+        cleared: bool = True,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> None:
+    """
+    Sends keys in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param text: Text to send
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+    :param cleared: If true, field clears before be interacted
+
+    :return: None
+    """
+    element = await wait_until(driver, timeout, EC.element_to_be_clickable((By.XPATH, xpath)), ignored_exceptions)
+
+    if cleared:
+        await run(element.clear)
+
+    await run(element.send_keys, text)
+
+
+@ignore_exceptions
+@instrumented
+async def silent_send_keys(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        text: str,
+        cleared: bool = True,
+        min_delay: float = 0.07,
+        max_delay: float = 0.14,
+        batched: bool = False,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> None:
+    """
+    Sends keys with delay between characters in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param text: Text to send
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+    :param cleared: If true, field clears before be interacted
+    :param min_delay: Minimum delay between sending a character
+    :param max_delay: Maximum delay between sending a character
+    :param batched: If true, all keystrokes and delays are sent in a single request of actions instead of a request
+                    per character
+
+    :return: None
+    """
+    element = await wait_until(driver, timeout, EC.element_to_be_clickable((By.XPATH, xpath)), ignored_exceptions)
+
+    if cleared:
+        await run(element.clear)
+
+    if batched:
+        await run(_batched_silent_type, element, text, min_delay, max_delay)
+        return
+
+    for char in text:
+        await run(element.send_keys, char)
+        delay = random.uniform(min_delay, max_delay)
+        await asyncio.sleep(delay)
+
+
+@ignore_exceptions
+@instrumented
+async def fill_form(
+        driver: WebDriver,
+        timeout: float,
+        fields: dict[XPATH, str],
+        cleared: bool = True,
+        keystrokes: Iterable[XPATH] = (),
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> None:
+    """
+    Fills fields of a form in browser. Fields are awaited together, then values are set and input and change events are
+    fired in a single script call. Fields, which value can't be set by script, e.g. file inputs or contenteditable
+    elements, get real keystrokes. Hidden and file inputs only have to be present, other fields have to be clickable
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param fields: Dictionary of XPATHs of fields and texts to be filled in
+    :param cleared: If true, fields clear before be interacted
+    :param keystrokes: XPATHs of fields, which get real keystrokes anyway, e.g. fields listening to key events
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: None
+    """
+    fields, keystrokes = _prepare_form(fields, keystrokes)
+    filled = await wait_until(driver, timeout, _fill_form(fields, cleared, keystrokes), ignored_exceptions)
+
+    # File inputs are cleared by the script, so the driver doesn't touch them while they are hidden
+    for index, element, clears in filled['typed']:
+        if clears:
+            await run(element.clear)
+
+        await run(element.send_keys, fields[index][1])
+
+
+@ignore_exceptions
+@instrumented
+async def click(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> None:
+    """
+    Clicks on element in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: None
+    """
+    element = await wait_until(driver, timeout, EC.element_to_be_clickable((By.XPATH, xpath)), ignored_exceptions)
+    await run(element.click)
+
+
+@ignore_exceptions
+@instrumented
+async def get_element_text(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> str:
+    """
+    Returns element's text in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: str
+    """
+    element = await wait_until(driver, timeout, EC.presence_of_element_located((By.XPATH, xpath)), ignored_exceptions)
+    return await run(getattr, element, 'text')
+
+
+@ignore_exceptions
+@instrumented
+async def get_element_attribute(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        attribute: str,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> str:
+    """
+    Returns an element's attribute in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param attribute: Name of an attribute of the element
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: str
+    """
+    element = await wait_until(driver, timeout, EC.presence_of_element_located((By.XPATH, xpath)), ignored_exceptions)
+    return await run(element.get_attribute, attribute)
+
+
+@ignore_exceptions
+@instrumented
+async def get_element(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        visible: bool = True,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> WebElement:
+    """
+    Returns an element in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param visible: Whether element should be visible
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: WebElement
+    """
+    if visible:
+        condition = EC.visibility_of_element_located((By.XPATH, xpath))
+    else:
+        condition = EC.presence_of_element_located((By.XPATH, xpath))
+
+    return await wait_until(driver, timeout, condition, ignored_exceptions)
+
+
+@ignore_exceptions
+@instrumented
+async def get_elements(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        visible: bool = True,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> list[WebElement]:
+    """
+    Returns elements in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param visible: Whether element should be visible
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: list[WebElement]
+    """
+    if visible:
+        condition = EC.visibility_of_all_elements_located((By.XPATH, xpath))
+    else:
+        condition = EC.presence_of_all_elements_located((By.XPATH, xpath))
+
+    return await wait_until(driver, timeout, condition, ignored_exceptions)
+
+
+@ignore_exceptions
+@instrumented
+async def get_elements_text(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        visible: bool = True,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> list[str]:
+    """
+    Returns texts of elements in browser. Elements are found and read in a single script call
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param visible: Whether elements should be visible
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: list[str]
+    """
+    return await wait_until(driver, timeout, _extract_elements(xpath, None, visible), ignored_exceptions)
+
+
+@ignore_exceptions
+@instrumented
+async def get_elements_attributes(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        attributes: Iterable[str],
+        visible: bool = True,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> list[dict[str, Optional[str]]]:
+    """
+    Returns attributes of elements in browser. Elements are found and read in a single script call
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param attributes: Names of attributes of the elements
+    :param visible: Whether elements should be visible
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: list[dict[str, Optional[str]]]
+    """
+    return await wait_until(driver, timeout, _extract_elements(xpath, list(attributes), visible), ignored_exceptions)
+
+
+@ignore_exceptions
+@instrumented
+async def wait_for_invisibility(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None,
+        settle: Optional[SettlePolicy] = None
+) -> None:
+    """
+    Wait for element's invisibility in browser
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+    :param settle: A policy of settling the document after the element became invisible. If None, doesn't wait
+
+    :return: None
+    """
+    await wait_until(driver, timeout, EC.invisibility_of_element_located((By.XPATH, xpath)), ignored_exceptions)
+
+    if settle:
+        await wait_for_settle(driver, timeout, settle)
+
+
+async def wait_for_windows(
+        driver: WebDriver,
+        timeout: float,
+        number: int,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None,
+        settle: Optional[SettlePolicy] = None
+) -> None:
+    """
+    Wait for occurring of number of windows
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param number: Number of windows to be waited
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+    :param settle: A policy of settling the document of the last opened window. If None, doesn't wait
+
+    :return: None
+    """
+    await _wait_for_windows(driver, timeout, number, ignored_exceptions=ignored_exceptions, settle=settle)
+
+
+@ignore_exceptions
+async def _wait_for_windows(
+        driver: WebDriver,
+        timeout: float,
+        number: int,
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None,
+        settle: Optional[SettlePolicy] = None
+) -> Optional[bool]:
+    # Returns whether the last window was settled by switching to it, which leaves the current frame
+    with recording('wait_for_windows', driver):
+        if tracker := get_window_tracker(driver):
+            await tracker.wait_async(lambda handles: len(handles) == number, timeout)
+        else:
+            await wait_until(driver, timeout, EC.number_of_windows_to_be(number), ignored_exceptions)
+
+        return await _settle_last_window(driver, timeout, settle) if settle else False
+
+
+async def _settle_last_window(driver: WebDriver, timeout: float, settle: SettlePolicy) -> bool:
+    original_window_handle = await run(lambda: driver.current_window_handle)
+    last_window_handle = await run(_last_window_handle, driver)
+
+    if last_window_handle == original_window_handle:
+        await wait_for_settle(driver, timeout, settle)
+        return False
+
+    await run(driver.switch_to.window, last_window_handle)
+    try:
+        await wait_for_settle(driver, timeout, settle)
+    finally:
+        await run(driver.switch_to.window, original_window_handle)
+
+    return True
+
+
+@instrumented
+async def close_tabs(driver: WebDriver) -> None:
+    """
+    Closes all tabs in browser
+    :param driver: A driver to be interacted
+
+    :return: None
+    """
+    original_window_handle = await run(getattr, driver, 'current_window_handle')
+
+    # Tracker closes windows without switching to them, so the current window of chromedriver stays the same
+    if tracker := get_window_tracker(driver):
+        closed_windows = [window for window in tracker.handles if window != original_window_handle]
+        for window in closed_windows:
+            await run(tracker.close_window, window)
+        await tracker.wait_async(lambda handles: not set(closed_windows) & set(handles), actions.CLOSE_TIMEOUT)
+        return
+
+    windows = await run(getattr, driver, 'window_handles')
+    for window in windows:
+        if original_window_handle != window:
+            await run(driver.switch_to.window, window)
+            await run(driver.close)
+    await run(driver.switch_to.window, original_window_handle)
@@ -0,0 +1,142 @@
+from functools import wraps
+from typing import Callable, Any, TYPE_CHECKING
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from ..decorators import _get_driver
+from ..types import MethodType
+from .actions import switch_to_another_window, _switch_to_window
+from .._window_trackers import get_window_tracker
+from .utils import wait_until, run
+
+if TYPE_CHECKING:
+    from ..window_tracker import WindowTracker
+
+__all__ = [
+    'handle_pop_up',
+    'handle_new_tab',
+    'handle_in_new_tab'
+]
+
+
+def handle_pop_up(
+        func: Callable = None,
+        *,
+        method_type: MethodType = 'instance',
+        timeout: float = 15
+) -> Callable:
+    """
+    Switches to another window, awaits decorated coroutine function and switches back. Pop up has to be closed after
+    performing decorated function.
+    :param func: Coroutine function to be decorated
+    :param timeout: Number of seconds before timing out
+    :param method_type: Type of method. There are three types:
+                        instance - decorated function has to be instance-method and have attribute 'driver' in `self` namespace
+                        static, function - decorated function has to have driver as first positional argument
+                        class - decorated function has to be @classmethod and have attribute driver in 'cls' namespace
+    """
+    if not callable(func):
+        return lambda f: handle_pop_up(f, method_type=method_type, timeout=timeout)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        driver = _get_driver(method_type, *args)
+
+        if tracker := get_window_tracker(driver):
+            return await _handle_tracked_pop_up(driver, tracker, timeout, func, *args, **kwargs)
+
+        original_window_handle = await run(getattr, driver, 'current_window_handle')
+
+        if handles := kwargs.get('handles'):
+            current_handles = handles
+        else:
+            current_handles = await run(getattr, driver, 'window_handles')
+
+        await wait_until(driver, timeout, EC.new_window_is_opened(current_handles))
+        current_handles = await run(getattr, driver, 'window_handles')
+
+        await switch_to_another_window(driver, timeout)
+        result = await func(*args, **kwargs)
+
+        await wait_until(driver, timeout, EC.number_of_windows_to_be(len(current_handles) - 1))
+        await run(driver.switch_to.window, original_window_handle)
+        return result
+
+    return wrapper
+
+
+async def _handle_tracked_pop_up(
+        driver: WebDriver,
+        tracker: 'WindowTracker',
+        timeout: float,
+        func: Callable,
+        *args,
+        **kwargs
+) -> Any:
+    original_window_handle = await run(getattr, driver, 'current_window_handle')
+    current_handles = kwargs.get('handles') or tracker.handles
+
+    pop_up_handle = await tracker.wait_async(
+        lambda new_handles: next((handle for handle in new_handles if handle not in current_handles), None),
+        timeout
+    )
+    current_handles = tracker.handles
+    await _switch_to_window(driver, pop_up_handle, timeout)
+
+    result = await func(*args, **kwargs)
+
+    await tracker.wait_async(lambda new_handles: len(new_handles) == len(current_handles) - 1, timeout)
+    await run(driver.switch_to.window, original_window_handle)
+    return result
+
+
+def handle_in_new_tab(func: Callable = None, method_type: MethodType = 'instance'):
+    """
+    Opens new tab, awaits decorated coroutine function, closes new tab and switches back
+    :param func: Coroutine function to be decorated
+    :param method_type: Type of method. There are three types:
+                        instance - decorated function has to be instance-method and have attribute 'driver' in `self` namespace
+                        static, function - decorated function has to have driver as first positional argument
+                        class - decorated function has to be @classmethod and have attribute driver in 'cls' namespace
+    """
+    if not callable(func):
+        return lambda f: handle_in_new_tab(f, method_type=method_type)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        driver = _get_driver(method_type, *args)
+
+        current_tab = await run(getattr, driver, 'current_window_handle')
+        await run(driver.switch_to.new_window, 'tab')
+        result = await func(*args, **kwargs)
+        await run(driver.close)
+        await run(driver.switch_to.window, current_tab)
+        return result
+
+    return wrapper
+
+
+def handle_new_tab(func: Callable = None, method_type: MethodType = 'instance'):
+    """
+    Awaits decorated coroutine function in new tab (new tab has to be opened after performing decorated function) and
+    switches back. Decorated function has to open new tab by self.
+    :param func: Coroutine function to be decorated
+    :param method_type: Type of method. There are three types:
+                        instance - decorated function has to be instance-method and have attribute 'driver' in `self` namespace
+                        static, function - decorated function has to have driver as first positional argument
+                        class - decorated function has to be @classmethod and have attribute driver in 'cls' namespace
+    """
+    if not callable(func):
+        return lambda f: handle_new_tab(f, method_type=method_type)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        driver = _get_driver(method_type, *args)
+
+        original_window_handle = await run(getattr, driver, 'current_window_handle')
+        result = await func(*args, **kwargs)
+
+        await run(driver.close)
+        await run(driver.switch_to.window, original_window_handle)
+        return result
+
+    return wrapper
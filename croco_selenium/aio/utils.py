@@ -0,0 +1,183 @@
+import time
+import asyncio
+from functools import wraps
+from typing import Callable, Any, Optional, TypeVar
+from selenium.common import NoSuchElementException, TimeoutException, JavascriptException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from ..types import IgnoredExceptions, SettlePolicy, Readiness
+from ..waits import poll_intervals, OBSERVE_CHUNK, _is_unloaded
+from .._scripts import SETTLE_DOCUMENT, AWAIT_READINESS
+from ..instrumentation import count_poll, waiting
+from ..deadline import honors_deadline
+
+T = TypeVar('T')
+
+
+async def run(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Runs a blocking WebDriver command in the default executor, so that the event loop is not blocked during the command
+    :param func: A callable performing the command
+    :param args: Positional arguments of the callable
+    :param kwargs: Keyword arguments of the callable
+
+    :return: T
+    """
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+@honors_deadline
+async def wait_until(
+        driver: WebDriver,
+        timeout: float,
+        method: Callable[[WebDriver], Any],
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> Any:
+    """
+    Awaitable counterpart of WebDriverWait.until, polling with growing intervals. The event loop is free between polls
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param method: A callable taking the driver and returning a truthy value when the condition is met
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: Any
+    """
+    exceptions = [NoSuchElementException]
+    if ignored_exceptions:
+        try:
+            exceptions.extend(ignored_exceptions)
+        except TypeError:
+            exceptions.append(ignored_exceptions)
+    exceptions = tuple(exceptions)
+
+    screen = None
+    stacktrace = None
+
+    end_time = time.monotonic() + timeout
+    with waiting():
+        for interval in poll_intervals():
+            count_poll()
+            try:
+                value = await run(method, driver)
+                if value:
+                    return value
+            except exceptions as exc:
+                screen = getattr(exc, 'screen', None)
+                stacktrace = getattr(exc, 'stacktrace', None)
+
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+    raise TimeoutException(f'Condition is not met after {timeout} seconds', screen, stacktrace)
+
+
+@honors_deadline
+async def wait_for_settle(
+        driver: WebDriver,
+        timeout: float,
+        policy: SettlePolicy
+) -> None:
+    """
+    Awaitable counterpart of wait_for_settle. The event loop is free between observations of the document
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param policy: A policy of settling. It has two keys:
+                   quiet - number of seconds the document has to stay without mutations
+                   ready_state - whether document.readyState has to be complete
+    :return: None
+    """
+    quiet = int(policy.get('quiet', 0) * 1000)
+    ready_state = policy.get('ready_state', False)
+    intervals = poll_intervals()
+
+    end_time = time.monotonic() + timeout
+    with waiting():
+        while True:
+            remaining = end_time - time.monotonic()
+            count_poll()
+
+            try:
+                chunk = max(min(remaining, OBSERVE_CHUNK), 0)
+                if await run(driver.execute_async_script, SETTLE_DOCUMENT, quiet, ready_state, int(chunk * 1000)):
+                    return
+            except (JavascriptException, TimeoutException) as exc:
+                if isinstance(exc, JavascriptException) and not _is_unloaded(exc):
+                    raise
+                remaining = end_time - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(min(next(intervals), remaining))
+
+            if time.monotonic() >= end_time:
+                break
+
+    raise TimeoutException(f'Document is not settled after {timeout} seconds')
+
+
+@honors_deadline
+async def wait_for_ready(
+        driver: WebDriver,
+        timeout: float,
+        readiness: Readiness
+) -> None:
+    """
+    Awaitable counterpart of wait_for_ready. The event loop is free between observations of the document
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param readiness: Conditions of readiness. It has three keys:
+                      xpath - XPATH of an element, which has to be present
+                      dom_content_loaded - whether DOMContentLoaded has to be fired
+                      resource_quiet - number of seconds no resource of the page has to finish loading for. Requests
+                                       still in flight aren't seen, so it's not a network idle
+    :return: None
+    """
+    dom_content_loaded = readiness.get('dom_content_loaded', False)
+    resource_quiet = readiness.get('resource_quiet')
+    intervals = poll_intervals()
+
+    end_time = time.monotonic() + timeout
+    if dom_content_loaded or resource_quiet is not None:
+        quiet = None if resource_quiet is None else int(resource_quiet * 1000)
+
+        with waiting():
+            while True:
+                remaining = end_time - time.monotonic()
+                count_poll()
+
+                try:
+                    chunk = max(min(remaining, OBSERVE_CHUNK), 0)
+                    if await run(driver.execute_async_script, AWAIT_READINESS, dom_content_loaded, quiet,
+                                 int(chunk * 1000)):
+                        break
+                except (JavascriptException, TimeoutException) as exc:
+                    if isinstance(exc, JavascriptException) and not _is_unloaded(exc):
+                        raise
+                    remaining = end_time - time.monotonic()
+                    if remaining > 0:
+                        await asyncio.sleep(min(next(intervals), remaining))
+
+                if time.monotonic() >= end_time:
+                    raise TimeoutException(f'Page is not ready after {timeout} seconds')
+
+    if xpath := readiness.get('xpath'):
+        condition = EC.presence_of_element_located((By.XPATH, xpath))
+        await wait_until(driver, max(end_time - time.monotonic(), 0), condition)
+
+
+def ignore_exceptions(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        result = None
+        ignored_exceptions = kwargs.get('ignored_exceptions')
+
+        if ignored_exceptions:
+            try:
+                result = await func(*args, **kwargs)
+            except ignored_exceptions:
+                pass
+        else:
+            result = await func(*args, **kwargs)
+
+        return result
+    return wrapper
@@ -1,9 +1,14 @@
-from typing import Optional, Iterable
+from typing import Optional, Iterable, TYPE_CHECKING
 from selenium.webdriver.chrome.webdriver import Options
+from selenium.webdriver.chromium.service import ChromiumService
 from ._croco_driver import CrocoDriver
-from .types import Proxy
+from .types import Proxy, SettlePolicy, BlockingProfile, PageLoadStrategy
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 
+if TYPE_CHECKING:
+    from .profile_template import ProfileTemplate
+    from .connection_pool import ConnectionPool
+
 __all__ = ['ChromeDriver']
 
 
@@ -17,13 +22,42 @@ class ChromeDriver(CrocoDriver):
             options: Options = Options(),
             proxy: Optional[Proxy] = None,
             extension_paths: Optional[Iterable[str]] = None,
-            executable_path: Optional[str] = None
+            executable_path: Optional[str] = None,
+            element_cache_size: int = 0,
+            settle: Optional[SettlePolicy] = None,
+            profile_template: Optional['ProfileTemplate'] = None,
+            service: Optional[ChromiumService] = None,
+            keep_alive: bool = True,
+            connection_pool: Optional['ConnectionPool'] = None,
+            window_tracking: bool = False,
+            blocking_profile: Optional[BlockingProfile] = None,
+            page_load_strategy: Optional[PageLoadStrategy] = None
     ):
         """
         :param options: This takes an instance of ChromiumOptions
         :param proxy: A proxy to be set
         :param extension_paths: An iterable collection of extension paths
         :param executable_path: An executable path of Chrome
+        :param element_cache_size: Maximum number of found elements to be reused by further actions. If 0, elements are
+                                   found on every action
+        :param settle: A policy of settling the document after wait_for_invisibility and wait_for_windows. If None,
+                       they return as soon as the condition is met
+        :param profile_template: A template of user data directory. If provided, the driver uses a copy of it, which is
+                                 removed on quit
+        :param service: A service of chromedriver, e.g. SharedService used by many drivers. If provided, executable_path
+                        is ignored
+        :param keep_alive: Whether connections to chromedriver are kept open between commands
+        :param connection_pool: A pool of connections to chromedriver, which may be shared by many drivers. If
+                                provided, connections are kept open regardless of keep_alive
+        :param window_tracking: If true, opened and closed windows are tracked by events of DevTools protocol, so
+                                actions and decorators waiting for windows don't poll chromedriver
+        :param blocking_profile: Types of resources and URL patterns with wildcards, requests of which are failed in
+                                 all tabs, including pop-ups
+        :param page_load_strategy: When navigation returns. There are three strategies:
+                                   normal - when all resources of the page are loaded
+                                   eager - when DOMContentLoaded is fired
+                                   none - right after the navigation is started
+                                   If None, the strategy of options is used
         """
         super().__init__(
             DesiredCapabilities.CHROME["browserName"],
@@ -31,5 +65,14 @@ class ChromeDriver(CrocoDriver):
             options,
             proxy,
             extension_paths,
-            executable_path
+            executable_path,
+            element_cache_size,
+            settle,
+            profile_template,
+            service,
+            keep_alive,
+            connection_pool,
+            window_tracking,
+            blocking_profile,
+            page_load_strategy
         )
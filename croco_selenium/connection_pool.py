@@ -0,0 +1,81 @@
+from typing import Optional
+import urllib3
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+__all__ = ['ConnectionPool']
+
+
+class _SharedPoolManager(urllib3.PoolManager):
+    # Quitting driver clears connections of its command executor, but the connections are used by other drivers
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        super().clear()
+
+
+class ConnectionPool:
+    """
+    The pool of keep-alive HTTP connections to chromedriver. It's passed to drivers, which send commands through it
+    instead of their own pools. Drivers sharing a chromedriver service also share connections of the pool
+    """
+    def __init__(
+            self,
+            size: int = 10,
+            timeout: Optional[float] = None,
+            connect_timeout: Optional[float] = None,
+            block: bool = False
+    ):
+        """
+        :param size: Maximum number of idle connections kept per chromedriver
+        :param timeout: Number of seconds a command may take. It has to be longer than the longest wait of actions
+                        done by a single command, i.e. 10 seconds. If None, commands never time out
+        :param connect_timeout: Number of seconds a connection may take. If None, timeout is used
+        :param block: If true, no more than size connections are open per chromedriver, and commands wait for a free
+                      connection
+        """
+        self.__timeout = timeout
+        self.__request_timeout = urllib3.Timeout(connect=connect_timeout or timeout, read=timeout)
+        # A pool is kept per chromedriver, so the number of pools is left default, while size limits connections
+        self.__manager = _SharedPoolManager(
+            maxsize=size,
+            block=block,
+            timeout=self.__request_timeout,
+            retries=False
+        )
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """Number of seconds a command may take"""
+        return self.__timeout
+
+    def attach(self, executor: RemoteConnection) -> None:
+        """
+        Makes a command executor of a driver send commands through the pool
+        :param executor: A command executor of a driver
+        :return: None
+        """
+        if own_manager := getattr(executor, '_conn', None):
+            own_manager.clear()
+        executor._conn = self.__manager
+
+        # Since Selenium 4.26 settings are kept in client config, and its timeout is passed to every request, overriding
+        # timeout of the pool. urllib3 accepts Timeout there, so the split of connect and read timeouts is kept
+        if client_config := vars(executor).get('_client_config'):
+            client_config.keep_alive = True
+            client_config.timeout = self.__request_timeout
+        else:
+            executor.keep_alive = True
+
+    def close(self) -> None:
+        """
+        Closes all connections of the pool. Drivers using the pool have to be quit before
+        :return: None
+        """
+        self.__manager.close()
+
+    def __enter__(self) -> 'ConnectionPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,119 @@
+import time
+import inspect
+from functools import wraps
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Callable, Iterator
+from selenium.common import TimeoutException
+from .exceptions import DeadlineExceeded
+
+__all__ = [
+    'Deadline',
+    'current_deadline'
+]
+
+_current_deadline: ContextVar[Optional['Deadline']] = ContextVar('croco_selenium_deadline', default=None)
+
+
+class Deadline:
+    """
+    The time budget of a flow. Inside its context every wait of actions and decorators gets at most the time left, and
+    once the budget is spent, waits fail with DeadlineExceeded instead of waiting for their own timeouts. A nested
+    deadline can't outlast the enclosing one, and entering the same deadline again doesn't renew its budget.
+    WebDriver commands themselves aren't bounded: e.g. driver.get with the normal page load strategy runs until the
+    page load timeout of the driver, even if the budget is spent meanwhile
+    """
+    def __init__(self, seconds: float):
+        """
+        :param seconds: Number of seconds the flow may take
+        """
+        self.__seconds = seconds
+        self.__end_time: Optional[float] = None
+        self.__tokens = []
+
+    @property
+    def seconds(self) -> float:
+        """Number of seconds the flow may take"""
+        return self.__seconds
+
+    @property
+    def remaining(self) -> float:
+        """Number of seconds left. If the deadline isn't entered, the whole budget is left"""
+        if self.__end_time is None:
+            return self.__seconds
+        return max(self.__end_time - time.monotonic(), 0)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is spent"""
+        return self.remaining <= 0
+
+    def __enter__(self) -> 'Deadline':
+        # The budget starts at the first entry, so re-entering the deadline doesn't extend it
+        if self.__end_time is None:
+            end_time = time.monotonic() + self.__seconds
+            if outer := _current_deadline.get():
+                end_time = min(end_time, time.monotonic() + outer.remaining)
+            self.__end_time = end_time
+
+        self.__tokens.append(_current_deadline.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        _current_deadline.reset(self.__tokens.pop())
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    Returns the deadline of the current context
+    :return: Optional[Deadline]
+    """
+    return _current_deadline.get()
+
+
+@contextmanager
+def bounded(timeout: float) -> Iterator[float]:
+    """
+    Bounds a timeout of a wait by the current deadline. A wait, which times out because of the deadline, raises
+    DeadlineExceeded
+    :param timeout: Number of seconds before timing out
+    :return: Iterator[float]
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        yield timeout
+        return
+
+    remaining = deadline.remaining
+    if remaining <= 0:
+        raise DeadlineExceeded(deadline.seconds)
+    if remaining >= timeout:
+        yield timeout
+        return
+
+    try:
+        yield remaining
+    except TimeoutException as exc:
+        raise DeadlineExceeded(deadline.seconds) from exc
+
+
+def honors_deadline(func: Callable) -> Callable:
+    """
+    Bounds the timeout of a wait taking a driver and a timeout as first arguments by the current deadline
+    :param func: A wait to be decorated
+    :return: Callable
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(driver, timeout, *args, **kwargs):
+            with bounded(timeout) as timeout:
+                return await func(driver, timeout, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(driver, timeout, *args, **kwargs):
+        with bounded(timeout) as timeout:
+            return func(driver, timeout, *args, **kwargs)
+
+    return wrapper
@@ -2,8 +2,9 @@ from functools import wraps
 from typing import Callable
 from selenium.webdriver.chrome.webdriver import WebDriver
 from .exceptions import InvalidMethodType
-from .actions import switch_to_another_window
-from selenium.webdriver.support.wait import WebDriverWait
+from .actions import switch_to_another_window, _switch_to_window
+from ._window_trackers import get_window_tracker
+from .waits import wait_until
 from selenium.webdriver.support import expected_conditions as EC
 from .types import MethodType
 
@@ -53,19 +54,32 @@ def handle_pop_up(
         driver = _get_driver(method_type, *args)
 
         original_window_handle = driver.current_window_handle
+        tracker = get_window_tracker(driver)
 
         if handles := kwargs.get('handles'):
             current_handles = handles
         else:
+            current_handles = tracker.handles if tracker else driver.window_handles
+
+        if tracker:
+            pop_up_handle = tracker.wait(
+                lambda new_handles: next((handle for handle in new_handles if handle not in current_handles), None),
+                timeout
+            )
+            current_handles = tracker.handles
+            _switch_to_window(driver, pop_up_handle, timeout)
+        else:
+            wait_until(driver, timeout, EC.new_window_is_opened(current_handles))
             current_handles = driver.window_handles
+            switch_to_another_window(driver, timeout)
 
-        WebDriverWait(driver, timeout).until(EC.new_window_is_opened(current_handles))
-        current_handles = driver.window_handles
-
-        switch_to_another_window(driver, timeout)
         result = func(*args, **kwargs)
 
-        WebDriverWait(driver, timeout).until(EC.number_of_windows_to_be(len(current_handles) - 1))
+        if tracker:
+            tracker.wait(lambda new_handles: len(new_handles) == len(current_handles) - 1, timeout)
+        else:
+            wait_until(driver, timeout, EC.number_of_windows_to_be(len(current_handles) - 1))
+
         driver.switch_to.window(original_window_handle)
         return result
 
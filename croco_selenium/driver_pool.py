@@ -0,0 +1,170 @@
+from queue import Queue, Empty
+from threading import Lock
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Iterator
+from selenium.common import WebDriverException
+from ._croco_driver import CrocoDriver
+from .chrome_driver import ChromeDriver
+from .exceptions import PoolExhausted, PoolClosed
+
+__all__ = ['DriverPool']
+
+
+def _reset_driver(driver: CrocoDriver) -> None:
+    # A new tab is blank and has no scripts added by restore_state
+    driver.switch_to.new_window('tab')
+    driver.close_tabs()
+
+    if driver.element_cache is not None:
+        driver.element_cache.clear()
+
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    # Storage of every origin visited during the lease is cleared, not only of the current page
+    driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': '*', 'storageTypes': 'all'})
+
+
+def _quit(driver: CrocoDriver) -> None:
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
+class DriverPool:
+    """
+    The class keeping warm instances of driver and leasing them out. Leased drivers are reset on return: cookies and
+    storage are cleared and all tabs are replaced by a blank tab
+    """
+    def __init__(
+            self,
+            size: int,
+            factory: Callable[[], CrocoDriver] = ChromeDriver
+    ):
+        """
+        :param size: Number of drivers to be spawned
+        :param factory: A callable creating a new driver
+        """
+        self.__factory = factory
+        self.__idle: Queue[CrocoDriver] = Queue()
+        self.__drivers: list[CrocoDriver] = []
+        self.__lock = Lock()
+        self.__closed = False
+        # Slots of drivers, which couldn't be respawned. They are filled by following leases
+        self.__vacant = 0
+
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(factory) for _ in range(size)]
+
+        try:
+            drivers = [future.result() for future in futures]
+        except BaseException:
+            # Drivers spawned before the failure would keep their browsers running
+            for future in futures:
+                if future.exception() is None:
+                    _quit(future.result())
+            raise
+
+        for driver in drivers:
+            self.__drivers.append(driver)
+            self.__idle.put(driver)
+
+    @property
+    def size(self) -> int:
+        """Number of drivers owned by the pool"""
+        return len(self.__drivers)
+
+    @property
+    def idle(self) -> int:
+        """Number of drivers ready to be leased"""
+        return self.__idle.qsize()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[CrocoDriver]:
+        """
+        Leases a driver from the pool and returns it back after exiting the context
+        :param timeout: Number of seconds before timing out. If None, waits until a driver is returned
+
+        :return: Iterator[CrocoDriver]
+        """
+        if self.__closed:
+            raise PoolClosed()
+
+        with self.__lock:
+            claimed = self.__vacant > 0 and self.__idle.empty()
+            if claimed:
+                self.__vacant -= 1
+
+        if claimed:
+            driver = self.__spawn()
+        else:
+            try:
+                driver = self.__idle.get(timeout=timeout)
+            except Empty:
+                raise PoolExhausted(timeout) from None
+
+        try:
+            yield driver
+        except BaseException as exc:
+            try:
+                self.__release(driver)
+            except Exception as release_exc:
+                # The exception of the caller is raised, and the failure of returning the driver is chained to it
+                raise exc from release_exc
+            raise
+        self.__release(driver)
+
+    def __release(self, driver: CrocoDriver) -> None:
+        if self.__closed:
+            _quit(driver)
+            return
+
+        try:
+            _reset_driver(driver)
+        except WebDriverException:
+            driver = self.__respawn(driver)
+
+        self.__idle.put(driver)
+
+    def __respawn(self, driver: CrocoDriver) -> CrocoDriver:
+        _quit(driver)
+
+        with self.__lock:
+            self.__drivers.remove(driver)
+
+        return self.__spawn()
+
+    def __spawn(self) -> CrocoDriver:
+        try:
+            driver = self.__factory()
+        except BaseException:
+            with self.__lock:
+                self.__vacant += 1
+            raise
+
+        with self.__lock:
+            self.__drivers.append(driver)
+
+        return driver
+
+    def close(self) -> None:
+        """
+        Quits all drivers of the pool. Drivers being leased are quit on return
+
+        :return: None
+        """
+        self.__closed = True
+
+        while True:
+            try:
+                driver = self.__idle.get_nowait()
+            except Empty:
+                break
+
+            _quit(driver)
+
+    def __enter__(self) -> 'DriverPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,128 @@
+from collections import OrderedDict
+from typing import Optional, Callable, Any, Hashable
+from selenium.common import StaleElementReferenceException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from .types import XPATH, XPathState, IgnoredExceptions
+from .utils import ignore_exceptions
+from .waits import wait_for_xpath
+from .instrumentation import recording
+
+__all__ = ['ElementCache']
+
+# States of elements from the weakest to the strictest. Element kept under a state satisfies it and weaker ones
+_STATE_RANKS = {'present': 0, 'visible': 1, 'clickable': 2}
+
+class ElementCache:
+    """The class keeping found elements. When the number of elements exceeds the size, the least recently used is evicted"""
+    def __init__(self, max_size: int = 128):
+        """
+        :param max_size: Maximum number of kept elements
+        """
+        self.__max_size = max_size
+        self.__elements: OrderedDict[Hashable, tuple[WebElement, XPathState]] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of kept elements"""
+        return self.__max_size
+
+    def get(self, key: Hashable, state: Optional[XPathState] = None) -> Optional[WebElement]:
+        """
+        Returns kept element
+        :param key: A key of the element
+        :param state: A state the element has to be in. Element kept under a weaker state isn't returned, e.g. an element
+                      found visible isn't returned for clickable state
+        :return: Optional[WebElement]
+        """
+        if (kept := self.__elements.get(key)) is None:
+            return None
+
+        element, kept_state = kept
+        if state is not None and _STATE_RANKS.get(kept_state, -1) < _STATE_RANKS.get(state, 0):
+            return None
+
+        self.__elements.move_to_end(key)
+        return element
+
+    def put(self, key: Hashable, element: WebElement, state: XPathState = 'present') -> None:
+        """
+        Keeps an element, evicting the least recently used one if the cache is full
+        :param key: A key of the element
+        :param element: An element to be kept
+        :param state: A state the element was found in
+        :return: None
+        """
+        self.__elements[key] = (element, state)
+        self.__elements.move_to_end(key)
+
+        while len(self.__elements) > self.__max_size:
+            self.__elements.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Removes an element if it's kept
+        :param key: A key of the element
+        :return: None
+        """
+        self.__elements.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all kept elements
+        :return: None
+        """
+        self.__elements.clear()
+
+    def __len__(self) -> int:
+        return len(self.__elements)
+
+
+@ignore_exceptions
+def perform_cached(
+        driver: WebDriver,
+        element_cache: ElementCache,
+        frame_path: tuple[XPATH, ...],
+        timeout: float,
+        xpath: XPATH,
+        state: XPathState,
+        action: Callable[[WebElement], Any],
+        *,
+        ignored_exceptions: Optional[IgnoredExceptions] = None,
+        name: str = 'perform_cached',
+        window_handle: Optional[str] = None
+) -> Any:
+    """
+    Performs an action on a kept element. If the element is stale or was kept under a weaker state, it's found again,
+    waiting for the state. A kept clickable element is checked to be still enabled before the action
+    :param driver: A driver to be interacted
+    :param element_cache: A cache of elements
+    :param frame_path: XPATHs of frames leading to the current frame
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param state: A state of the element to be waited
+    :param action: A callable taking the element
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+    :param name: Name of the action reported to hooks
+    :param window_handle: A handle of the current window known by a caller. If None, it's asked from the driver, which
+                          costs a command
+
+    :return: Any
+    """
+    with recording(name, driver, xpath):
+        key = (window_handle or driver.current_window_handle, frame_path, xpath)
+
+        if (element := element_cache.get(key, state)) is not None:
+            try:
+                # Clicking an element disabled since it was kept would silently do nothing
+                if state != 'clickable' or element.is_enabled():
+                    return action(element)
+            except StaleElementReferenceException:
+                # Keys typed into a stale element are lost along with it, so the action is performed again
+                pass
+            element_cache.discard(key)
+
+        element = wait_for_xpath(driver, timeout, xpath, state, ignored_exceptions)
+        element_cache.put(key, element, state)
+
+        return action(element)
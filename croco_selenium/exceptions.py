@@ -7,3 +7,66 @@ class InvalidMethodType(TypeError):
     def __init__(self, value: Any):
         super().__init__(f"Method type is not represented as Literal['object', 'static', 'class']. Provided value is "
                          f"{value}")
+
+
+class PoolExhausted(TimeoutError):
+    """Raised when no driver of a pool is returned in time"""
+
+    def __init__(self, timeout: Any):
+        super().__init__(f"No driver of the pool was available within {timeout} seconds")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a wait is done after a deadline of a flow or is cut short by it"""
+
+    def __init__(self, seconds: Any):
+        super().__init__(f"Deadline of {seconds} seconds is exceeded")
+
+
+class PoolClosed(RuntimeError):
+    """Raised when a driver is leased from a closed pool"""
+
+    def __init__(self):
+        super().__init__("Driver can't be leased from a closed pool")
+
+
+class DevToolsUnavailable(RuntimeError):
+    """Raised when a client of DevTools protocol can't connect to browser"""
+
+    def __init__(self, reason: Any):
+        super().__init__(f"DevTools protocol of browser is unavailable: {reason}")
+
+
+class WindowTrackingUnavailable(RuntimeError):
+    """Raised when a window tracker can't connect to browser or is disconnected"""
+
+    def __init__(self, reason: Any):
+        super().__init__(f"Windows can't be tracked: {reason}")
+
+
+class DebuggerUnavailable(RuntimeError):
+    """Raised when browser of a driver exposes no debugger address, so other sessions can't attach to it"""
+
+    def __init__(self):
+        super().__init__("Browser has no debugger address, so its tabs can't be driven by other sessions")
+
+
+class CircuitOpen(RuntimeError):
+    """Raised when an action isn't performed, because its circuit is open after repeated failures"""
+
+    def __init__(self, key: Any, failures: Any):
+        super().__init__(f"Circuit of {key} is open after {failures} failures in a row")
+
+
+class InvalidFlowStep(ValueError):
+    """Raised when a step of a flow plan has unknown action or lacks required keys"""
+
+    def __init__(self, index: int, reason: Any):
+        super().__init__(f"Step {index} of the flow plan is invalid: {reason}")
+
+
+class UnsafeCacheDirectory(PermissionError):
+    """Raised when a cache directory is not a directory owned by the user and closed to other users"""
+
+    def __init__(self, path: Any):
+        super().__init__(f"Cache directory {path} has to be a directory owned by the user and closed to other users")
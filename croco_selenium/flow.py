@@ -0,0 +1,403 @@
+import json
+import time
+from pathlib import Path
+from typing import Optional, Iterable, Union, Literal, Any
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from .types import XPATH, XPathState, FlowAction, FlowStep, StepTiming
+from .actions import fill_form, switch_to_frame, switch_to_parent_frame
+from .element_cache import ElementCache, perform_cached
+from .waits import wait_until, wait_for_xpath
+from .exceptions import InvalidFlowStep
+from ._scripts import EXTRACT_FIELDS
+
+__all__ = [
+    'FlowPlan',
+    'FlowExecutor',
+    'FlowReport'
+]
+
+_REQUIRED_KEYS: dict[FlowAction, tuple[str, ...]] = {
+    'click': ('xpath',),
+    'type': ('xpath', 'text'),
+    'wait': ('xpath',),
+    'extract': ('xpath',),
+    'switch_to_frame': ('xpath',),
+    'switch_to_parent_frame': ()
+}
+
+
+class FlowPlan:
+    """
+    The plan of a flow: a list of steps, such as click, type, wait, extract and switch_to_frame. A plan is built by
+    chained methods or loaded from JSON or YAML, where it's a list of steps or a mapping with name and steps
+    """
+    def __init__(self, steps: Iterable[FlowStep] = (), name: str = 'flow'):
+        """
+        :param steps: Steps of the flow
+        :param name: Name of the flow
+        """
+        self.__name = name
+        self.__steps: list[FlowStep] = []
+
+        for step in steps:
+            self.add(step)
+
+    @property
+    def name(self) -> str:
+        """Name of the flow"""
+        return self.__name
+
+    @property
+    def steps(self) -> list[FlowStep]:
+        """Steps of the flow"""
+        return [FlowStep(**step) for step in self.__steps]
+
+    def add(self, step: FlowStep) -> 'FlowPlan':
+        """
+        Adds a step to the end of the flow
+        :param step: A step to be added
+        :return: FlowPlan
+        """
+        index = len(self.__steps)
+        action = step.get('action')
+
+        if action not in _REQUIRED_KEYS:
+            raise InvalidFlowStep(index, f'unknown action {action!r}')
+        for key in _REQUIRED_KEYS[action]:
+            if key not in step:
+                raise InvalidFlowStep(index, f'{action} requires {key}')
+
+        self.__steps.append(FlowStep(**step))
+        return self
+
+    def click(self, xpath: XPATH, name: Optional[str] = None, timeout: Optional[float] = None) -> 'FlowPlan':
+        """
+        Adds a click on element
+        :param xpath: XPATH of an element
+        :param name: Name of the step in a report
+        :param timeout: Number of seconds before timing out. If None, timeout of an executor is used
+        :return: FlowPlan
+        """
+        return self.add(_step('click', name, timeout, xpath=xpath))
+
+    def type(
+            self,
+            xpath: XPATH,
+            text: str,
+            cleared: bool = True,
+            keystrokes: bool = False,
+            name: Optional[str] = None,
+            timeout: Optional[float] = None
+    ) -> 'FlowPlan':
+        """
+        Adds typing into a field. Neighboring typing steps fill their fields in a single script call
+        :param xpath: XPATH of a field
+        :param text: Text to be filled in
+        :param cleared: If true, field clears before be interacted
+        :param keystrokes: If true, the field gets real keystrokes instead of a value set by script
+        :param name: Name of the step in a report
+        :param timeout: Number of seconds before timing out. If None, timeout of an executor is used
+        :return: FlowPlan
+        """
+        return self.add(_step('type', name, timeout, xpath=xpath, text=text, cleared=cleared, keystrokes=keystrokes))
+
+    def wait(
+            self,
+            xpath: XPATH,
+            state: XPathState = 'visible',
+            name: Optional[str] = None,
+            timeout: Optional[float] = None
+    ) -> 'FlowPlan':
+        """
+        Adds a wait for a state of element. The found element is reused by following clicks
+        :param xpath: XPATH of an element
+        :param state: A state of the element to be waited
+        :param name: Name of the step in a report
+        :param timeout: Number of seconds before timing out. If None, timeout of an executor is used
+        :return: FlowPlan
+        """
+        return self.add(_step('wait', name, timeout, xpath=xpath, state=state))
+
+    def extract(
+            self,
+            xpath: XPATH,
+            attribute: Optional[str] = None,
+            multiple: bool = False,
+            name: Optional[str] = None,
+            timeout: Optional[float] = None
+    ) -> 'FlowPlan':
+        """
+        Adds reading of text or attribute of element. Neighboring extracting steps are read in a single script call,
+        values are kept in a report by names of steps
+        :param xpath: XPATH of an element
+        :param attribute: Name of an attribute. If None, text is read
+        :param multiple: If true, values of all matching elements are read
+        :param name: Name of the step in a report
+        :param timeout: Number of seconds before timing out. If None, timeout of an executor is used
+        :return: FlowPlan
+        """
+        return self.add(_step('extract', name, timeout, xpath=xpath, attribute=attribute, multiple=multiple))
+
+    def switch_to_frame(self, xpath: XPATH, name: Optional[str] = None, timeout: Optional[float] = None) -> 'FlowPlan':
+        """
+        Adds switching to a frame
+        :param xpath: XPATH of the frame
+        :param name: Name of the step in a report
+        :param timeout: Number of seconds before timing out. If None, timeout of an executor is used
+        :return: FlowPlan
+        """
+        return self.add(_step('switch_to_frame', name, timeout, xpath=xpath))
+
+    def switch_to_parent_frame(self, name: Optional[str] = None) -> 'FlowPlan':
+        """
+        Adds switching to the parent frame
+        :param name: Name of the step in a report
+        :return: FlowPlan
+        """
+        return self.add(_step('switch_to_parent_frame', name, None))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the plan as a mapping, which can be dumped to JSON or YAML
+        :return: dict[str, Any]
+        """
+        return {'name': self.__name, 'steps': self.steps}
+
+    @classmethod
+    def from_dict(cls, data: Union[dict[str, Any], list[FlowStep]]) -> 'FlowPlan':
+        """
+        Creates a plan from a mapping with name and steps or from a list of steps
+        :param data: A mapping or a list of steps
+        :return: FlowPlan
+        """
+        if isinstance(data, list):
+            return cls(data)
+        return cls(data.get('steps', []), data.get('name', 'flow'))
+
+    @classmethod
+    def loads(cls, text: str, format: Literal['json', 'yaml'] = 'json') -> 'FlowPlan':
+        """
+        Creates a plan from a JSON or YAML document. YAML requires PyYAML
+        :param text: A document
+        :param format: A format of the document
+        :return: FlowPlan
+        """
+        return cls.from_dict(_load_yaml(text) if format == 'yaml' else json.loads(text))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FlowPlan':
+        """
+        Creates a plan from a file. Files with .yaml and .yml extensions are loaded as YAML, others as JSON
+        :param path: A path of the file
+        :return: FlowPlan
+        """
+        path = Path(path)
+        format = 'yaml' if path.suffix in ('.yaml', '.yml') else 'json'
+        return cls.loads(path.read_text(encoding='utf-8'), format)
+
+    def __len__(self) -> int:
+        return len(self.__steps)
+
+
+class FlowReport:
+    """The report of a performed flow: extracted values and timing of every step"""
+    def __init__(self, name: str, values: dict[str, Any], timings: list[StepTiming], calls: int, seconds: float):
+        """
+        :param name: Name of the flow
+        :param values: Values of extracting steps by names of steps
+        :param timings: Timing of every step
+        :param calls: Number of calls the flow was performed in
+        :param seconds: Number of seconds the flow took
+        """
+        self.__name = name
+        self.__values = values
+        self.__timings = timings
+        self.__calls = calls
+        self.__seconds = seconds
+
+    @property
+    def name(self) -> str:
+        """Name of the flow"""
+        return self.__name
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """Values of extracting steps by names of steps"""
+        return self.__values
+
+    @property
+    def timings(self) -> list[StepTiming]:
+        """Timing of every step. Merged steps share seconds of the call they were performed in"""
+        return self.__timings
+
+    @property
+    def calls(self) -> int:
+        """Number of calls the flow was performed in"""
+        return self.__calls
+
+    @property
+    def seconds(self) -> float:
+        """Number of seconds the flow took"""
+        return self.__seconds
+
+
+class FlowExecutor:
+    """
+    The executor performing flow plans in specified driver. Neighboring typing steps are merged into a single fill_form
+    call and neighboring extracting steps into a single script call. Elements found by waits and clicks are kept and
+    reused by following clicks until they are expired
+    """
+    def __init__(self, driver: WebDriver, timeout: float = 10, element_cache_size: int = 128):
+        """
+        :param driver: A driver to be interacted
+        :param timeout: Number of seconds before timing out, if a step has no timeout
+        :param element_cache_size: Maximum number of elements kept during a flow
+        """
+        self.__driver = driver
+        self.__timeout = timeout
+        self.__element_cache = ElementCache(element_cache_size)
+        self.__frame_path: tuple[XPATH, ...] = ()
+        self.__window_handle: Optional[str] = None
+
+    def compile(self, plan: FlowPlan) -> list[list[FlowStep]]:
+        """
+        Splits steps of a plan into calls. Steps of one call are performed together. Steps without names get names
+        made of their actions and indexes
+        :param plan: A plan of the flow
+        :return: list[list[FlowStep]]
+        """
+        calls: list[list[FlowStep]] = []
+
+        for index, step in enumerate(plan.steps):
+            step.setdefault('name', f'{step["action"]}_{index}')
+            if calls and _mergeable(calls[-1], step):
+                calls[-1].append(step)
+            else:
+                calls.append([step])
+
+        return calls
+
+    def run(self, plan: FlowPlan) -> FlowReport:
+        """
+        Performs a plan. Frames entered by the plan are left after it, even if it fails
+        :param plan: A plan of the flow
+        :return: FlowReport
+        """
+        self.__element_cache.clear()
+        self.__frame_path = ()
+        # Steps don't switch windows, so the current window is asked once per run, when an element is kept first
+        self.__window_handle = None
+
+        values = {}
+        timings = []
+        calls = self.compile(plan)
+
+        start_time = time.perf_counter()
+        try:
+            for call, steps in enumerate(calls):
+                call_start_time = time.perf_counter()
+                results = self.__perform(steps)
+                seconds = time.perf_counter() - call_start_time
+
+                for step, result in zip(steps, results):
+                    if step['action'] == 'extract':
+                        values[step['name']] = result
+                    timings.append(StepTiming(name=step['name'], action=step['action'], seconds=seconds, call=call))
+        finally:
+            # Frames entered by the plan are left, so the next run starts in the frame of the caller
+            while self.__frame_path:
+                switch_to_parent_frame(self.__driver)
+                self.__frame_path = self.__frame_path[:-1]
+
+        return FlowReport(plan.name, values, timings, len(calls), time.perf_counter() - start_time)
+
+    def __perform(self, steps: list[FlowStep]) -> list[Any]:
+        driver = self.__driver
+        step = steps[0]
+        action = step['action']
+        timeout = max(other.get('timeout', self.__timeout) for other in steps)
+
+        if action == 'type':
+            fields = {step['xpath']: step['text'] for step in steps}
+            keystrokes = [step['xpath'] for step in steps if step.get('keystrokes')]
+            fill_form(driver, timeout, fields, step.get('cleared', True), keystrokes)
+        elif action == 'extract':
+            fields = [(step['xpath'], step.get('attribute'), step.get('multiple', False)) for step in steps]
+            return wait_until(driver, timeout, _extract_fields(fields))
+        elif action == 'click':
+            self.__click(timeout, step['xpath'])
+        elif action == 'wait':
+            self.__wait(timeout, step['xpath'], step.get('state', 'visible'))
+        elif action == 'switch_to_frame':
+            switch_to_frame(driver, timeout, step['xpath'])
+            self.__frame_path += (step['xpath'],)
+        else:
+            switch_to_parent_frame(driver)
+            self.__frame_path = self.__frame_path[:-1]
+
+        return [None] * len(steps)
+
+    def __click(self, timeout: float, xpath: XPATH) -> None:
+        perform_cached(
+            self.__driver,
+            self.__element_cache,
+            self.__frame_path,
+            timeout,
+            xpath,
+            'clickable',
+            lambda element: element.click(),
+            name='click',
+            window_handle=self.__current_window_handle()
+        )
+
+    def __wait(self, timeout: float, xpath: XPATH, state: XPathState) -> None:
+        found = wait_for_xpath(self.__driver, timeout, xpath, state)
+
+        # The state is kept along with the element, so a click reuses it only if it was awaited as clickable
+        if isinstance(found, WebElement):
+            self.__element_cache.put((self.__current_window_handle(), self.__frame_path, xpath), found, state)
+
+    def __current_window_handle(self) -> str:
+        if self.__window_handle is None:
+            self.__window_handle = self.__driver.current_window_handle
+        return self.__window_handle
+
+
+def _step(action: FlowAction, name: Optional[str], timeout: Optional[float], **keys) -> FlowStep:
+    step = FlowStep(action=action, **keys)
+    if name is not None:
+        step['name'] = name
+    if timeout is not None:
+        step['timeout'] = timeout
+    return step
+
+
+def _mergeable(steps: list[FlowStep], step: FlowStep) -> bool:
+    last = steps[-1]
+    if step['action'] != last['action']:
+        return False
+    if step['action'] == 'extract':
+        return True
+    # Fields of one call are a mapping, so a field typed twice starts another call
+    return (
+        step['action'] == 'type'
+        and step.get('cleared', True) == last.get('cleared', True)
+        and all(step['xpath'] != other['xpath'] for other in steps)
+    )
+
+
+def _extract_fields(fields: list[tuple[XPATH, Optional[str], bool]]):
+    def _predicate(driver: WebDriver):
+        return driver.execute_script(EXTRACT_FIELDS, fields)
+
+    return _predicate
+
+
+def _load_yaml(text: str) -> Any:
+    try:
+        import yaml
+    except ImportError as exc:
+        raise ImportError('PyYAML is required to load flow plans from YAML: pip install croco-selenium[yaml]') from exc
+
+    return yaml.safe_load(text)
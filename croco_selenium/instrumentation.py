@@ -0,0 +1,283 @@
+import time
+import inspect
+import logging
+from bisect import bisect_left
+from threading import Lock
+from functools import wraps
+from contextlib import contextmanager
+from contextvars import ContextVar
+from weakref import WeakKeyDictionary
+from typing import Callable, Optional, Iterator, Any
+from .types import ActionEvent, ActionHook
+
+__all__ = [
+    'add_hook',
+    'remove_hook',
+    'MetricsAggregator'
+]
+
+logger = logging.getLogger(__name__)
+
+_hooks: list[ActionHook] = []
+_driver_hooks: WeakKeyDictionary[Any, list[ActionHook]] = WeakKeyDictionary()
+_current_record: ContextVar[Optional['_ActionRecord']] = ContextVar('croco_selenium_action_record', default=None)
+
+
+class _ActionRecord:
+    __slots__ = ('wait_time', 'polls', 'commands')
+
+    def __init__(self):
+        self.wait_time = 0.0
+        self.polls = 0
+        self.commands = 0
+
+
+def add_hook(hook: ActionHook, driver: Any = None) -> None:
+    """
+    Adds a hook called with an event after every action
+    :param hook: A callable taking ActionEvent
+    :param driver: If provided, the hook is called only for actions of the driver
+    :return: None
+    """
+    if driver is None:
+        _hooks.append(hook)
+    else:
+        _driver_hooks.setdefault(driver, []).append(hook)
+
+
+def remove_hook(hook: ActionHook, driver: Any = None) -> None:
+    """
+    Removes a hook added by add_hook
+    :param hook: A callable taking ActionEvent
+    :param driver: A driver the hook was added for
+    :return: None
+    """
+    hooks = _hooks if driver is None else _driver_hooks.get(driver, [])
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+def count_command() -> None:
+    if record := _current_record.get():
+        record.commands += 1
+
+
+def count_poll() -> None:
+    if record := _current_record.get():
+        record.polls += 1
+
+
+@contextmanager
+def waiting() -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if record := _current_record.get():
+            record.wait_time += time.perf_counter() - start
+
+
+def _get_hooks(driver: Any) -> list[ActionHook]:
+    try:
+        driver_hooks = _driver_hooks.get(driver)
+    except TypeError:
+        driver_hooks = None
+
+    return _hooks + driver_hooks if driver_hooks else _hooks
+
+
+@contextmanager
+def recording(action: str, driver: Any, xpath: Optional[str] = None) -> Iterator[None]:
+    """
+    Measures the code in the context and emits ActionEvent to hooks
+    :param action: Name of the action
+    :param driver: A driver to be interacted
+    :param xpath: XPATH of an element
+    :return: Iterator[None]
+    """
+    # An action performed by another action is reported as a part of it
+    hooks = _get_hooks(driver)
+    if not hooks or _current_record.get():
+        yield
+        return
+
+    record = _ActionRecord()
+    token = _current_record.set(record)
+    outcome = 'ok'
+    start = time.perf_counter()
+
+    try:
+        yield
+    except BaseException as exc:
+        outcome = type(exc).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        _current_record.reset(token)
+
+        event: ActionEvent = {
+            'action': action,
+            'xpath': xpath,
+            'duration': duration,
+            'wait_time': record.wait_time,
+            'polls': record.polls,
+            'commands': record.commands,
+            'outcome': outcome
+        }
+
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception('Hook %r failed on action %s', hook, action)
+
+
+def instrumented(func: Callable) -> Callable:
+    """
+    Emits ActionEvent to hooks after every call of the decorated action. Action has to take driver as first positional
+    argument and may take xpath
+    :param func: Function to be decorated
+    """
+    parameters = list(inspect.signature(func).parameters)
+    xpath_index = parameters.index('xpath') if 'xpath' in parameters else None
+
+    def _get_xpath(args, kwargs) -> Optional[str]:
+        if xpath_index is None:
+            return None
+        return args[xpath_index] if len(args) > xpath_index else kwargs.get('xpath')
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with recording(func.__name__, args[0], _get_xpath(args, kwargs)):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with recording(func.__name__, args[0], _get_xpath(args, kwargs)):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsAggregator:
+    """
+    The hook aggregating events of actions into histograms and counters, which can be exported in OpenMetrics text
+    format, e.g. for Prometheus
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(
+            self,
+            prefix: str = 'croco_selenium',
+            buckets: tuple[float, ...] = BUCKETS,
+            xpath_label: bool = False
+    ):
+        """
+        :param prefix: A prefix of metric names
+        :param buckets: Upper bounds of histogram buckets in seconds
+        :param xpath_label: Whether metrics are labeled by XPATH. It helps to find slow selectors, but makes many series
+        """
+        self.__prefix = prefix
+        self.__buckets = tuple(sorted(buckets))
+        self.__xpath_label = xpath_label
+        self.__lock = Lock()
+        self.__durations: dict[tuple, _Histogram] = {}
+        self.__waits: dict[tuple, _Histogram] = {}
+        self.__polls: dict[tuple, int] = {}
+        self.__commands: dict[tuple, int] = {}
+
+    def __call__(self, event: ActionEvent) -> None:
+        labels = (('action', event['action']), ('outcome', event['outcome']))
+        if self.__xpath_label:
+            labels += (('xpath', event['xpath'] or ''),)
+
+        with self.__lock:
+            self.__histogram(self.__durations, labels).observe(event['duration'])
+            self.__histogram(self.__waits, labels).observe(event['wait_time'])
+            self.__polls[labels] = self.__polls.get(labels, 0) + event['polls']
+            self.__commands[labels] = self.__commands.get(labels, 0) + event['commands']
+
+    def __histogram(self, histograms: dict[tuple, _Histogram], labels: tuple) -> _Histogram:
+        if (histogram := histograms.get(labels)) is None:
+            histogram = histograms[labels] = _Histogram(self.__buckets)
+        return histogram
+
+    def reset(self) -> None:
+        """
+        Removes all aggregated values
+        :return: None
+        """
+        with self.__lock:
+            self.__durations.clear()
+            self.__waits.clear()
+            self.__polls.clear()
+            self.__commands.clear()
+
+    def export(self) -> str:
+        """
+        Returns aggregated metrics in OpenMetrics text format
+        :return: str
+        """
+        lines = []
+
+        with self.__lock:
+            self.__export_histograms(lines, 'action_duration_seconds', 'Duration of actions', self.__durations)
+            self.__export_histograms(lines, 'action_wait_seconds', 'Time spent by actions in waits', self.__waits)
+            self.__export_counters(lines, 'action_polls', 'Number of polls made by waits of actions', self.__polls)
+            self.__export_counters(
+                lines,
+                'action_commands',
+                'Number of WebDriver commands sent by actions',
+                self.__commands
+            )
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def __export_histograms(self, lines: list[str], name: str, help_: str, histograms: dict) -> None:
+        name = f'{self.__prefix}_{name}'
+        lines += [f'# TYPE {name} histogram', f'# UNIT {name} seconds', f'# HELP {name} {help_}']
+
+        for labels, histogram in histograms.items():
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{self.__labels(labels, ("le", repr(float(bound))))} {cumulative}')
+            lines.append(f'{name}_bucket{self.__labels(labels, ("le", "+Inf"))} {histogram.count}')
+            lines.append(f'{name}_sum{self.__labels(labels)} {histogram.sum}')
+            lines.append(f'{name}_count{self.__labels(labels)} {histogram.count}')
+
+    def __export_counters(self, lines: list[str], name: str, help_: str, counters: dict) -> None:
+        name = f'{self.__prefix}_{name}'
+        lines += [f'# TYPE {name} counter', f'# HELP {name} {help_}']
+
+        for labels, value in counters.items():
+            lines.append(f'{name}_total{self.__labels(labels)} {value}')
+
+    @staticmethod
+    def __labels(labels: tuple, *extra: tuple[str, str]) -> str:
+        return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels + extra) + '}'
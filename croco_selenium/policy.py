@@ -0,0 +1,339 @@
+import time
+import asyncio
+import inspect
+from threading import Lock
+from urllib.parse import urlsplit
+from typing import Optional, Callable, Awaitable, Iterator, Generic, TypeVar, Union, Literal, Any
+from selenium.common import (
+    WebDriverException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException
+)
+from .types import IgnoredExceptions
+from .deadline import current_deadline
+from .exceptions import CircuitOpen, DeadlineExceeded
+
+__all__ = [
+    'ActionResult',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'ActionPolicy',
+    'TRANSIENT_EXCEPTIONS'
+]
+
+T = TypeVar('T')
+
+# Exceptions, after which the same action usually succeeds
+TRANSIENT_EXCEPTIONS = (StaleElementReferenceException, ElementClickInterceptedException)
+
+BreakerKey = Union[Literal['xpath', 'site'], Callable[[Any, Optional[str]], str]]
+
+
+class ActionResult(Generic[T]):
+    """The outcome of an action performed by a policy: a value or an error, which made the action fail"""
+    def __init__(self, value: Optional[T] = None, error: Optional[Exception] = None, attempts: int = 0):
+        """
+        :param value: A value returned by the action
+        :param error: An exception raised by the last attempt or CircuitOpen, if the action wasn't attempted
+        :param attempts: Number of times the action was performed
+        """
+        self.__value = value
+        self.__error = error
+        self.__attempts = attempts
+
+    @property
+    def ok(self) -> bool:
+        """Whether the action succeeded"""
+        return self.__error is None
+
+    @property
+    def value(self) -> Optional[T]:
+        """A value returned by the action"""
+        return self.__value
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """An exception, which made the action fail"""
+        return self.__error
+
+    @property
+    def attempts(self) -> int:
+        """Number of times the action was performed"""
+        return self.__attempts
+
+    def unwrap(self) -> T:
+        """
+        Returns the value or raises the error
+        :return: T
+        """
+        if self.__error is not None:
+            raise self.__error
+        return self.__value
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f'ActionResult(value={self.__value!r}, attempts={self.__attempts})'
+        return f'ActionResult(error={self.__error!r}, attempts={self.__attempts})'
+
+
+class RetryPolicy:
+    """The policy of performing an action again after transient exceptions with growing delays"""
+    def __init__(
+            self,
+            attempts: int = 3,
+            delay: float = 0.1,
+            backoff: float = 2.0,
+            max_delay: float = 2.0,
+            retry_on: tuple[type[Exception], ...] = TRANSIENT_EXCEPTIONS
+    ):
+        """
+        :param attempts: Maximum number of times an action is performed
+        :param delay: Number of seconds before the second attempt
+        :param backoff: Multiplier of a delay
+        :param max_delay: Maximum number of seconds between attempts
+        :param retry_on: Exceptions, after which an action is performed again
+        """
+        self.attempts = attempts
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+
+    def delays(self) -> Iterator[float]:
+        """
+        Yields delays before every attempt after the first one
+        :return: Iterator[float]
+        """
+        delay = self.delay
+        for _ in range(self.attempts - 1):
+            yield delay
+            delay = min(delay * self.backoff, self.max_delay)
+
+
+class CircuitBreaker:
+    """
+    The breaker failing actions fast after repeated failures. Failures are counted per key: XPATH of an action, host of
+    the current page or a key returned by a callable. After threshold failures in a row the circuit of the key is open
+    and actions fail without being performed. After reset_timeout one action is let through: if it succeeds, the
+    circuit is closed, otherwise it's open again
+    """
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30, key: BreakerKey = 'xpath'):
+        """
+        :param threshold: Number of failures in a row opening a circuit
+        :param reset_timeout: Number of seconds a circuit is open before a trial action
+        :param key: What failures are counted per. There are three options:
+                    xpath - XPATH of an action, or name of the action, if it has no XPATH
+                    site - host of the current page. It costs a WebDriver command per action
+                    a callable taking a driver and XPATH and returning a key
+        """
+        self.__threshold = threshold
+        self.__reset_timeout = reset_timeout
+        self.__key = key
+        self.__failures: dict[str, int] = {}
+        self.__opened_at: dict[str, float] = {}
+        self.__lock = Lock()
+
+    def key_of(self, action: str, driver: Any, xpath: Optional[str]) -> str:
+        """
+        Returns a key, failures of an action are counted per
+        :param action: Name of the action
+        :param driver: A driver of the action
+        :param xpath: XPATH of the action
+        :return: str
+        """
+        if callable(self.__key):
+            return self.__key(driver, xpath)
+        if self.__key == 'site':
+            return urlsplit(driver.current_url).netloc
+        return xpath or action
+
+    def state(self, key: str) -> Literal['closed', 'open', 'half_open']:
+        """
+        Returns a state of the circuit of a key
+        :param key: A key of the circuit
+        :return: Literal['closed', 'open', 'half_open']
+        """
+        with self.__lock:
+            if (opened_at := self.__opened_at.get(key)) is None:
+                return 'closed'
+            return 'open' if time.monotonic() - opened_at < self.__reset_timeout else 'half_open'
+
+    def allow(self, key: str) -> bool:
+        """
+        Checks whether an action may be performed. A half-open circuit lets one action through and is open again
+        until the action is recorded
+        :param key: A key of the circuit
+        :return: bool
+        """
+        with self.__lock:
+            if (opened_at := self.__opened_at.get(key)) is None:
+                return True
+            if time.monotonic() - opened_at < self.__reset_timeout:
+                return False
+
+            self.__opened_at[key] = time.monotonic()
+            return True
+
+    def record_success(self, key: str) -> None:
+        """
+        Closes the circuit of a key
+        :param key: A key of the circuit
+        :return: None
+        """
+        with self.__lock:
+            self.__failures.pop(key, None)
+            self.__opened_at.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        """
+        Counts a failure and opens the circuit of a key, if failures reach threshold
+        :param key: A key of the circuit
+        :return: None
+        """
+        with self.__lock:
+            failures = self.__failures[key] = self.__failures.get(key, 0) + 1
+            if failures >= self.__threshold:
+                self.__opened_at[key] = time.monotonic()
+
+    def failures(self, key: str) -> int:
+        """
+        Returns number of failures in a row of a key
+        :param key: A key of the circuit
+        :return: int
+        """
+        with self.__lock:
+            return self.__failures.get(key, 0)
+
+    def reset(self) -> None:
+        """
+        Closes all circuits
+        :return: None
+        """
+        with self.__lock:
+            self.__failures.clear()
+            self.__opened_at.clear()
+
+
+class ActionPolicy:
+    """
+    The policy performing actions with retries and a circuit breaker. Instead of returning None on ignored exceptions,
+    it returns ActionResult holding a value or an error. Failures are exceptions of Selenium and ignored exceptions
+    passed to the action, which are taken by the policy and aren't passed further. Other exceptions and
+    DeadlineExceeded are raised. Inside a deadline delays between attempts are cut to the time left
+    """
+    def __init__(self, retry: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None):
+        """
+        :param retry: A policy of retries. If None, actions are performed once
+        :param breaker: A circuit breaker. If None, actions are always performed
+        """
+        self.__retry = retry or RetryPolicy(attempts=1)
+        self.__breaker = breaker
+
+    @property
+    def breaker(self) -> Optional[CircuitBreaker]:
+        """A circuit breaker of the policy"""
+        return self.__breaker
+
+    def run(self, action: Callable[..., T], *args, **kwargs) -> ActionResult[T]:
+        """
+        Performs an action, e.g. click of actions module or of ActionPerformer
+        :param action: A callable performing the action
+        :param args: Positional arguments of the action
+        :param kwargs: Keyword arguments of the action
+        :return: ActionResult[T]
+        """
+        key, failures, args, kwargs = self.__prepare(action, args, kwargs)
+        if key is not None and not self.__breaker.allow(key):
+            return ActionResult(error=CircuitOpen(key, self.__breaker.failures(key)))
+
+        delays = self.__retry.delays()
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                value = action(*args, **kwargs)
+            except DeadlineExceeded:
+                raise
+            except failures as exc:
+                if (delay := self.__next_delay(exc, delays)) is not None:
+                    time.sleep(delay)
+                    continue
+                return self.__failed(key, exc, attempts)
+
+            return self.__succeeded(key, value, attempts)
+
+    async def run_async(self, action: Callable[..., Awaitable[T]], *args, **kwargs) -> ActionResult[T]:
+        """
+        Performs an awaitable action, e.g. click of croco_selenium.aio
+        :param action: A callable performing the action
+        :param args: Positional arguments of the action
+        :param kwargs: Keyword arguments of the action
+        :return: ActionResult[T]
+        """
+        key, failures, args, kwargs = self.__prepare(action, args, kwargs)
+        if key is not None and not self.__breaker.allow(key):
+            return ActionResult(error=CircuitOpen(key, self.__breaker.failures(key)))
+
+        delays = self.__retry.delays()
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                value = await action(*args, **kwargs)
+            except DeadlineExceeded:
+                raise
+            except failures as exc:
+                if (delay := self.__next_delay(exc, delays)) is not None:
+                    await asyncio.sleep(delay)
+                    continue
+                return self.__failed(key, exc, attempts)
+
+            return self.__succeeded(key, value, attempts)
+
+    def __prepare(self, action: Callable, args: tuple, kwargs: dict) -> tuple[Optional[str], tuple, tuple, dict]:
+        bound = inspect.signature(action).bind(*args, **kwargs)
+
+        # Ignored exceptions would make the action return None, so they are failures of the policy instead. They are
+        # stripped whether passed by position or by keyword, and following arguments are passed by keyword then
+        ignored_exceptions = bound.arguments.pop('ignored_exceptions', None)
+        failures = (WebDriverException, *_as_tuple(ignored_exceptions))
+
+        if self.__breaker is None:
+            return None, failures, bound.args, bound.kwargs
+
+        # Methods of drivers are bound to the driver itself
+        driver = bound.arguments.get('driver') or getattr(action, '__self__', None)
+        key = self.__breaker.key_of(action.__name__, driver, bound.arguments.get('xpath'))
+        return key, failures, bound.args, bound.kwargs
+
+    def __next_delay(self, exc: Exception, delays: Iterator[float]) -> Optional[float]:
+        if not isinstance(exc, self.__retry.retry_on):
+            return None
+        if (delay := next(delays, None)) is None:
+            return None
+
+        # A retry doesn't sleep past the deadline, and once the budget is spent it isn't attempted
+        if (deadline := current_deadline()) is not None:
+            if deadline.expired:
+                raise DeadlineExceeded(deadline.seconds) from exc
+            delay = min(delay, deadline.remaining)
+        return delay
+
+    def __succeeded(self, key: Optional[str], value: Any, attempts: int) -> ActionResult:
+        if key is not None:
+            self.__breaker.record_success(key)
+        return ActionResult(value=value, attempts=attempts)
+
+    def __failed(self, key: Optional[str], exc: Exception, attempts: int) -> ActionResult:
+        if key is not None:
+            self.__breaker.record_failure(key)
+        return ActionResult(error=exc, attempts=attempts)
+
+
+def _as_tuple(ignored_exceptions: Optional[IgnoredExceptions]) -> tuple[type[Exception], ...]:
+    if not ignored_exceptions:
+        return ()
+    try:
+        return tuple(ignored_exceptions)
+    except TypeError:
+        return ignored_exceptions,
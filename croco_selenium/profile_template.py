@@ -0,0 +1,96 @@
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+from copy import deepcopy
+from typing import Optional, Iterable
+from selenium.webdriver.chrome.webdriver import Options
+from .chrome_driver import ChromeDriver
+
+__all__ = ['ProfileTemplate']
+
+# Lock files of running browser must not be copied, otherwise a clone is considered as being in use
+_IGNORED_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie')
+
+
+def _reflink_command(source: str, destination: str) -> Optional[list[str]]:
+    if sys.platform == 'darwin':
+        return ['cp', '-c', '-R', os.path.join(source, '.'), destination]
+    elif sys.platform.startswith('linux'):
+        return ['cp', '-R', '--reflink=auto', os.path.join(source, '.'), destination]
+    return None
+
+
+def _copy_tree(source: str, destination: str) -> None:
+    command = _reflink_command(source, destination)
+
+    if command and shutil.which('cp'):
+        if subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0:
+            for name in _IGNORED_FILES:
+                path = os.path.join(destination, name)
+                if os.path.lexists(path):
+                    os.remove(path)
+            return
+
+    shutil.copytree(source, destination, ignore=shutil.ignore_patterns(*_IGNORED_FILES), dirs_exist_ok=True)
+
+
+class ProfileTemplate:
+    """
+    The class building a user data directory once and giving its copies to new drivers. Copies are made by reflinks
+    where a file system supports them, so they are cheap
+    """
+    def __init__(self, path: str):
+        """
+        :param path: A path of the user data directory of the template
+        """
+        self.__path = os.path.abspath(path)
+
+    @property
+    def path(self) -> str:
+        """A path of the user data directory of the template"""
+        return self.__path
+
+    @property
+    def built(self) -> bool:
+        """Whether the template is built"""
+        return os.path.isfile(os.path.join(self.__path, 'Local State'))
+
+    def build(
+            self,
+            options: Optional[Options] = None,
+            extension_paths: Optional[Iterable[str]] = None,
+            executable_path: Optional[str] = None,
+            urls: Iterable[str] = ()
+    ) -> None:
+        """
+        Launches a browser in the user data directory of the template, so that first run is done, and extensions and
+        caches are initialized
+        :param options: This takes an instance of ChromiumOptions
+        :param extension_paths: An iterable collection of extension paths
+        :param executable_path: An executable path of Chrome
+        :param urls: URLs to be opened for priming caches
+        :return: None
+        """
+        options = deepcopy(options) if options else Options()
+        options.add_argument(f'--user-data-dir={self.__path}')
+
+        driver = ChromeDriver(options, extension_paths=extension_paths, executable_path=executable_path)
+        try:
+            driver.close_tabs()
+            for url in urls:
+                driver.get(url)
+        finally:
+            driver.quit()
+
+    def clone(self) -> str:
+        """
+        Copies the user data directory of the template. The copy is placed near the template, so that reflinks can be
+        used
+        :return: str
+        """
+        parent, name = os.path.split(self.__path)
+        path = tempfile.mkdtemp(prefix=f'{name}-', dir=parent)
+        _copy_tree(self.__path, path)
+        return path
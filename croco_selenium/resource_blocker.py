@@ -0,0 +1,82 @@
+from typing import Optional, Any
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from .types import BlockingProfile
+from ._devtools import DevToolsClient, get_websocket_url
+
+__all__ = [
+    'ResourceBlocker',
+    'block_resources',
+    'BLOCK_MEDIA',
+    'BLOCK_TRACKERS'
+]
+
+BLOCK_MEDIA: BlockingProfile = {'resource_types': ['Image', 'Media', 'Font']}
+BLOCK_TRACKERS: BlockingProfile = {
+    'url_patterns': [
+        '*://*.google-analytics.com/*',
+        '*://*.googletagmanager.com/*',
+        '*://*.doubleclick.net/*',
+        '*://connect.facebook.net/*',
+        '*://*.hotjar.com/*',
+        '*://mc.yandex.ru/*'
+    ]
+}
+
+# Requests of documents and frames are paused by these targets, workers aren't intercepted
+_INTERCEPTED_TYPES = ('page', 'iframe')
+_AUTO_ATTACH = {'autoAttach': True, 'waitForDebuggerOnStart': True, 'flatten': True}
+
+
+class ResourceBlocker(DevToolsClient):
+    """
+    The class failing requests of blocked resources in all tabs of browser. It attaches to every tab, including pop-ups
+    and tabs opened later, before the tab sends its first request, so only blocked requests are intercepted
+    """
+    def __init__(self, websocket_url: str, profile: BlockingProfile, timeout: float = 10):
+        """
+        :param websocket_url: An URL of DevTools protocol of browser
+        :param profile: Types of resources and URL patterns with wildcards to be blocked
+        :param timeout: Number of seconds before timing out of connecting
+        """
+        self.__patterns = [
+            {'resourceType': resource_type, 'requestStage': 'Request'}
+            for resource_type in profile.get('resource_types', ())
+        ]
+        self.__patterns += [
+            {'urlPattern': url_pattern, 'requestStage': 'Request'}
+            for url_pattern in profile.get('url_patterns', ())
+        ]
+        super().__init__(websocket_url, timeout)
+
+    async def _start(self) -> None:
+        # Existing targets are attached as well
+        await self._call('Target.setAutoAttach', _AUTO_ATTACH)
+
+    def _on_event(self, method: str, params: dict[str, Any], session_id: Optional[str]) -> None:
+        if method == 'Target.attachedToTarget':
+            target_type = params['targetInfo']['type']
+            self._spawn(self.__intercept, params['sessionId'], target_type, params['waitingForDebugger'])
+        elif method == 'Fetch.requestPaused':
+            failure = {'requestId': params['requestId'], 'errorReason': 'BlockedByClient'}
+            self._spawn(self._call, 'Fetch.failRequest', failure, session_id)
+
+    async def __intercept(self, session_id: str, target_type: str, waiting: bool) -> None:
+        try:
+            if target_type in _INTERCEPTED_TYPES and self.__patterns:
+                await self._call('Fetch.enable', {'patterns': self.__patterns}, session_id)
+                # Frames running in other processes are separate targets attached to the tab
+                await self._call('Target.setAutoAttach', _AUTO_ATTACH, session_id)
+        finally:
+            if waiting:
+                await self._call('Runtime.runIfWaitingForDebugger', None, session_id)
+
+
+def block_resources(driver: WebDriver, profile: BlockingProfile, timeout: float = 10) -> ResourceBlocker:
+    """
+    Connects a resource blocker to browser of the driver
+    :param driver: A driver launched browser
+    :param profile: Types of resources and URL patterns with wildcards to be blocked
+    :param timeout: Number of seconds before timing out of connecting
+    :return: ResourceBlocker
+    """
+    return ResourceBlocker(get_websocket_url(driver, timeout), profile, timeout)
@@ -0,0 +1,88 @@
+from threading import RLock
+from typing import Optional
+from selenium.webdriver.chromium.service import ChromiumService
+
+__all__ = [
+    'SharedService',
+    'ServicePool'
+]
+
+
+class SharedService(ChromiumService):
+    """
+    The service of chromedriver shared by many drivers. It's started by the first driver and stopped when the last
+    driver quits
+    """
+    def __init__(self, executable_path: Optional[str] = None, **kwargs):
+        """
+        :param executable_path: An executable path of chromedriver
+        :param kwargs: Keyword arguments of ChromiumService
+        """
+        super().__init__(executable_path=executable_path, **kwargs)
+        self.__lock = RLock()
+        self.__references = 0
+        self.__reserved = 0
+
+    @property
+    def references(self) -> int:
+        """Number of drivers using the service, including drivers, which reserved it and haven't started it yet"""
+        return self.__references + self.__reserved
+
+    def reserve(self) -> None:
+        """
+        Counts a driver, which is about to start the service, so the service looks used before the driver starts it
+        :return: None
+        """
+        with self.__lock:
+            self.__reserved += 1
+
+    def release(self) -> None:
+        """
+        Drops a reservation of a driver, which failed before starting the service
+        :return: None
+        """
+        with self.__lock:
+            self.__reserved = max(self.__reserved - 1, 0)
+
+    def start(self) -> None:
+        with self.__lock:
+            if self.__references == 0:
+                super().start()
+            self.__references += 1
+            self.__reserved = max(self.__reserved - 1, 0)
+
+    def stop(self) -> None:
+        with self.__lock:
+            if self.__references > 1:
+                self.__references -= 1
+                return
+
+            self.__references = 0
+            super().stop()
+
+
+class ServicePool:
+    """The class keeping several shared services and giving the least used one to a new driver"""
+    def __init__(self, size: int, executable_path: Optional[str] = None):
+        """
+        :param size: Number of services
+        :param executable_path: An executable path of chromedriver
+        """
+        self.__services = [SharedService(executable_path) for _ in range(size)]
+        self.__lock = RLock()
+
+    @property
+    def services(self) -> list[SharedService]:
+        """Services of the pool"""
+        return list(self.__services)
+
+    def acquire(self) -> SharedService:
+        """
+        Returns the service used by the least number of drivers and reserves it, so drivers created concurrently get
+        different services. The reservation is taken over when the driver starts the service
+        :return: SharedService
+        """
+        with self.__lock:
+            service = min(self.__services, key=lambda service: service.references)
+            service.reserve()
+            return service
@@ -0,0 +1,203 @@
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from typing import Callable, Optional, Iterable, Iterator, Any
+from selenium.common import WebDriverException
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from ._croco_driver import CrocoDriver
+from .action_performer import ActionPerformer
+from .exceptions import DebuggerUnavailable
+from .instrumentation import count_command
+from .types import SettlePolicy
+from .utils import get_debugger_address
+
+__all__ = [
+    'TabDriver',
+    'TabPool'
+]
+
+
+class TabDriver(RemoteWebDriver, ActionPerformer):
+    """
+    The driver of a single tab of browser launched by another driver. It's a separate session of chromedriver attached
+    to the browser, so it has its own current window and its commands don't race with commands of other tabs
+    """
+    def __init__(
+            self,
+            driver: CrocoDriver,
+            element_cache_size: int = 0,
+            settle: Optional[SettlePolicy] = None
+    ):
+        """
+        :param driver: A driver, which launched browser
+        :param element_cache_size: Maximum number of found elements to be reused by further actions
+        :param settle: Default policy of waiting for the page to settle before performing actions
+        """
+        if not (address := get_debugger_address(driver)):
+            raise DebuggerUnavailable()
+
+        options = ChromeOptions()
+        options.debugger_address = address
+
+        # Commands are sent to chromedriver of the driver, so no other chromedriver is started
+        RemoteWebDriver.__init__(self, command_executor=driver.service.service_url, options=options)
+        ActionPerformer.__init__(self, self, element_cache_size, settle)
+
+        try:
+            self.switch_to.new_window('tab')
+            self.__handle = self.current_window_handle
+            # Timers and animations of background tabs are throttled, unless the tab is considered focused
+            self.execute_cdp_cmd('Emulation.setFocusEmulationEnabled', {'enabled': True})
+        except WebDriverException:
+            super().quit()
+            raise
+
+    @property
+    def handle(self) -> str:
+        """A handle of the tab"""
+        return self.__handle
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> dict:
+        count_command()
+        response = super().execute(driver_command, params)
+        # A failed command doesn't change the window or the frame
+        self._observe_command(driver_command, params)
+        return response
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        return self.execute('executeCdpCommand', {'cmd': cmd, 'params': cmd_args})['value']
+
+    def quit(self) -> None:
+        # Quitting an attached session leaves browser running, so the tab is closed explicitly
+        try:
+            self.switch_to.window(self.__handle)
+            self.close()
+        except WebDriverException:
+            pass
+        finally:
+            super().quit()
+
+
+def _open(tab: TabDriver, url: str, task: Callable[[TabDriver], Any]) -> Any:
+    tab.get(url)
+    return task(tab)
+
+
+class TabPool:
+    """
+    The pool of tabs of one browser running tasks concurrently. Every tab is driven by its own TabDriver, so tasks
+    may use actions without switching windows. Tasks must not close tabs, they don't own
+    """
+    def __init__(
+            self,
+            driver: CrocoDriver,
+            size: int = 4,
+            element_cache_size: int = 0,
+            settle: Optional[SettlePolicy] = None
+    ):
+        """
+        :param driver: A driver, which launched browser
+        :param size: Number of tabs
+        :param element_cache_size: Maximum number of found elements of a tab to be reused by further actions
+        :param settle: Default policy of waiting for the page to settle before performing actions
+        """
+        self.__idle: Queue[TabDriver] = Queue()
+        self.__tabs: list[TabDriver] = []
+        self.__executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='croco-tab')
+
+        futures = [
+            self.__executor.submit(TabDriver, driver, element_cache_size, settle)
+            for _ in range(size)
+        ]
+
+        error = None
+        for future in futures:
+            try:
+                self.__tabs.append(future.result())
+            except Exception as exc:
+                error = error or exc
+
+        if error:
+            self.close()
+            raise error
+
+        for tab in self.__tabs:
+            self.__idle.put(tab)
+
+    @property
+    def size(self) -> int:
+        """Number of tabs of the pool"""
+        return len(self.__tabs)
+
+    @property
+    def tabs(self) -> list[TabDriver]:
+        """Drivers of tabs of the pool"""
+        return list(self.__tabs)
+
+    def submit(self, task: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Runs a task in a free tab. The task takes a driver of the tab as first argument
+        :param task: A callable to be run
+        :param args: Positional arguments of the task
+        :param kwargs: Keyword arguments of the task
+        :return: Future
+        """
+        return self.__executor.submit(self.__run, task, *args, **kwargs)
+
+    def run(self, tasks: Iterable[Callable[[TabDriver], Any]]) -> Iterator[tuple[int, Any]]:
+        """
+        Runs tasks in tabs concurrently and yields their indexes and results as soon as they finish
+        :param tasks: Callables taking a driver of a tab
+        :return: Iterator[tuple[int, Any]]
+        """
+        futures = {self.submit(task): index for index, task in enumerate(tasks)}
+        yield from self.__as_completed(futures)
+
+    def map(self, task: Callable[[TabDriver], Any], urls: Iterable[str]) -> Iterator[tuple[str, Any]]:
+        """
+        Opens URLs in tabs concurrently, runs the task on every page and yields URLs and results as soon as they finish
+        :param task: A callable taking a driver of a tab with the opened page
+        :param urls: URLs to be opened
+        :return: Iterator[tuple[str, Any]]
+        """
+        futures = {self.submit(_open, url, task): url for url in urls}
+        yield from self.__as_completed(futures)
+
+    def __run(self, task: Callable[..., Any], *args, **kwargs) -> Any:
+        tab = self.__idle.get()
+
+        try:
+            return task(tab, *args, **kwargs)
+        finally:
+            self.__idle.put(tab)
+
+    @staticmethod
+    def __as_completed(futures: dict[Future, Any]) -> Iterator[tuple[Any, Any]]:
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Tasks aren't run, if iteration is stopped or a task fails
+            for future in futures:
+                future.cancel()
+
+    def close(self) -> None:
+        """
+        Waits for running tasks and closes tabs of the pool. Browser keeps running
+        :return: None
+        """
+        self.__executor.shutdown(cancel_futures=True)
+
+        for tab in self.__tabs:
+            try:
+                tab.quit()
+            except WebDriverException:
+                pass
+
+        self.__tabs.clear()
+
+    def __enter__(self) -> 'TabPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -1,9 +1,17 @@
-from typing import Union, NewType, Literal, Type, TypedDict, Any
+from typing import Union, NewType, Literal, Type, TypedDict, Required, Callable, Optional, Any
 
 XPATH = Union[NewType('XPATH', str), str]
 MethodType = Literal['instance', 'static', 'class', 'function']
+XPathState = Literal['present', 'visible', 'clickable', 'invisible', 'all_present', 'all_visible']
 IgnoredExceptions = Union[Type[Exception], tuple[Type[Exception]]]
 Cookies = Union[list[dict[str, Any]], dict[str, Any], str]
+PageLoadStrategy = Literal['normal', 'eager', 'none']
+FlowAction = Literal['click', 'type', 'wait', 'extract', 'switch_to_frame', 'switch_to_parent_frame']
+# Types of resources in DevTools protocol
+ResourceType = Literal[
+    'Document', 'Stylesheet', 'Image', 'Media', 'Font', 'Script', 'TextTrack', 'XHR', 'Fetch', 'Prefetch',
+    'EventSource', 'WebSocket', 'Manifest', 'Ping', 'Other'
+]
 
 
 class Proxy(TypedDict):
@@ -11,3 +19,62 @@ class Proxy(TypedDict):
     port: int
     username: str
     password: str
+
+
+class SettlePolicy(TypedDict, total=False):
+    quiet: float
+    ready_state: bool
+
+
+class Readiness(TypedDict, total=False):
+    xpath: XPATH
+    dom_content_loaded: bool
+    resource_quiet: float
+
+
+class BlockingProfile(TypedDict, total=False):
+    resource_types: list[ResourceType]
+    url_patterns: list[str]
+
+
+class StorageState(TypedDict):
+    local: dict[str, str]
+    session: dict[str, str]
+
+
+class SessionState(TypedDict):
+    cookies: list[dict[str, Any]]
+    origins: dict[str, StorageState]
+
+
+class ActionEvent(TypedDict):
+    action: str
+    xpath: Optional[str]
+    duration: float
+    wait_time: float
+    polls: int
+    commands: int
+    outcome: str
+
+
+ActionHook = Callable[[ActionEvent], None]
+
+
+class FlowStep(TypedDict, total=False):
+    action: Required[FlowAction]
+    name: str
+    xpath: XPATH
+    timeout: float
+    text: str
+    cleared: bool
+    keystrokes: bool
+    state: XPathState
+    attribute: Optional[str]
+    multiple: bool
+
+
+class StepTiming(TypedDict):
+    name: str
+    action: FlowAction
+    seconds: float
+    call: int
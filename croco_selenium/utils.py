@@ -1,4 +1,6 @@
 from functools import wraps
+from typing import Optional
+from selenium.webdriver.remote.webdriver import WebDriver
 
 
 def ignore_exceptions(func):
@@ -17,3 +19,14 @@ def ignore_exceptions(func):
 
         return result
     return wrapper
+
+
+def get_debugger_address(driver: WebDriver) -> Optional[str]:
+    # Address is kept in vendor options, e.g. goog:chromeOptions
+    return next(
+        (
+            value['debuggerAddress'] for value in driver.capabilities.values()
+            if isinstance(value, dict) and value.get('debuggerAddress')
+        ),
+        None
+    )
@@ -0,0 +1,248 @@
+import time
+from typing import Optional, Callable, Any, Iterator
+from selenium.common import (
+    NoSuchElementException,
+    TimeoutException,
+    JavascriptException,
+    InvalidSelectorException
+)
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from .types import XPATH, XPathState, IgnoredExceptions, SettlePolicy, Readiness
+from ._scripts import OBSERVE_XPATH, SETTLE_DOCUMENT, AWAIT_READINESS
+from .instrumentation import count_poll, waiting
+from .deadline import honors_deadline
+
+__all__ = [
+    'wait_until',
+    'wait_for_xpath',
+    'wait_for_settle',
+    'wait_for_ready',
+    'poll_intervals'
+]
+
+# Messages of script errors caused by navigation, after which a script is run again in the new document
+_UNLOAD_MESSAGES = ('document unloaded', 'execution context was destroyed', 'cannot find context')
+
+MIN_POLL_FREQUENCY = 0.05
+MAX_POLL_FREQUENCY = 0.5
+POLL_BACKOFF = 1.5
+OBSERVE_CHUNK = 10
+
+
+def poll_intervals(
+        min_frequency: float = MIN_POLL_FREQUENCY,
+        max_frequency: float = MAX_POLL_FREQUENCY,
+        backoff: float = POLL_BACKOFF
+) -> Iterator[float]:
+    """
+    Yields growing intervals between polls. Conditions met soon are noticed soon, while long waits poll rarely
+    :param min_frequency: Number of seconds before the second poll
+    :param max_frequency: Maximum number of seconds between polls
+    :param backoff: Multiplier of an interval
+    :return: Iterator[float]
+    """
+    interval = min_frequency
+    while True:
+        yield interval
+        interval = min(interval * backoff, max_frequency)
+
+
+def _is_unloaded(exc: JavascriptException) -> bool:
+    message = (exc.msg or '').lower()
+    return any(unload_message in message for unload_message in _UNLOAD_MESSAGES)
+
+
+def _ignored(ignored_exceptions: Optional[IgnoredExceptions], *defaults: type[Exception]) -> tuple:
+    exceptions = list(defaults)
+
+    if ignored_exceptions:
+        try:
+            exceptions.extend(ignored_exceptions)
+        except TypeError:
+            exceptions.append(ignored_exceptions)
+
+    return tuple(exceptions)
+
+
+@honors_deadline
+def wait_until(
+        driver: WebDriver,
+        timeout: float,
+        method: Callable[[WebDriver], Any],
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> Any:
+    """
+    Waits until the method returns a truthy value, polling with growing intervals
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param method: A callable taking the driver, e.g. expected condition
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: Any
+    """
+    exceptions = _ignored(ignored_exceptions, NoSuchElementException)
+    screen = None
+    stacktrace = None
+
+    end_time = time.monotonic() + timeout
+    with waiting():
+        for interval in poll_intervals():
+            count_poll()
+            try:
+                value = method(driver)
+                if value:
+                    return value
+            except exceptions as exc:
+                screen = getattr(exc, 'screen', None)
+                stacktrace = getattr(exc, 'stacktrace', None)
+
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+
+    raise TimeoutException(f'Condition is not met after {timeout} seconds', screen, stacktrace)
+
+
+@honors_deadline
+def wait_for_xpath(
+        driver: WebDriver,
+        timeout: float,
+        xpath: XPATH,
+        state: XPathState,
+        ignored_exceptions: Optional[IgnoredExceptions] = None
+) -> Any:
+    """
+    Waits until an element found by XPATH gets the state. The state is checked in browser on every mutation of the
+    document, so the wait is over as soon as the state is got
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param xpath: XPATH of an element
+    :param state: A state to be waited. There are six states:
+                  present, visible, clickable - returns the first found element
+                  invisible - returns True, if element is not found or invisible
+                  all_present, all_visible - returns all found elements
+    :param ignored_exceptions: Tuple of ignored exceptions or one ignoring exception
+
+    :return: Any
+    """
+    # Script times out, if script timeout of the session is exceeded, so it's run again
+    exceptions = _ignored(ignored_exceptions, NoSuchElementException, TimeoutException)
+    intervals = poll_intervals()
+
+    end_time = time.monotonic() + timeout
+    with waiting():
+        while True:
+            remaining = end_time - time.monotonic()
+            count_poll()
+
+            try:
+                chunk = max(min(remaining, OBSERVE_CHUNK), 0)
+                value = driver.execute_async_script(OBSERVE_XPATH, xpath, state, int(chunk * 1000))
+                if isinstance(value, dict) and 'invalidSelector' in value:
+                    raise InvalidSelectorException(f'Invalid XPATH {xpath}: {value["invalidSelector"]}')
+                if value:
+                    return value
+            except (JavascriptException, *exceptions) as exc:
+                # Script also fails if the document is unloaded during the wait, other errors of script are raised
+                if isinstance(exc, JavascriptException) and not _is_unloaded(exc):
+                    raise
+                remaining = end_time - time.monotonic()
+                if remaining > 0:
+                    time.sleep(min(next(intervals), remaining))
+
+            if time.monotonic() >= end_time:
+                break
+
+    raise TimeoutException(f'Element {xpath} is not {state.replace("_", " ")} after {timeout} seconds')
+
+
+@honors_deadline
+def wait_for_settle(
+        driver: WebDriver,
+        timeout: float,
+        policy: SettlePolicy
+) -> None:
+    """
+    Waits until the current document is settled according to the policy
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param policy: A policy of settling. It has two keys:
+                   quiet - number of seconds the document has to stay without mutations
+                   ready_state - whether document.readyState has to be complete
+    :return: None
+    """
+    quiet = int(policy.get('quiet', 0) * 1000)
+    ready_state = policy.get('ready_state', False)
+    intervals = poll_intervals()
+
+    end_time = time.monotonic() + timeout
+    with waiting():
+        while True:
+            remaining = end_time - time.monotonic()
+            count_poll()
+
+            try:
+                chunk = max(min(remaining, OBSERVE_CHUNK), 0)
+                if driver.execute_async_script(SETTLE_DOCUMENT, quiet, ready_state, int(chunk * 1000)):
+                    return
+            except (JavascriptException, TimeoutException) as exc:
+                if isinstance(exc, JavascriptException) and not _is_unloaded(exc):
+                    raise
+                remaining = end_time - time.monotonic()
+                if remaining > 0:
+                    time.sleep(min(next(intervals), remaining))
+
+            if time.monotonic() >= end_time:
+                break
+
+    raise TimeoutException(f'Document is not settled after {timeout} seconds')
+
+
+@honors_deadline
+def wait_for_ready(
+        driver: WebDriver,
+        timeout: float,
+        readiness: Readiness
+) -> None:
+    """
+    Waits until the current page is ready according to the conditions. Conditions of the document are checked in
+    browser, so the wait is over as soon as they're met
+    :param driver: A driver to be interacted
+    :param timeout: Number of seconds before timing out
+    :param readiness: Conditions of readiness. It has three keys:
+                      xpath - XPATH of an element, which has to be present
+                      dom_content_loaded - whether DOMContentLoaded has to be fired
+                      resource_quiet - number of seconds no resource of the page has to finish loading for. Requests
+                                       still in flight aren't seen, so it's not a network idle
+    :return: None
+    """
+    dom_content_loaded = readiness.get('dom_content_loaded', False)
+    resource_quiet = readiness.get('resource_quiet')
+    intervals = poll_intervals()
+
+    end_time = time.monotonic() + timeout
+    if dom_content_loaded or resource_quiet is not None:
+        quiet = None if resource_quiet is None else int(resource_quiet * 1000)
+
+        with waiting():
+            while True:
+                remaining = end_time - time.monotonic()
+                count_poll()
+
+                try:
+                    chunk = max(min(remaining, OBSERVE_CHUNK), 0)
+                    if driver.execute_async_script(AWAIT_READINESS, dom_content_loaded, quiet, int(chunk * 1000)):
+                        break
+                except (JavascriptException, TimeoutException) as exc:
+                    if isinstance(exc, JavascriptException) and not _is_unloaded(exc):
+                        raise
+                    remaining = end_time - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(min(next(intervals), remaining))
+
+                if time.monotonic() >= end_time:
+                    raise TimeoutException(f'Page is not ready after {timeout} seconds')
+
+    if xpath := readiness.get('xpath'):
+        wait_for_xpath(driver, max(end_time - time.monotonic(), 0), xpath, 'present')
@@ -0,0 +1,147 @@
+import time
+import asyncio
+import threading
+from typing import Optional, Callable, Any
+from selenium.common import TimeoutException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver as WebDriver
+from .exceptions import WindowTrackingUnavailable
+from ._devtools import DevToolsClient, get_websocket_url
+from .deadline import bounded
+from ._window_trackers import register_window_tracker, get_window_tracker
+
+__all__ = [
+    'WindowTracker',
+    'track_windows',
+    'get_window_tracker'
+]
+
+# Window handles of chromedriver are ids of targets of these types
+_WINDOW_TYPES = ('page', 'app')
+
+
+class WindowTracker(DevToolsClient):
+    """
+    The class keeping window handles of browser up to date. It listens to events of targets over DevTools protocol,
+    so opened and closed windows are known without requests to chromedriver
+    """
+    _unavailable_error = WindowTrackingUnavailable
+
+    def __init__(self, websocket_url: str, timeout: float = 10):
+        """
+        :param websocket_url: An URL of DevTools protocol of browser
+        :param timeout: Number of seconds before timing out of connecting
+        """
+        self.__handles: dict[str, None] = {}
+        self.__condition = threading.Condition()
+        # Events of coroutines awaiting windows with loops they belong to
+        self.__waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        super().__init__(websocket_url, timeout)
+
+    @property
+    def handles(self) -> list[str]:
+        """Handles of opened windows in order of opening"""
+        with self.__condition:
+            return list(self.__handles)
+
+    def wait(self, predicate: Callable[[list[str]], Any], timeout: float) -> Any:
+        """
+        Waits until the predicate returns a truthy value for handles of opened windows. The predicate is checked on
+        every opened or closed window
+        :param predicate: A callable taking handles
+        :param timeout: Number of seconds before timing out
+        :return: Any
+        """
+        with bounded(timeout) as timeout:
+            with self.__condition:
+                value = self.__condition.wait_for(lambda: predicate(list(self.__handles)) or self.closed, timeout)
+
+            return self.__result(predicate, value, timeout)
+
+    async def wait_async(self, predicate: Callable[[list[str]], Any], timeout: float) -> Any:
+        """
+        Awaitable counterpart of wait. The event loop is free while windows aren't in expected state
+        :param predicate: A callable taking handles
+        :param timeout: Number of seconds before timing out
+        :return: Any
+        """
+        with bounded(timeout) as timeout:
+            waiter = (asyncio.get_running_loop(), asyncio.Event())
+            with self.__condition:
+                self.__waiters.append(waiter)
+
+            end_time = time.monotonic() + timeout
+            try:
+                while True:
+                    # Event is cleared before the check, so windows opened right after it still wake the coroutine
+                    waiter[1].clear()
+                    with self.__condition:
+                        value = predicate(list(self.__handles))
+
+                    remaining = end_time - time.monotonic()
+                    if value or self.closed or remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(waiter[1].wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                with self.__condition:
+                    self.__waiters.remove(waiter)
+
+            return self.__result(predicate, value, timeout)
+
+    def __result(self, predicate: Callable[[list[str]], Any], value: Any, timeout: float) -> Any:
+        if self.closed and not predicate(self.handles):
+            raise WindowTrackingUnavailable(self._error or 'Tracker is closed')
+        if not value:
+            raise TimeoutException(f'Windows are not in expected state after {timeout} seconds')
+        return value
+
+    def close_window(self, handle: str) -> None:
+        """
+        Closes a window by DevTools protocol, not changing the current window of chromedriver
+        :param handle: A handle of the window
+        :return: None
+        """
+        self.call('Target.closeTarget', {'targetId': handle})
+
+    async def _start(self) -> None:
+        # Events of existing targets are sent before the response
+        await self._call('Target.setDiscoverTargets', {'discover': True})
+
+    def _on_event(self, method: str, params: dict[str, Any], session_id: Optional[str]) -> None:
+        with self.__condition:
+            if method == 'Target.targetCreated' and params['targetInfo']['type'] in _WINDOW_TYPES:
+                self.__handles[params['targetInfo']['targetId']] = None
+            elif method == 'Target.targetDestroyed':
+                self.__handles.pop(params['targetId'], None)
+            else:
+                return
+            self.__notify()
+
+    def _on_close(self) -> None:
+        with self.__condition:
+            self.__notify()
+
+    def __notify(self) -> None:
+        self.__condition.notify_all()
+        for loop, event in self.__waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop of the waiter is closed, so nobody awaits the event
+                pass
+
+
+def track_windows(driver: WebDriver, timeout: float = 10) -> WindowTracker:
+    """
+    Connects a window tracker to browser of the driver. Actions and decorators waiting for windows use it instead of
+    polling chromedriver
+    :param driver: A driver to be tracked
+    :param timeout: Number of seconds before timing out of connecting
+    :return: WindowTracker
+    """
+    websocket_url = get_websocket_url(driver, timeout, WindowTrackingUnavailable)
+    tracker = WindowTracker(websocket_url, timeout)
+    register_window_tracker(driver, tracker)
+    return tracker
@@ -0,0 +1,101 @@
+import json
+import threading
+from typing import Optional, Callable, Any
+import trio
+import trio_websocket
+
+
+class FakeBrowser:
+    """DevTools endpoint of a browser, which reports and attaches targets and closes them on request"""
+    def __init__(self, targets: list[tuple[str, str]]):
+        self.targets = dict(targets)
+        self.commands: list[dict[str, Any]] = []
+        self.url = None
+        self.__condition = threading.Condition()
+        self.__started = threading.Event()
+        self.__token = None
+        self.__cancel_scope = None
+        self.__connections: list[trio_websocket.WebSocketConnection] = []
+        self.__auto_attach = False
+        self.__thread = threading.Thread(target=trio.run, args=(self.__serve,), daemon=True)
+
+    def open(self, target_id: str, target_type: str = 'page') -> None:
+        trio.from_thread.run(self.__open, target_id, target_type, trio_token=self.__token)
+
+    def send_event(self, method: str, params: dict, session_id: Optional[str] = None) -> None:
+        trio.from_thread.run(self.__broadcast, method, params, session_id, trio_token=self.__token)
+
+    def wait_for_command(self, predicate: Callable[[dict[str, Any]], bool], timeout: float = 5) -> dict[str, Any]:
+        with self.__condition:
+            assert self.__condition.wait_for(lambda: any(map(predicate, self.commands)), timeout)
+            return next(filter(predicate, self.commands))
+
+    def __enter__(self) -> 'FakeBrowser':
+        self.__thread.start()
+        self.__started.wait(5)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        trio.from_thread.run_sync(self.__cancel_scope.cancel, trio_token=self.__token)
+        self.__thread.join(5)
+
+    async def __serve(self) -> None:
+        self.__token = trio.lowlevel.current_trio_token()
+
+        with trio.CancelScope() as self.__cancel_scope:
+            async with trio.open_nursery() as nursery:
+                server = await nursery.start(trio_websocket.serve_websocket, self.__handle, '127.0.0.1', 0, None)
+                self.url = f'ws://127.0.0.1:{server.port}/devtools/browser'
+                self.__started.set()
+
+    async def __handle(self, request: trio_websocket.WebSocketRequest) -> None:
+        connection = await request.accept()
+        self.__connections.append(connection)
+
+        try:
+            while True:
+                message = json.loads(await connection.get_message())
+                with self.__condition:
+                    self.commands.append(message)
+                    self.__condition.notify_all()
+
+                if message['method'] == 'Target.setDiscoverTargets':
+                    for target_id, target_type in self.targets.items():
+                        await self.__created(target_id, target_type)
+                elif message['method'] == 'Target.setAutoAttach' and 'sessionId' not in message:
+                    self.__auto_attach = True
+                    for target_id, target_type in self.targets.items():
+                        await self.__attached(target_id, target_type, waiting=False)
+                elif message['method'] == 'Target.closeTarget':
+                    target_id = message['params']['targetId']
+                    del self.targets[target_id]
+                    await self.__broadcast('Target.targetDestroyed', {'targetId': target_id})
+                await connection.send_message(json.dumps({'id': message['id'], 'result': {}}))
+        except trio_websocket.ConnectionClosed:
+            pass
+
+    async def __open(self, target_id: str, target_type: str) -> None:
+        self.targets[target_id] = target_type
+        await self.__created(target_id, target_type)
+        if self.__auto_attach:
+            await self.__attached(target_id, target_type, waiting=True)
+
+    async def __created(self, target_id: str, target_type: str) -> None:
+        info = {'targetId': target_id, 'type': target_type}
+        await self.__broadcast('Target.targetCreated', {'targetInfo': info})
+
+    async def __attached(self, target_id: str, target_type: str, waiting: bool) -> None:
+        params = {
+            'sessionId': f'session-{target_id}',
+            'targetInfo': {'targetId': target_id, 'type': target_type},
+            'waitingForDebugger': waiting
+        }
+        await self.__broadcast('Target.attachedToTarget', params)
+
+    async def __broadcast(self, method: str, params: dict, session_id: Optional[str] = None) -> None:
+        message = {'method': method, 'params': params}
+        if session_id:
+            message['sessionId'] = session_id
+
+        for connection in self.__connections:
+            await connection.send_message(json.dumps(message))
@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+from selenium.common import TimeoutException
+from croco_selenium.aio import (
+    AsyncActionPerformer,
+    click,
+    get_element,
+    get_element_text,
+    get_elements_text,
+    get_elements_attributes,
+    wait_for_invisibility,
+    wait_for_windows,
+    handle_pop_up,
+    handle_in_new_tab,
+    handle_new_tab
+)
+from croco_selenium.aio.utils import run
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+BUTTON = '//button[@id="submit"]'
+LATE = '//div[@id="late"]'
+SPINNER = '//div[@id="spinner"]'
+MISSING = '//div[@id="missing"]'
+ITEMS = '//li'
+FRAME = '//iframe[@id="outer"]'
+
+ELEMENTS = [
+    FakeElement(BUTTON, text='Submit', opens_window_after=0.05),
+    FakeElement(LATE, text='Late', appear_after=0.1),
+    FakeElement(SPINNER, disappear_after=0.1),
+    FakeElement(FRAME),
+    *[FakeElement(ITEMS, text=f'Item {i}', attributes={'href': f'/items/{i}'}) for i in range(3)]
+]
+
+
+def test_ignore_exceptions(driver):
+    driver.get('https://google.com')
+    action_performer = AsyncActionPerformer(driver)
+    asyncio.run(action_performer.click(5, '//*[@id="unknownsuchid"]', TimeoutException))
+
+
+def test_actions():
+    async def perform(driver: FakeDriver) -> None:
+        await click(driver, 5, BUTTON)
+        assert await get_element_text(driver, 5, BUTTON) == 'Submit'
+        assert await get_elements_text(driver, 5, ITEMS) == ['Item 0', 'Item 1', 'Item 2']
+        assert await get_elements_attributes(driver, 5, ITEMS, ['href']) == [{'href': f'/items/{i}'} for i in range(3)]
+
+        await wait_for_invisibility(driver, 5, SPINNER)
+        await wait_for_windows(driver, 5, 2)
+
+        assert await click(driver, 0.1, MISSING, ignored_exceptions=TimeoutException) is None
+        with pytest.raises(TimeoutException):
+            await get_element(driver, 0.1, MISSING)
+
+    with FakeWebDriverServer(ELEMENTS) as server:
+        driver = FakeDriver(server)
+        asyncio.run(perform(driver))
+        driver.quit()
+
+
+def test_waits_leave_event_loop_free():
+    async def wait(driver: FakeDriver) -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        texts = await asyncio.gather(*[get_element_text(driver, 5, LATE) for _ in range(4)])
+        ticker.cancel()
+
+        assert texts == ['Late'] * 4
+        return ticks
+
+    with FakeWebDriverServer(ELEMENTS) as server:
+        driver = FakeDriver(server)
+        assert asyncio.run(wait(driver)) >= 3
+        driver.quit()
+
+
+def test_decorators():
+    @handle_in_new_tab(method_type='function')
+    async def in_new_tab(driver: FakeDriver) -> str:
+        return await run(getattr, driver, 'current_window_handle')
+
+    @handle_new_tab(method_type='function')
+    async def open_new_tab(driver: FakeDriver) -> None:
+        await run(driver.switch_to.new_window, 'tab')
+
+    @handle_pop_up(method_type='function', timeout=5)
+    async def in_pop_up(driver: FakeDriver, handles: list[str]) -> str:
+        handle = await run(getattr, driver, 'current_window_handle')
+        await run(driver.close)
+        return handle
+
+    async def perform(driver: FakeDriver) -> None:
+        original = await run(getattr, driver, 'current_window_handle')
+
+        assert await in_new_tab(driver) != original
+        await open_new_tab(driver)
+        assert await run(getattr, driver, 'window_handles') == [original]
+
+        await click(driver, 5, BUTTON)
+        assert await in_pop_up(driver, handles=[original]) != original
+        assert await run(getattr, driver, 'current_window_handle') == original
+
+    with FakeWebDriverServer(ELEMENTS) as server:
+        driver = FakeDriver(server)
+        asyncio.run(perform(driver))
+        driver.quit()
+
+
+def test_action_performer():
+    async def perform(performer: AsyncActionPerformer) -> None:
+        async with performer.frame(5, FRAME):
+            assert await performer.get_element_text(5, BUTTON) == 'Submit'
+        assert await performer.get_elements_text(5, ITEMS, ignored_exceptions=TimeoutException) == [
+            'Item 0', 'Item 1', 'Item 2'
+        ]
+        assert await performer.get_element(0.1, MISSING, ignored_exceptions=TimeoutException) is None
+
+    with FakeWebDriverServer(ELEMENTS) as server:
+        driver = FakeDriver(server)
+        asyncio.run(perform(AsyncActionPerformer(driver)))
+
+        # The frame is entered and left for the document in one command each
+        assert server.commands.count(('POST', '/session/{sid}/frame')) == 2
+        driver.quit()
@@ -0,0 +1,9 @@
+from benchmarks.runner import run_benchmarks, compare
+
+
+def test_benchmarks_report_commands():
+    report = run_benchmarks(latency=0, iterations=2, pattern='.click')
+    assert report['results']['actions.click']['commands'] == 2
+
+    baseline = {'results': {'actions.click': dict(report['results']['actions.click'], commands=1)}}
+    assert compare(baseline, report) == ['actions.click: 1 -> 2 commands']
@@ -0,0 +1,26 @@
+from croco_selenium import ConnectionPool
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+
+def test_shared_connection_pool():
+    with FakeWebDriverServer([FakeElement('//a', text='text')]) as server, ConnectionPool(timeout=30) as pool:
+        drivers = [FakeDriver(server) for _ in range(2)]
+        for driver in drivers:
+            pool.attach(driver.command_executor)
+
+        drivers[0].quit()
+        assert drivers[1].get_element_text(5, '//a') == 'text'
+        drivers[1].quit()
+
+
+def test_connect_timeout_is_passed_to_requests():
+    with FakeWebDriverServer() as server, ConnectionPool(timeout=30, connect_timeout=2) as pool:
+        driver = FakeDriver(server)
+        pool.attach(driver.command_executor)
+
+        if client_config := vars(driver.command_executor).get('_client_config'):
+            assert client_config.timeout.connect_timeout == 2
+            assert client_config.timeout.read_timeout == 30
+
+        assert driver.title == 'Example'
+        driver.quit()
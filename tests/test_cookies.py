@@ -0,0 +1,39 @@
+from croco_selenium.actions import _to_cdp_cookie
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver
+
+COOKIES = [
+    {'name': 'session', 'value': '1', 'domain': '.example.com', 'secure': True, 'sameSite': 'no_restriction',
+     'expirationDate': 1900000000.5},
+    {'name': 'theme', 'value': 'dark', 'domain': 'example.org', 'path': '/app', 'sameSite': None, 'httpOnly': False},
+    {'name': 'orphan', 'value': '0'}
+]
+
+
+def test_cookies_are_converted_to_devtools_format():
+    assert _to_cdp_cookie(COOKIES[0]) == {
+        'name': 'session', 'value': '1', 'domain': '.example.com', 'path': '/', 'secure': True,
+        'expires': 1900000000.5, 'sameSite': 'None'
+    }
+    # Cookies without sameSite keep the default of the browser
+    assert _to_cdp_cookie(COOKIES[1]) == {'name': 'theme', 'value': 'dark', 'domain': 'example.org', 'path': '/app'}
+    assert _to_cdp_cookie({**COOKIES[1], 'sameSite': 'Lax', 'expiry': -1})['sameSite'] == 'Lax'
+    assert 'expires' not in _to_cdp_cookie({**COOKIES[1], 'expiry': -1})
+
+
+def test_cookies_are_exported_and_imported(tmp_path):
+    path = tmp_path / 'cookies.json'
+
+    with FakeWebDriverServer() as server:
+        driver = FakeDriver(server)
+        sent = len(server.commands)
+        driver.add_cookies(COOKIES, bulk=True)
+
+        # Cookies of every domain are set in one command, and ones without domain are skipped
+        assert server.commands[sent:] == [('POST', '/session/{sid}/goog/cdp/execute')]
+        driver.export_cookies(str(path))
+
+        server.reset()
+        driver.import_cookies(str(path))
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+        assert [cookie['name'] for cookie in cookies] == ['session', 'theme']
+        driver.quit()
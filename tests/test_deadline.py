@@ -0,0 +1,48 @@
+import time
+import pytest
+from selenium.common import TimeoutException
+from croco_selenium import Deadline
+from croco_selenium.exceptions import DeadlineExceeded
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+MISSING = '//div[@id="missing"]'
+BUTTON = '//button[@id="submit"]'
+
+
+def test_deadline_cuts_waits_short():
+    with FakeWebDriverServer([FakeElement(BUTTON)]) as server:
+        driver = FakeDriver(server)
+
+        with driver.deadline(0.3):
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                driver.get_element(10, MISSING, ignored_exceptions=TimeoutException)
+            assert time.monotonic() - start < 2
+
+            # The budget is spent, so the next action fails without commands
+            sent = len(server.commands)
+            with pytest.raises(DeadlineExceeded):
+                driver.click(10, BUTTON)
+            assert len(server.commands) == sent
+
+        driver.click(10, BUTTON)
+        driver.quit()
+
+
+def test_nested_deadline_does_not_outlast_outer():
+    with Deadline(1) as outer:
+        with Deadline(60) as inner:
+            assert inner.remaining <= outer.remaining <= 1
+
+    with Deadline(60) as outer:
+        with Deadline(1) as inner:
+            assert inner.remaining <= 1 < outer.remaining
+
+
+def test_reentered_deadline_keeps_its_budget():
+    deadline = Deadline(0.2)
+    with deadline:
+        time.sleep(0.1)
+        with deadline:
+            assert deadline.remaining <= 0.1
+        assert deadline.remaining <= 0.1
@@ -0,0 +1,84 @@
+from threading import Lock
+import pytest
+from selenium.common import WebDriverException
+from croco_selenium import DriverPool
+
+
+def test_lease_resets_driver():
+    with DriverPool(1) as pool:
+        with pool.lease() as driver:
+            driver.get('https://google.com')
+            driver.switch_to.new_window('tab')
+
+        with pool.lease() as driver:
+            assert len(driver.window_handles) == 1
+            assert driver.current_url == 'about:blank'
+
+
+def test_lease_clears_storage_of_all_origins():
+    origins = ['https://example.com', 'https://example.org']
+
+    with DriverPool(1) as pool:
+        with pool.lease() as driver:
+            for origin in origins:
+                driver.get(origin)
+                driver.execute_script("window.localStorage.setItem('session', 'value')")
+
+        with pool.lease() as driver:
+            for origin in origins:
+                driver.get(origin)
+                assert driver.execute_script("return window.localStorage.getItem('session')") is None
+
+
+def test_failed_spawn_quits_spawned_drivers():
+    spawned = []
+    lock = Lock()
+
+    class Driver:
+        def __init__(self):
+            self.quit_called = False
+            with lock:
+                if spawned:
+                    raise WebDriverException('Browser failed to start')
+                spawned.append(self)
+
+        def quit(self):
+            self.quit_called = True
+
+    with pytest.raises(WebDriverException):
+        DriverPool(2, Driver)
+
+    assert spawned[0].quit_called
+
+
+def test_failed_respawn_keeps_caller_exception_and_slot():
+    failing = [False]
+
+    class Driver:
+        def __init__(self):
+            if failing[0]:
+                raise WebDriverException('Browser failed to start')
+            self.quit_called = False
+
+        @property
+        def switch_to(self):
+            raise WebDriverException('Browser crashed')
+
+        def quit(self):
+            self.quit_called = True
+
+    pool = DriverPool(1, Driver)
+    with pytest.raises(ValueError) as exc_info:
+        with pool.lease() as dead_driver:
+            failing[0] = True
+            raise ValueError('Task failed')
+
+    assert isinstance(exc_info.value.__cause__, WebDriverException)
+    assert dead_driver.quit_called and pool.size == 0
+
+    # The slot of the dead driver is filled by the next lease
+    failing[0] = False
+    with pool.lease(timeout=1) as driver:
+        assert driver is not dead_driver
+    assert pool.size == 1
+    pool.close()
@@ -0,0 +1,79 @@
+import pytest
+from selenium.common import TimeoutException, NoSuchWindowException
+from croco_selenium import ActionPerformer
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+BUTTON = '//button[@id="submit"]'
+
+CLICK = ('POST', '/session/{sid}/element/{id}/click')
+OBSERVE = ('POST', '/session/{sid}/execute/async')
+ENABLED = ('GET', '/session/{sid}/element/{id}/enabled')
+WINDOW = ('GET', '/session/{sid}/window')
+
+
+def test_cache_hit_skips_the_wait():
+    with FakeWebDriverServer([FakeElement(BUTTON, text='Submit')]) as server:
+        driver = FakeDriver(server, element_cache_size=8)
+        driver.click(5, BUTTON)
+
+        # A kept clickable element is only checked to be still enabled
+        sent = len(server.commands)
+        driver.click(5, BUTTON)
+        assert server.commands[sent:] == [ENABLED, CLICK]
+
+        # A window switched by the driver itself is noticed, so elements of another window aren't reused
+        driver.switch_to.new_window('tab')
+        sent = len(server.commands)
+        driver.click(5, BUTTON)
+        assert server.commands[sent:] == [OBSERVE, CLICK]
+        driver.quit()
+
+
+def test_element_kept_under_weaker_state_is_checked_again():
+    elements = [FakeElement(BUTTON, text='Submit')]
+    with FakeWebDriverServer(elements) as server:
+        driver = FakeDriver(server, element_cache_size=8)
+        assert driver.get_element_text(5, BUTTON) == 'Submit'
+
+        sent = len(server.commands)
+        driver.click(5, BUTTON)
+        assert server.commands[sent:] == [OBSERVE, CLICK]
+        driver.quit()
+
+
+def test_disabled_element_is_awaited_again():
+    elements = [FakeElement(BUTTON, text='Submit')]
+    with FakeWebDriverServer(elements) as server:
+        driver = FakeDriver(server, element_cache_size=8)
+        driver.click(5, BUTTON)
+
+        elements[0].enabled = False
+        with pytest.raises(TimeoutException):
+            driver.click(0.1, BUTTON)
+        driver.quit()
+
+
+def test_failed_window_switch_is_not_observed():
+    with FakeWebDriverServer([FakeElement(BUTTON, text='Submit')]) as server:
+        driver = FakeDriver(server, element_cache_size=8)
+        driver.click(5, BUTTON)
+
+        with pytest.raises(NoSuchWindowException):
+            driver.switch_to.window('window-missing')
+
+        sent = len(server.commands)
+        driver.click(5, BUTTON)
+        assert server.commands[sent:] == [ENABLED, CLICK]
+        driver.quit()
+
+
+def test_performer_of_another_driver_asks_the_window():
+    with FakeWebDriverServer([FakeElement(BUTTON, text='Submit')]) as server:
+        driver = FakeDriver(server)
+        performer = ActionPerformer(driver, element_cache_size=8)
+        performer.click(5, BUTTON)
+
+        sent = len(server.commands)
+        performer.click(5, BUTTON)
+        assert server.commands[sent:] == [WINDOW, ENABLED, CLICK]
+        driver.quit()
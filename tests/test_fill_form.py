@@ -0,0 +1,69 @@
+import asyncio
+from croco_selenium.aio import AsyncActionPerformer
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+EMAIL = '//input[@id="email"]'
+PASSWORD = '//input[@id="password"]'
+AVATAR = '//input[@id="avatar"]'
+LATE = '//input[@id="late"]'
+TOKEN = '//input[@name="token"]'
+
+EXECUTE = ('POST', '/session/{sid}/execute/sync')
+SEND_KEYS = ('POST', '/session/{sid}/element/{id}/value')
+
+
+def test_fill_form_sets_values_in_one_script():
+    elements = [FakeElement(EMAIL), FakeElement(PASSWORD), FakeElement(LATE, appear_after=0.05)]
+    with FakeWebDriverServer(elements) as server:
+        driver = FakeDriver(server)
+        sent = len(server.commands)
+        driver.fill_form(5, {EMAIL: 'hello@world.com', PASSWORD: 'secret', LATE: 'late'})
+
+        commands = server.commands[sent:]
+        assert set(commands) == {EXECUTE} and commands.count(EXECUTE) >= 2
+        assert [element.attributes['value'] for element in elements] == ['hello@world.com', 'secret', 'late']
+        driver.quit()
+
+
+def test_fill_form_falls_back_to_keystrokes():
+    elements = [FakeElement(EMAIL), FakeElement(PASSWORD), FakeElement(AVATAR, attributes={'type': 'file'})]
+    with FakeWebDriverServer(elements) as server:
+        driver = FakeDriver(server)
+        sent = len(server.commands)
+        fields = {EMAIL: 'hello@world.com', PASSWORD: 'secret', AVATAR: '/tmp/avatar.png'}
+        driver.fill_form(5, fields, keystrokes=[PASSWORD])
+
+        assert server.commands[sent:].count(SEND_KEYS) == 2
+        assert elements[0].attributes['value'] == 'hello@world.com'
+        assert 'value' not in elements[1].attributes
+        driver.quit()
+
+
+def test_async_fill_form():
+    elements = [FakeElement(EMAIL), FakeElement(AVATAR, attributes={'type': 'file'})]
+    with FakeWebDriverServer(elements) as server:
+        driver = FakeDriver(server)
+        performer = AsyncActionPerformer(driver)
+        sent = len(server.commands)
+        asyncio.run(performer.fill_form(5, {EMAIL: 'hello@world.com', AVATAR: '/tmp/avatar.png'}))
+
+        # The file input is cleared by the script
+        assert server.commands[sent:] == [EXECUTE, SEND_KEYS]
+        assert elements[0].attributes['value'] == 'hello@world.com'
+        driver.quit()
+
+
+def test_fill_form_does_not_wait_hidden_inputs_to_be_visible():
+    elements = [
+        FakeElement(EMAIL),
+        FakeElement(TOKEN, attributes={'type': 'hidden'}, visible=False),
+        FakeElement(AVATAR, attributes={'type': 'file'}, visible=False)
+    ]
+    with FakeWebDriverServer(elements) as server:
+        driver = FakeDriver(server)
+        sent = len(server.commands)
+        driver.fill_form(1, {EMAIL: 'hello@world.com', TOKEN: 'csrf', AVATAR: '/tmp/avatar.png'})
+
+        assert server.commands[sent:] == [EXECUTE, SEND_KEYS]
+        assert [element.attributes.get('value') for element in elements[:2]] == ['hello@world.com', 'csrf']
+        driver.quit()
@@ -0,0 +1,112 @@
+import json
+import pytest
+from selenium.common import TimeoutException
+from croco_selenium import FlowPlan, FlowExecutor
+from croco_selenium.exceptions import InvalidFlowStep
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+EMAIL = '//input[@id="email"]'
+PASSWORD = '//input[@id="password"]'
+SUBMIT = '//button[@id="submit"]'
+ITEMS = '//li'
+
+OBSERVE = ('POST', '/session/{sid}/execute/async')
+WINDOW = ('GET', '/session/{sid}/window')
+CLICK = ('POST', '/session/{sid}/element/{id}/click')
+ENABLED = ('GET', '/session/{sid}/element/{id}/enabled')
+
+ELEMENTS = [
+    FakeElement(EMAIL),
+    FakeElement(PASSWORD),
+    FakeElement(SUBMIT, text='Submit'),
+    *[FakeElement(ITEMS, text=f'Item {i}', attributes={'href': f'/items/{i}'}) for i in range(3)]
+]
+
+
+def login_plan() -> FlowPlan:
+    return (
+        FlowPlan(name='login')
+        .type(EMAIL, 'hello@world.com')
+        .type(PASSWORD, 'secret', name='password')
+        .wait(SUBMIT, 'clickable')
+        .click(SUBMIT)
+        .extract(SUBMIT, name='label')
+        .extract(ITEMS, 'href', multiple=True, name='links')
+    )
+
+
+def test_neighboring_steps_are_merged():
+    plan = login_plan()
+    calls = FlowExecutor(None).compile(plan)
+
+    assert [[step['action'] for step in steps] for steps in calls] == [
+        ['type', 'type'], ['wait'], ['click'], ['extract', 'extract']
+    ]
+    assert calls[0][0]['name'] == 'type_0' and calls[0][1]['name'] == 'password'
+
+
+def test_flow_reuses_elements_and_reports_steps():
+    with FakeWebDriverServer(ELEMENTS) as server:
+        driver = FakeDriver(server)
+        sent = len(server.commands)
+        report = FlowExecutor(driver, 5).run(login_plan())
+
+        # The click reuses the element found by the wait
+        commands = server.commands[sent:]
+        assert commands.count(CLICK) == 1
+        assert commands.count(OBSERVE) == 1
+
+        assert report.values == {'label': 'Submit', 'links': ['/items/0', '/items/1', '/items/2']}
+        assert report.calls == 4
+        assert [timing['call'] for timing in report.timings] == [0, 0, 1, 2, 3, 3]
+        assert ELEMENTS[1].attributes['value'] == 'secret'
+        driver.quit()
+
+
+def test_plan_is_loaded_from_documents(tmp_path):
+    plan = login_plan()
+
+    path = tmp_path / 'login.json'
+    path.write_text(json.dumps(plan.to_dict()))
+    assert FlowPlan.load(path).steps == plan.steps
+
+    yaml = pytest.importorskip('yaml')
+    path = tmp_path / 'login.yaml'
+    path.write_text(yaml.safe_dump(plan.to_dict()))
+    loaded = FlowPlan.load(path)
+    assert loaded.name == 'login' and loaded.steps == plan.steps
+
+    with pytest.raises(InvalidFlowStep):
+        FlowPlan.from_dict([{'action': 'type', 'xpath': EMAIL}])
+
+
+def test_click_reuses_element_awaited_as_clickable():
+    with FakeWebDriverServer(ELEMENTS) as server:
+        driver = FakeDriver(server)
+        executor = FlowExecutor(driver, 5)
+
+        sent = len(server.commands)
+        executor.run(FlowPlan().wait(SUBMIT, 'clickable').click(SUBMIT).click(SUBMIT))
+        assert server.commands[sent:] == [OBSERVE, WINDOW, ENABLED, CLICK, ENABLED, CLICK]
+
+        # A visible element may still be disabled, so the click waits for it again
+        sent = len(server.commands)
+        executor.run(FlowPlan().wait(SUBMIT).click(SUBMIT))
+        assert server.commands[sent:] == [OBSERVE, WINDOW, OBSERVE, CLICK]
+        driver.quit()
+
+
+def test_frames_entered_by_plan_are_left():
+    frame = '//iframe[@id="frame"]'
+
+    with FakeWebDriverServer([*ELEMENTS, FakeElement(frame)]) as server:
+        driver = FakeDriver(server)
+        executor = FlowExecutor(driver, 5)
+
+        executor.run(FlowPlan().switch_to_frame(frame).click(SUBMIT))
+        assert server.commands[-1] == ('POST', '/session/{sid}/frame/parent')
+
+        with pytest.raises(TimeoutException):
+            executor.run(FlowPlan().switch_to_frame(frame).click('//div[@id="missing"]', timeout=0.1))
+        assert server.commands[-1] == ('POST', '/session/{sid}/frame/parent')
+        driver.quit()
@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from selenium.common import TimeoutException
+from croco_selenium import ActionPerformer
+from croco_selenium.aio import AsyncActionPerformer
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+OUTER = '//iframe[@id="outer"]'
+INNER = '//iframe[@id="inner"]'
+
+
+def test_frame_skips_current_frame():
+    with FakeWebDriverServer([FakeElement(OUTER), FakeElement(INNER)]) as server:
+        driver = FakeDriver(server)
+        driver.switch_to_frame(5, OUTER)
+
+        sent = len(server.commands)
+        with driver.frame(5, OUTER):
+            with driver.frame(5, INNER):
+                pass
+
+        # The outer frame was current before entering, so only the inner frame is switched
+        commands = server.commands[sent:]
+        assert commands.count(('POST', '/session/{sid}/frame')) == 1
+        assert commands.count(('POST', '/session/{sid}/frame/parent')) == 1
+        assert commands[-1] == ('POST', '/session/{sid}/frame/parent')
+        driver.quit()
+
+
+def test_frame_restores_document():
+    with FakeWebDriverServer([FakeElement(OUTER), FakeElement(INNER)]) as server:
+        driver = FakeDriver(server)
+
+        with driver.frame(5, OUTER, INNER):
+            sent = len(server.commands)
+            for _ in range(3):
+                with driver.frame(5):
+                    pass
+            assert len(server.commands) == sent
+
+        assert server.commands[-1] == ('POST', '/session/{sid}/frame')
+        driver.quit()
+
+
+def test_settling_current_window_keeps_frame():
+    with FakeWebDriverServer([FakeElement(OUTER)]) as server:
+        driver = FakeDriver(server)
+        performer = ActionPerformer(driver, settle={'quiet': 0})
+
+        with performer.frame(5, OUTER):
+            # The only window is settled in place, so the frame is still entered
+            performer.wait_for_windows(5, 1)
+            sent = len(server.commands)
+
+        assert server.commands[sent:] == [('POST', '/session/{sid}/frame')]
+        driver.quit()
+
+
+def test_async_settling_current_window_keeps_frame():
+    async def settle(performer: AsyncActionPerformer) -> None:
+        async with performer.frame(5, OUTER):
+            await performer.wait_for_windows(5, 1)
+
+    with FakeWebDriverServer([FakeElement(OUTER)]) as server:
+        driver = FakeDriver(server)
+        asyncio.run(settle(AsyncActionPerformer(driver, settle={'quiet': 0})))
+
+        assert server.commands[-1] == ('POST', '/session/{sid}/frame')
+        assert server.commands.count(('POST', '/session/{sid}/frame')) == 2
+        driver.quit()
+
+
+def test_frame_is_restored_after_failed_entry():
+    with FakeWebDriverServer([FakeElement(OUTER)]) as server:
+        driver = FakeDriver(server)
+
+        with pytest.raises(TimeoutException):
+            with driver.frame(0.1, OUTER, INNER):
+                pass
+
+        # The outer frame entered before the failure is left
+        assert server.commands[-1] == ('POST', '/session/{sid}/frame')
+
+        sent = len(server.commands)
+        with driver.frame(5, OUTER):
+            pass
+        assert server.commands[sent:].count(('POST', '/session/{sid}/frame')) == 2
+        driver.quit()
+
+
+def test_navigation_leaves_frame():
+    with FakeWebDriverServer([FakeElement(OUTER)]) as server:
+        driver = FakeDriver(server)
+        driver.switch_to_frame(5, OUTER)
+        driver.get('https://example.com')
+
+        sent = len(server.commands)
+        with driver.frame(5, OUTER):
+            pass
+
+        # The document was loaded in place of the frame, so the frame is entered again and left on exit
+        assert server.commands[sent:].count(('POST', '/session/{sid}/frame')) == 2
+        driver.quit()
+
+
+def test_frames_switched_by_driver_are_observed():
+    with FakeWebDriverServer([FakeElement(OUTER), FakeElement(INNER)]) as server:
+        driver = FakeDriver(server)
+        driver.switch_to_frame(5, OUTER)
+        driver.switch_to.default_content()
+
+        sent = len(server.commands)
+        with driver.frame(5, OUTER):
+            pass
+        assert server.commands[sent:].count(('POST', '/session/{sid}/frame')) == 2
+
+        # A frame entered by the element is unknown, so the document is switched to before entering the path
+        driver.switch_to.frame(driver.find_element('xpath', INNER))
+        sent = len(server.commands)
+        with driver.frame(5, OUTER):
+            assert server.commands[sent:].count(('POST', '/session/{sid}/frame')) == 2
+        driver.quit()
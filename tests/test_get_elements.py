@@ -0,0 +1,29 @@
+from selenium.common import TimeoutException
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+ITEMS = '//li'
+HIDDEN = '//li[@class="hidden"]'
+
+EXECUTE = ('POST', '/session/{sid}/execute/sync')
+
+
+def test_elements_are_read_in_one_script():
+    elements = [
+        *[FakeElement(ITEMS, text=f'Item {i}', attributes={'href': f'/items/{i}'}) for i in range(3)],
+        FakeElement(HIDDEN, text='Hidden', visible=False)
+    ]
+    with FakeWebDriverServer(elements) as server:
+        driver = FakeDriver(server)
+
+        sent = len(server.commands)
+        assert driver.get_elements_text(5, ITEMS) == ['Item 0', 'Item 1', 'Item 2']
+        assert server.commands[sent:] == [EXECUTE]
+
+        sent = len(server.commands)
+        attributes = driver.get_elements_attributes(5, ITEMS, ['href', 'title'])
+        assert attributes == [{'href': f'/items/{i}', 'title': None} for i in range(3)]
+        assert server.commands[sent:] == [EXECUTE]
+
+        assert driver.get_elements_text(5, HIDDEN, visible=False) == ['Hidden']
+        assert driver.get_elements_text(0.1, HIDDEN, ignored_exceptions=TimeoutException) is None
+        driver.quit()
@@ -0,0 +1,49 @@
+from croco_selenium import MetricsAggregator, ActionEvent
+
+
+def test_metrics_aggregator(driver):
+    events = []
+    aggregator = MetricsAggregator()
+    driver.add_hook(events.append)
+    driver.add_hook(aggregator)
+
+    try:
+        driver.get('https://google.com')
+        driver.get_element(15, '//body')
+    finally:
+        driver.remove_hook(events.append)
+        driver.remove_hook(aggregator)
+
+    assert events[-1]['action'] == 'get_element'
+    assert events[-1]['outcome'] == 'ok'
+    assert events[-1]['commands'] >= 1
+    assert 'croco_selenium_action_duration_seconds_count{action="get_element",outcome="ok"} 1' in aggregator.export()
+
+
+def test_metrics_export():
+    aggregator = MetricsAggregator(buckets=(1.0, 0.1))
+    for duration, polls in [(0.05, 2), (0.5, 3), (2.0, 0)]:
+        aggregator(ActionEvent(
+            action='click', xpath=None, duration=duration, wait_time=0.0, polls=polls, commands=1, outcome='ok'
+        ))
+
+    lines = aggregator.export().splitlines()
+    name = 'croco_selenium_action_duration_seconds'
+    labels = 'action="click",outcome="ok"'
+
+    # Buckets are cumulative and sorted, and the +Inf bucket counts all observations
+    assert [line for line in lines if line.startswith(f'{name}_bucket')] == [
+        f'{name}_bucket{{{labels},le="0.1"}} 1',
+        f'{name}_bucket{{{labels},le="1.0"}} 2',
+        f'{name}_bucket{{{labels},le="+Inf"}} 3'
+    ]
+    assert f'{name}_sum{{{labels}}} 2.55' in lines
+    assert f'{name}_count{{{labels}}} 3' in lines
+    assert f'croco_selenium_action_polls_total{{{labels}}} 5' in lines
+    assert f'croco_selenium_action_commands_total{{{labels}}} 3' in lines
+    assert '# TYPE croco_selenium_action_polls counter' in lines
+    assert lines[-1] == '# EOF'
+
+    aggregator.reset()
+    assert aggregator.export().splitlines()[-1] == '# EOF'
+    assert not any(line.startswith(f'{name}_bucket') for line in aggregator.export().splitlines())
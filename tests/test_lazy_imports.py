@@ -0,0 +1,35 @@
+import sys
+import subprocess
+
+
+def test_import_is_lazy():
+    code = (
+        'import sys, croco_selenium; '
+        'assert "selenium.webdriver.remote.webdriver" not in sys.modules; '
+        'croco_selenium.ChromeDriver; '
+        'assert "selenium.webdriver.remote.webdriver" in sys.modules'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_submodules_are_attributes():
+    code = (
+        'import croco_selenium; '
+        'assert croco_selenium.actions.click is croco_selenium.click; '
+        'croco_selenium.decorators.handle_pop_up; '
+        'croco_selenium.waits.wait_until'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_baseline_names_resolve():
+    # Names the package exposed while it imported its submodules eagerly
+    names = [
+        'add_cookies', 'switch_to_another_window', 'switch_to_parent_frame', 'switch_to_frame', 'send_keys',
+        'silent_send_keys', 'click', 'get_elements', 'get_element', 'get_element_text', 'get_element_attribute',
+        'wait_for_invisibility', 'wait_for_windows', 'close_tabs', 'handle_pop_up', 'handle_new_tab',
+        'handle_in_new_tab', 'ActionPerformer', 'ChromeDriver', 'Proxy', 'actions', 'action_performer',
+        'decorators', 'chrome_driver', 'exceptions', 'types', 'utils'
+    ]
+    code = f'import croco_selenium; [getattr(croco_selenium, name) for name in {names!r}]'
+    subprocess.run([sys.executable, '-c', code], check=True)
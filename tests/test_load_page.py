@@ -0,0 +1,58 @@
+import asyncio
+from croco_selenium.aio import load_page
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+LATE = '//div[@id="late"]'
+
+
+def test_load_page_waits_for_readiness():
+    with FakeWebDriverServer([FakeElement(LATE, appear_after=0.05)]) as server:
+        driver = FakeDriver(server, page_load_strategy='eager')
+        driver.load_page(5, 'https://example.com/', {'dom_content_loaded': True, 'xpath': LATE})
+
+        assert driver.get_element(0, LATE, visible=False)
+        assert ('POST', '/session/{sid}/execute/async') in server.commands
+        driver.quit()
+
+
+def test_load_page_tells_previous_document_apart():
+    with FakeWebDriverServer([FakeElement(LATE)]) as server:
+        driver = FakeDriver(server, page_load_strategy='none')
+        sent = len(server.commands)
+        driver.load_page(5, 'https://example.com/', {'xpath': LATE})
+
+        commands = server.commands[sent:]
+        assert commands[:2] == [('POST', '/session/{sid}/execute/sync'), ('POST', '/session/{sid}/url')]
+        driver.quit()
+
+
+def test_load_page_without_conditions():
+    with FakeWebDriverServer() as server:
+        driver = FakeDriver(server, page_load_strategy='none')
+        sent = len(server.commands)
+        driver.load_page(5, 'https://example.com/')
+
+        assert server.commands[sent:] == [('POST', '/session/{sid}/url')]
+        driver.quit()
+
+
+def test_async_load_page_leaves_event_loop_free():
+    async def load(driver: FakeDriver) -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await load_page(driver, 5, 'https://example.com/', {'dom_content_loaded': True, 'xpath': LATE})
+        ticker.cancel()
+        return ticks
+
+    with FakeWebDriverServer([FakeElement(LATE, appear_after=0.1)]) as server:
+        driver = FakeDriver(server, page_load_strategy='none')
+        assert asyncio.run(load(driver)) >= 3
+        assert ('POST', '/session/{sid}/execute/async') in server.commands
+        driver.quit()
@@ -0,0 +1,102 @@
+import time
+import asyncio
+import pytest
+from selenium.common import StaleElementReferenceException, TimeoutException
+from croco_selenium import ActionPolicy, RetryPolicy, CircuitBreaker, Deadline, click
+from croco_selenium.exceptions import CircuitOpen, DeadlineExceeded
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+MISSING = '//div[@id="missing"]'
+BUTTON = '//button[@id="submit"]'
+
+
+def flaky(failures: int):
+    calls = []
+
+    def action(driver, timeout, xpath):
+        calls.append(xpath)
+        if len(calls) <= failures:
+            raise StaleElementReferenceException()
+        return xpath
+
+    return action, calls
+
+
+def test_transient_exceptions_are_retried():
+    policy = ActionPolicy(RetryPolicy(attempts=3, delay=0.01))
+
+    action, calls = flaky(2)
+    result = policy.run(action, None, 1, BUTTON)
+    assert result.ok and result.value == BUTTON and result.attempts == 3
+
+    action, calls = flaky(3)
+    result = policy.run(action, None, 1, BUTTON)
+    assert isinstance(result.error, StaleElementReferenceException) and len(calls) == 3
+
+    action, calls = flaky(1)
+    result = asyncio.run(policy.run_async(_async(action), None, 1, BUTTON))
+    assert result.ok and result.attempts == 2
+
+
+def test_retries_do_not_sleep_past_deadline():
+    policy = ActionPolicy(RetryPolicy(attempts=3, delay=5))
+
+    action, calls = flaky(3)
+    start = time.monotonic()
+    with Deadline(0.2):
+        with pytest.raises(DeadlineExceeded):
+            policy.run(action, None, 1, BUTTON)
+    assert time.monotonic() - start < 1 and len(calls) == 2
+
+
+def _async(action):
+    async def wrapper(*args, **kwargs):
+        return action(*args, **kwargs)
+    return wrapper
+
+
+def test_breaker_fails_fast_per_selector():
+    with FakeWebDriverServer([FakeElement(BUTTON)]) as server:
+        driver = FakeDriver(server)
+        breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+        policy = ActionPolicy(breaker=breaker)
+
+        for _ in range(2):
+            result = policy.run(driver.click, 0, MISSING, ignored_exceptions=TimeoutException)
+            assert isinstance(result.error, TimeoutException)
+        assert breaker.state(MISSING) == 'open'
+
+        sent = len(server.commands)
+        result = policy.run(click, driver, 0, MISSING)
+        assert isinstance(result.error, CircuitOpen) and result.attempts == 0
+        assert len(server.commands) == sent
+
+        assert policy.run(driver.click, 1, BUTTON).ok
+        assert breaker.state(BUTTON) == 'closed'
+        driver.quit()
+
+
+def test_half_open_circuit_closes_after_success():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    policy = ActionPolicy(breaker=breaker)
+
+    action, _ = flaky(1)
+    assert not policy.run(action, None, 1, BUTTON).ok
+    assert breaker.state(BUTTON) == 'half_open'
+    assert policy.run(action, None, 1, BUTTON).ok
+    assert breaker.state(BUTTON) == 'closed'
+
+
+def test_positional_ignored_exceptions_are_failures():
+    with FakeWebDriverServer([FakeElement(BUTTON)]) as server:
+        driver = FakeDriver(server)
+        policy = ActionPolicy()
+
+        result = policy.run(driver.click, 0, MISSING, TimeoutException)
+        assert isinstance(result.error, TimeoutException)
+
+        # Arguments following ignored exceptions are still passed to the action
+        result = policy.run(driver.send_keys, 0, MISSING, 'text', TimeoutException, False)
+        assert isinstance(result.error, TimeoutException)
+        assert policy.run(driver.send_keys, 1, BUTTON, 'text', TimeoutException, False).ok
+        driver.quit()
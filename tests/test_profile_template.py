@@ -0,0 +1,43 @@
+import os
+import shutil
+from croco_selenium import ProfileTemplate
+from croco_selenium import profile_template
+
+
+def make_template(path) -> ProfileTemplate:
+    os.makedirs(path / 'Default')
+    (path / 'Local State').write_text('{}')
+    (path / 'Default' / 'Preferences').write_text('{"theme": "dark"}')
+    (path / 'SingletonCookie').write_text('lock')
+    return ProfileTemplate(str(path))
+
+
+def assert_cloned(template: ProfileTemplate, clone: str) -> None:
+    assert os.path.dirname(clone) == os.path.dirname(template.path)
+    with open(os.path.join(clone, 'Default', 'Preferences')) as file:
+        assert file.read() == '{"theme": "dark"}'
+    # Lock files of the browser aren't copied, otherwise the clone is considered as being in use
+    assert not os.path.lexists(os.path.join(clone, 'SingletonCookie'))
+
+
+def test_clone_copies_profile(tmp_path):
+    template = make_template(tmp_path / 'template')
+    assert template.built
+
+    assert_cloned(template, template.clone())
+
+
+def test_clone_falls_back_to_plain_copy_without_cp(tmp_path, monkeypatch):
+    template = make_template(tmp_path / 'template')
+    monkeypatch.setattr(shutil, 'which', lambda name: None)
+    assert_cloned(template, template.clone())
+
+
+def test_clone_falls_back_to_plain_copy_after_failed_reflink(tmp_path, monkeypatch):
+    template = make_template(tmp_path / 'template')
+    monkeypatch.setattr(profile_template, '_reflink_command', lambda source, destination: ['false'])
+    assert_cloned(template, template.clone())
+
+
+def test_template_is_not_built(tmp_path):
+    assert not ProfileTemplate(str(tmp_path)).built
@@ -0,0 +1,39 @@
+import os
+import json
+import zipfile
+import pytest
+from croco_selenium import Proxy
+from croco_selenium.exceptions import UnsafeCacheDirectory
+from croco_selenium._proxy_extension import get_proxy_extension_path
+
+PROXY = Proxy(host='123.89.46.72', port=8000, username='croco', password='webDriver')
+
+
+def test_extension_is_built_once(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    path = get_proxy_extension_path(PROXY)
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read('manifest.json'))
+        background = archive.read('background.js').decode()
+
+    assert manifest['manifest_version'] == 3
+    assert 'webRequestAuthProvider' in manifest['permissions']
+    assert json.dumps({'username': 'croco', 'password': 'webDriver'}) in background
+    assert "['blocking']" in background
+
+    modified = os.path.getmtime(path)
+    assert get_proxy_extension_path(PROXY) == path
+    assert os.path.getmtime(path) == modified
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='Permissions of directories are checked on POSIX only')
+def test_cache_directory_open_to_others_is_refused(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    cache_dir = tmp_path / 'croco_selenium'
+    cache_dir.mkdir(mode=0o777)
+    cache_dir.chmod(0o777)
+
+    with pytest.raises(UnsafeCacheDirectory):
+        get_proxy_extension_path(PROXY)
@@ -0,0 +1,37 @@
+from croco_selenium import ResourceBlocker
+from .fake_devtools import FakeBrowser
+
+
+def test_resource_blocker():
+    profile = {'resource_types': ['Image'], 'url_patterns': ['*://*.doubleclick.net/*']}
+    patterns = [
+        {'resourceType': 'Image', 'requestStage': 'Request'},
+        {'urlPattern': '*://*.doubleclick.net/*', 'requestStage': 'Request'}
+    ]
+
+    with FakeBrowser([('A', 'page'), ('W', 'service_worker')]) as browser:
+        blocker = ResourceBlocker(browser.url, profile, timeout=5)
+
+        try:
+            # Pop-up is intercepted before it's resumed
+            browser.open('B')
+            resume = browser.wait_for_command(
+                lambda command: command['method'] == 'Runtime.runIfWaitingForDebugger'
+                and command['sessionId'] == 'session-B'
+            )
+
+            for session_id in ('session-A', 'session-B'):
+                enable = browser.wait_for_command(
+                    lambda command: command['method'] == 'Fetch.enable' and command['sessionId'] == session_id
+                )
+                assert enable['params']['patterns'] == patterns
+            assert browser.commands.index(enable) < browser.commands.index(resume)
+
+            assert not any(command.get('sessionId') == 'session-W' for command in browser.commands)
+
+            browser.send_event('Fetch.requestPaused', {'requestId': 'request-1'}, 'session-B')
+            failure = browser.wait_for_command(lambda command: command['method'] == 'Fetch.failRequest')
+            assert failure['params'] == {'requestId': 'request-1', 'errorReason': 'BlockedByClient'}
+            assert failure['sessionId'] == 'session-B'
+        finally:
+            blocker.close()
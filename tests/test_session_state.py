@@ -0,0 +1,31 @@
+import json
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver
+
+CDP = ('POST', '/session/{sid}/goog/cdp/execute')
+EXECUTE = ('POST', '/session/{sid}/execute/sync')
+
+COOKIE = {'name': 'session', 'value': '1', 'domain': '.example.com', 'path': '/'}
+
+
+def test_state_is_snapshotted_and_restored():
+    with FakeWebDriverServer() as server:
+        driver = FakeDriver(server)
+        driver.add_cookies([COOKIE], bulk=True)
+
+        other = {'cookies': [], 'origins': {'https://example.org': {'local': {'token': 'a'}, 'session': {}}}}
+        state = json.loads(json.dumps(driver.snapshot_state(other)))
+        assert state['cookies'] == [COOKIE]
+        assert set(state['origins']) == {'https://example.org', 'https://example.com'}
+
+        server.reset()
+        sent = len(server.commands)
+        driver.restore_state(state)
+
+        # Storage is restored by a script run on new documents and on the current one
+        assert server.commands[sent:] == [CDP, CDP, EXECUTE]
+        assert driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies'] == [COOKIE]
+
+        sent = len(server.commands)
+        driver.restore_state({'cookies': [COOKIE], 'origins': {}})
+        assert server.commands[sent:] == [CDP]
+        driver.quit()
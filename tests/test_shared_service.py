@@ -0,0 +1,12 @@
+from croco_selenium import ServicePool
+
+
+def test_acquire_counts_reservations():
+    pool = ServicePool(2, executable_path='chromedriver')
+
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not second
+    assert [service.references for service in pool.services] == [1, 1]
+
+    first.release()
+    assert pool.acquire() is first
@@ -0,0 +1,22 @@
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+EMAIL = '//input[@id="email"]'
+
+ACTIONS = ('POST', '/session/{sid}/actions')
+SEND_KEYS = ('POST', '/session/{sid}/element/{id}/value')
+
+
+def test_batched_keystrokes_are_one_request():
+    with FakeWebDriverServer([FakeElement(EMAIL)]) as server:
+        driver = FakeDriver(server)
+
+        sent = len(server.commands)
+        driver.silent_send_keys(5, EMAIL, 'hello\n', min_delay=0, max_delay=0, batched=True)
+        commands = server.commands[sent:]
+        assert commands.count(ACTIONS) == 1 and SEND_KEYS not in commands
+
+        sent = len(server.commands)
+        driver.silent_send_keys(5, EMAIL, 'hello', min_delay=0, max_delay=0)
+        commands = server.commands[sent:]
+        assert commands.count(SEND_KEYS) == 5 and ACTIONS not in commands
+        driver.quit()
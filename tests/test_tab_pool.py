@@ -0,0 +1,27 @@
+import time
+from types import SimpleNamespace
+from croco_selenium import TabPool
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeElement
+
+LATENCY = 0.02
+
+
+def test_tab_pool_runs_tasks_concurrently():
+    with FakeWebDriverServer([FakeElement('//a', text='text')], latency=LATENCY) as server:
+        # Only the debugger address and chromedriver of the launching driver are used
+        driver = SimpleNamespace(
+            capabilities={'goog:chromeOptions': {'debuggerAddress': '127.0.0.1:9222'}},
+            service=SimpleNamespace(service_url=server.url)
+        )
+
+        with TabPool(driver, size=4) as pool:
+            tasks = [lambda tab: tab.get_element_text(5, '//a') for _ in range(8)]
+
+            start = time.perf_counter()
+            results = dict(pool.run(tasks))
+            duration = time.perf_counter() - start
+
+        assert results == {index: 'text' for index in range(8)}
+        # A task takes a few commands, so serial run would take at least 8 of them
+        assert duration < 8 * 2 * LATENCY
+        assert sum(command == ('POST', '/session') for command in server.commands) == 4
@@ -0,0 +1,33 @@
+import re
+import time
+import pytest
+from selenium.common import InvalidSelectorException, TimeoutException
+from croco_selenium.waits import wait_for_xpath
+from benchmarks.fake_webdriver import FakeWebDriverServer, FakeDriver, FakeElement
+
+BUTTON = '//button[@id="submit"]'
+MISSING = '//div[@id="missing"]'
+
+
+def test_invalid_xpath_fails_at_once():
+    with FakeWebDriverServer() as server:
+        driver = FakeDriver(server)
+
+        start = time.monotonic()
+        with pytest.raises(InvalidSelectorException, match=re.escape('//div[@id="missing"')):
+            wait_for_xpath(driver, 5, '//div[@id="missing"', 'present')
+        assert time.monotonic() - start < 1
+        driver.quit()
+
+
+def test_wait_survives_unloaded_document():
+    with FakeWebDriverServer([FakeElement(BUTTON)]) as server:
+        driver = FakeDriver(server)
+        server.unloads = 2
+
+        assert wait_for_xpath(driver, 5, BUTTON, 'clickable')
+        assert server.unloads == 0
+
+        with pytest.raises(TimeoutException, match=re.escape(f'{MISSING} is not visible after 0.1 seconds')):
+            wait_for_xpath(driver, 0.1, MISSING, 'visible')
+        driver.quit()
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import pytest
+from selenium.common import TimeoutException
+from croco_selenium import WindowTracker
+from croco_selenium.exceptions import WindowTrackingUnavailable
+from .fake_devtools import FakeBrowser
+
+
+def test_window_tracker():
+    with FakeBrowser([('A', 'page'), ('W', 'service_worker')]) as browser:
+        tracker = WindowTracker(browser.url, timeout=5)
+
+        try:
+            assert tracker.handles == ['A']
+
+            browser.open('B')
+            assert tracker.wait(lambda handles: len(handles) == 2, 5)
+            assert tracker.handles == ['A', 'B']
+
+            tracker.close_window('A')
+            tracker.wait(lambda handles: handles == ['B'], 5)
+
+            with pytest.raises(TimeoutException):
+                tracker.wait(lambda handles: len(handles) == 3, 0.1)
+        finally:
+            tracker.close()
+
+        assert tracker.closed
+
+
+def test_window_tracker_wait_async():
+    async def wait(tracker: WindowTracker) -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        handle = await tracker.wait_async(lambda handles: next((h for h in handles if h != 'A'), None), 5)
+        ticker.cancel()
+        assert handle == 'B'
+
+        with pytest.raises(TimeoutException):
+            await tracker.wait_async(lambda handles: len(handles) == 3, 0.1)
+        return ticks
+
+    with FakeBrowser([('A', 'page')]) as browser:
+        tracker = WindowTracker(browser.url, timeout=5)
+
+        try:
+            threading.Timer(0.1, browser.open, ('B',)).start()
+            assert asyncio.run(wait(tracker)) >= 3
+        finally:
+            tracker.close()
+
+
+def test_window_tracker_unavailable():
+    with pytest.raises(WindowTrackingUnavailable):
+        WindowTracker('ws://127.0.0.1:9/devtools/browser', timeout=5)